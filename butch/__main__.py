@@ -4,10 +4,9 @@ import sys
 
 from argparse import ArgumentParser, Namespace
 from os.path import exists
-from butch.caller import new_call
+from typing import List
 from butch.context import Context, get_context
-from butch.handler import handle_input, handle_file, handle
-from butch.tokenizer import tokenize
+from butch.handler import handle_input, handle_file, handle, handle_stream
 
 
 def loop(ctx: Context):
@@ -104,6 +103,21 @@ def get_cli_parser() -> Namespace:  # noqa: WPS213
     return cli
 
 
+def finish(ctx: Context):
+    """
+    Wait for the started jobs, then exit with the error level.
+
+    Args:
+        ctx: Context instance
+    """
+    # pylint: disable=import-outside-toplevel
+    from butch.external import exit_status
+
+    # the started jobs would be killed with the interpreter
+    ctx.jobs.wait()
+    sys.exit(exit_status(ctx.error_level))
+
+
 def mainloop(ctx: Context):
     """
     Run the main loop for Butch handling text, ^C and ^D inputs.
@@ -119,13 +133,19 @@ def mainloop(ctx: Context):
                 print("")
                 continue
         except EOFError:
+            ctx.jobs.wait()
             sys.exit(0)
 
 
-def main():
-    """Entrypoint function for Butch program."""
+def main(argv: List[str] = None):
+    """
+    Entrypoint function for Butch program.
+
+    Args:
+        argv (list): arguments, sys.argv if None
+    """
     cli = get_cli_parser()
-    args = cli.parse_args()
+    args = cli.parse_args(sys.argv[1:] if argv is None else argv)
     ctx = get_context()
 
     ext_off = getattr(args, "E:OFF", None)
@@ -137,7 +157,7 @@ def main():
 
     if args.C:
         handle(text=" ".join(args.C), ctx=ctx)
-        sys.exit(ctx.error_level)
+        finish(ctx=ctx)
         return
 
     if args.K:
@@ -145,6 +165,12 @@ def main():
         mainloop(ctx=ctx)
         return
 
+    if not sys.stdin.isatty():
+        # piped script, e.g. "type big.bat | butch", runs while read
+        handle_stream(chunks=iter(sys.stdin.readline, ""), ctx=ctx)
+        finish(ctx=ctx)
+        return
+
     mainloop(ctx=ctx)
 
 
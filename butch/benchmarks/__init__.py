@@ -0,0 +1,80 @@
+"""Benchmarks for Butch, run as ``python -m butch.benchmarks.<name>``."""
+
+FILLER = ("echo line {idx} with a few plain arguments", )
+TEMPLATES = (
+    ("@echo off", ),
+    FILLER,
+    ('set "name{idx}=value {idx}"', ),
+    ("echo %name{idx}% > out{idx}.txt", ),
+    FILLER,
+    ("echo {idx} >> out{idx}.txt", ),
+    FILLER,
+    ("type out{idx}.txt | more", ),
+    FILLER,
+    ("echo first {idx} & echo second {idx}", ),
+    (":label{idx}", ),
+    ("goto label{idx}", ),
+    ("rem comment {idx}", ),
+    (":: comment {idx} | with & specials", ),
+    ('echo "quoted {idx}" unquoted', ),
+    ("(", "echo in block {idx}", "set n={idx}", ")"),
+)
+
+# blocks in blocks, but not deeper than usual scripts go
+NESTING = 6
+
+# corpora for the tokenizer, each stressing a different part of it
+CORPORA = {
+    "mixed": TEMPLATES,
+    "echo": (FILLER, ("echo {idx}", ), ("echo.", ), ("@echo {idx} done", )),
+    "blocks": (
+        ("(", ) * NESTING + ("echo nested {idx}", ) + (")", ) * NESTING,
+        ("(", "echo in block {idx}", ")"),
+        FILLER
+    ),
+    # a line after a connector continues it, FILLER ends the chain
+    "pipes": (
+        ("type in{idx}.txt | sort | more > out{idx}.txt", ), FILLER,
+        ("echo {idx} >> out{idx}.txt", ), FILLER,
+        ("more < in{idx}.txt", ), FILLER,
+        ("echo a{idx} | more & echo b{idx}", ), FILLER,
+        ("dir /b || echo failed {idx} && echo done", ), FILLER
+    ),
+    "quoted": (
+        ('echo "quoted {idx}" "and two" unquoted "three"', ),
+        ('set "name{idx}=value {idx}"', ),
+        ('echo pre"mid {idx}"post "x"', ),
+        ('cd "C:\\Program Files\\app {idx}"', )
+    ),
+    "labels": (
+        (
+            ":label{idx}", ":: comment {idx}", "call :label{idx} arg{idx}",
+            "if errorlevel 1 goto label{idx}", "goto :eof"
+        ),
+        ("goto label{idx}", ),
+        FILLER
+    )
+}
+
+
+def generate_script(lines: int, templates: tuple = TEMPLATES) -> str:
+    """
+    Generate a Batch script with a common mix of commands.
+
+    Args:
+        lines (int): number of lines in the script
+        templates (tuple): groups of lines with {idx} to repeat in order,
+            one of CORPORA values
+
+    Returns:
+        Batch script as a string
+    """
+    out = []
+    idx = 0
+    while len(out) < lines:
+        template = templates[idx % len(templates)]
+        if len(out) + len(template) > lines:
+            template = FILLER
+        out.extend(line.format(idx=idx) for line in template)
+        idx += 1
+    return "\n".join(out) + "\n"
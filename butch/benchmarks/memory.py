@@ -0,0 +1,65 @@
+"""
+Memory used by the tokenized instructions of a large Batch script.
+
+Run as ``python -m butch.benchmarks.memory [lines]``.
+"""
+
+import gc
+import sys
+import tracemalloc
+from time import perf_counter
+
+from butch.benchmarks import generate_script
+from butch.context import Context
+from butch.tokenizer import tokenize
+
+LINES = 100000
+
+
+def measure(lines: int = LINES) -> dict:
+    """
+    Tokenize a generated script and measure the memory of its tokens.
+
+    Args:
+        lines (int): number of lines in the script
+
+    Returns:
+        dict with the results
+    """
+    text = generate_script(lines=lines)
+    ctx = Context()
+
+    gc.collect()
+    tracemalloc.start()
+    start = perf_counter()
+    instructions = tokenize(text=text, ctx=ctx)
+    elapsed = perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = len(instructions)
+    return {
+        "lines": lines,
+        "instructions": count,
+        "retained": current,
+        "peak": peak,
+        "per_instruction": current / count,
+        "seconds": elapsed
+    }
+
+
+def main():
+    """Print the results for a script of 100k lines or from argv."""
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else LINES
+    result = measure(lines=lines)
+    print(f"lines:           {result['lines']}")
+    print(f"instructions:    {result['instructions']}")
+    print(f"retained:        {result['retained'] / 1024 ** 2:.2f} MiB")
+    print(f"peak:            {result['peak'] / 1024 ** 2:.2f} MiB")
+    print(f"per instruction: {result['per_instruction']:.0f} B")
+    print(f"seconds:         {result['seconds']:.2f} (traced)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Startup time of Butch running a single command.
+
+Run as ``python -m butch.benchmarks.startup [options]``, see ``--help``.
+Each measurement is a fresh interpreter, so the imports aren't cached
+in ``sys.modules`` between the runs. The overhead is the time on top of
+an interpreter running nothing, ``--budget`` makes the benchmark fail
+when it's exceeded, e.g. in CI.
+"""
+
+import json
+import os
+import platform
+import subprocess  # nosec
+import sys
+from argparse import ArgumentParser, Namespace
+from os.path import dirname
+from time import perf_counter
+from typing import List
+
+import butch
+from butch import get_version
+
+COMMAND = "echo hi"
+REPEAT = 10
+IMPORT_CODE = (
+    "from time import perf_counter\n"
+    "start = perf_counter()\n"
+    "import butch.__main__\n"
+    "print(perf_counter() - start)\n"
+)
+
+
+def _environment() -> dict:
+    "Environment importing the measured butch package first."
+    env = dict(os.environ)
+    root = dirname(dirname(butch.__file__))
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (root, env.get("PYTHONPATH")) if path
+    )
+    env.pop("DEBUG", None)
+    return env
+
+
+def wall_time(argv: List[str], repeat: int = REPEAT) -> float:
+    """
+    Run a fresh interpreter and measure the time until it exits.
+
+    Args:
+        argv (list): interpreter arguments
+        repeat (int): number of runs, the best one is used
+
+    Returns:
+        seconds
+    """
+    env = _environment()
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        subprocess.run(  # nosec
+            [sys.executable] + argv, env=env, check=True,
+            stdout=subprocess.DEVNULL
+        )
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def import_time(repeat: int = REPEAT) -> float:
+    """
+    Measure the import of the modules needed for a Butch run.
+
+    Args:
+        repeat (int): number of runs, the best one is used
+
+    Returns:
+        seconds
+    """
+    env = _environment()
+    best = float("inf")
+    for _ in range(repeat):
+        proc = subprocess.run(  # nosec
+            [sys.executable, "-c", IMPORT_CODE], env=env, check=True,
+            stdout=subprocess.PIPE, universal_newlines=True
+        )
+        best = min(best, float(proc.stdout))
+    return best
+
+
+def run(command: str = COMMAND, repeat: int = REPEAT) -> dict:
+    """
+    Measure the startup of ``butch /C`` with a command.
+
+    Args:
+        command (str): Batch command to run
+        repeat (int): number of runs, the best one is used
+
+    Returns:
+        dict with the environment and the results
+    """
+    interpreter = wall_time(argv=["-c", "pass"], repeat=repeat)
+    startup = wall_time(argv=["-m", "butch", "/C", command], repeat=repeat)
+    return {
+        "version": get_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "command": command,
+        "repeat": repeat,
+        "results": {
+            "interpreter": interpreter,
+            "startup": startup,
+            "overhead": startup - interpreter,
+            "imports": import_time(repeat=repeat)
+        }
+    }
+
+
+def get_cli_parser() -> ArgumentParser:
+    """
+    Assemble the argument parser of the benchmark.
+
+    Returns:
+        argparse.ArgumentParser
+    """
+    cli = ArgumentParser(prog="python -m butch.benchmarks.startup")
+    cli.add_argument(
+        "--command", default=COMMAND,
+        help="Batch command to run (default: %(default)s)"
+    )
+    cli.add_argument(
+        "--repeat", type=int, default=REPEAT,
+        help="runs, the best one is used (default: %(default)s)"
+    )
+    cli.add_argument(
+        "--budget", type=float,
+        help="fail if the overhead is over this many milliseconds"
+    )
+    cli.add_argument("--output", help="save the results to a JSON file")
+    cli.add_argument("--baseline", help="compare to results in a JSON file")
+    return cli
+
+
+def print_results(report: dict, baseline: dict = None):
+    """
+    Print the results in milliseconds, with speedups if there's a baseline.
+
+    Args:
+        report (dict): output of run()
+        baseline (dict): output of run() to compare to
+    """
+    old = baseline["results"] if baseline else {}
+    print(f"{'measure':<12} {'ms':>9} {'speedup':>8}")
+    for name, seconds in report["results"].items():
+        speedup = ""
+        if old.get(name, 0) > 0 and seconds > 0:
+            speedup = f"{old[name] / seconds:.2f}x"
+        print(f"{name:<12} {seconds * 1000:>9.1f} {speedup:>8}")
+
+
+def main(argv: List[str] = None):
+    """
+    Run the benchmark with the command line arguments.
+
+    Args:
+        argv (list): arguments, sys.argv if None
+    """
+    args: Namespace = get_cli_parser().parse_args(
+        sys.argv[1:] if argv is None else argv
+    )
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as fdes:
+            baseline = json.load(fdes)
+
+    report = run(command=args.command, repeat=args.repeat)
+    print_results(report=report, baseline=baseline)
+    if args.output:
+        with open(args.output, "w") as fdes:
+            json.dump(report, fdes, indent=4)
+
+    overhead = report["results"]["overhead"] * 1000
+    if args.budget is not None and overhead > args.budget:
+        sys.exit(
+            f"Startup overhead {overhead:.1f} ms is over the budget "
+            f"of {args.budget:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Throughput of the tokenizer on generated corpora and the test Batch files.
+
+Run as ``python -m butch.benchmarks.tokenizer [options]``, see ``--help``.
+The results can be saved as JSON with ``--output`` and compared to
+a previous run with ``--baseline``.
+"""
+
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from glob import glob
+from os.path import dirname, join
+from time import perf_counter
+from typing import List
+
+from butch import get_version
+from butch.benchmarks import CORPORA, generate_script
+from butch.context import Context
+from butch.tokenizer import Command, Connector, Lexer, tokenize
+from butch.tokens import Block, Token
+
+BATCH = "batch"
+LINES = 20000
+REPEAT = 3
+
+
+def batch_files() -> List[str]:
+    """
+    Read the Batch files used by the tests.
+
+    Returns:
+        list of the file contents, sorted by the file name
+    """
+    from butch.tests import batch  # pylint: disable=import-outside-toplevel
+
+    texts = []
+    for path in sorted(glob(join(dirname(batch.__file__), "*.bat"))):
+        with open(path) as fdes:
+            texts.append(fdes.read())
+    return texts
+
+
+def corpus(name: str, lines: int = LINES) -> List[str]:
+    """
+    Get the Batch scripts of a corpus.
+
+    Args:
+        name (str): key of CORPORA or "batch" for the test files
+        lines (int): number of lines of a generated script
+
+    Returns:
+        list of scripts
+    """
+    if name == BATCH:
+        return batch_files()
+    return [generate_script(lines=lines, templates=CORPORA[name])]
+
+
+def count_tokens(tokens: list) -> int:
+    """
+    Count the tokens including the nested ones.
+
+    Args:
+        tokens (list): tokenizer output
+
+    Returns:
+        number of tokens
+    """
+    count = 0
+    stack = list(tokens)
+    while stack:
+        token = stack.pop()
+        if not isinstance(token, Token):
+            continue
+        count += 1
+        if isinstance(token, Block):
+            stack.extend(token)
+        elif isinstance(token, Connector):
+            stack.extend((token.left, token.right))
+        elif isinstance(token, Command):
+            stack.extend(token.args)
+    return count
+
+
+def measure(
+        texts: List[str], repeat: int = REPEAT, lexer: Lexer = None
+) -> dict:
+    """
+    Tokenize scripts and measure the time and memory.
+
+    The time is the best of the runs, the memory is traced in an extra
+    run because tracing slows down the tokenizer.
+
+    Args:
+        texts (list): scripts to tokenize one by one
+        repeat (int): number of timed runs
+        lexer (Lexer): engine to use, the default one if None
+
+    Returns:
+        dict with the results
+    """
+    chars = sum(len(text) for text in texts)
+    best = float("inf")
+    tokens = 0
+    for _ in range(repeat):
+        outputs = []
+        gc.collect()
+        start = perf_counter()
+        for text in texts:
+            outputs.append(tokenize(text=text, ctx=Context(), lexer=lexer))
+        best = min(best, perf_counter() - start)
+        tokens = sum(count_tokens(tokens=output) for output in outputs)
+        del outputs  # noqa: WPS420
+
+    gc.collect()
+    tracemalloc.start()
+    for text in texts:
+        tokenize(text=text, ctx=Context(), lexer=lexer)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "scripts": len(texts),
+        "chars": chars,
+        "tokens": tokens,
+        "seconds": best,
+        "chars_per_sec": chars / best,
+        "tokens_per_sec": tokens / best,
+        "peak": peak
+    }
+
+
+def run(
+        names: List[str], lines: int = LINES, repeat: int = REPEAT,
+        lexer: Lexer = None
+) -> dict:
+    """
+    Measure the tokenizer on multiple corpora.
+
+    Args:
+        names (list): corpora to measure
+        lines (int): number of lines of a generated script
+        repeat (int): number of timed runs
+        lexer (Lexer): engine to use, the default one if None
+
+    Returns:
+        dict with the environment and the results per corpus
+    """
+    results = {}
+    for name in names:
+        results[name] = measure(
+            texts=corpus(name=name, lines=lines), repeat=repeat, lexer=lexer
+        )
+    return {
+        "version": get_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "lexer": lexer.value if lexer else None,
+        "lines": lines,
+        "repeat": repeat,
+        "results": results
+    }
+
+
+def get_cli_parser() -> ArgumentParser:
+    """
+    Assemble the argument parser of the benchmark.
+
+    Returns:
+        argparse.ArgumentParser
+    """
+    names = list(CORPORA) + [BATCH]
+    cli = ArgumentParser(prog="python -m butch.benchmarks.tokenizer")
+    cli.add_argument(
+        "--corpus", action="append", choices=names,
+        help="corpus to measure, can repeat (default: all)"
+    )
+    cli.add_argument(
+        "--lines", type=int, default=LINES,
+        help="lines of a generated script (default: %(default)s)"
+    )
+    cli.add_argument(
+        "--repeat", type=int, default=REPEAT,
+        help="timed runs, the best one is used (default: %(default)s)"
+    )
+    cli.add_argument(
+        "--lexer", choices=[lexer.value for lexer in Lexer],
+        help="tokenizer engine (default: BUTCH_LEXER or table)"
+    )
+    cli.add_argument("--output", help="save the results to a JSON file")
+    cli.add_argument("--baseline", help="compare to results in a JSON file")
+    return cli
+
+
+def print_results(report: dict, baseline: dict = None):
+    """
+    Print the results in a table, with speedups if there's a baseline.
+
+    Args:
+        report (dict): output of run()
+        baseline (dict): output of run() to compare to
+    """
+    old = baseline["results"] if baseline else {}
+    print(
+        f"{'corpus':<8} {'chars':>10} {'tokens':>9} {'chars/s':>11} "
+        f"{'tokens/s':>10} {'peak MiB':>9} {'speedup':>8}"
+    )
+    for name, result in report["results"].items():
+        speedup = ""
+        if name in old:
+            ratio = old[name]["seconds"] / result["seconds"]
+            speedup = f"{ratio:.2f}x"
+        print(
+            f"{name:<8} {result['chars']:>10} {result['tokens']:>9} "
+            f"{result['chars_per_sec']:>11.0f} "
+            f"{result['tokens_per_sec']:>10.0f} "
+            f"{result['peak'] / 1024 ** 2:>9.2f} {speedup:>8}"
+        )
+
+
+def main(argv: List[str] = None):
+    """
+    Run the benchmark with the command line arguments.
+
+    Args:
+        argv (list): arguments, sys.argv if None
+    """
+    args: Namespace = get_cli_parser().parse_args(
+        sys.argv[1:] if argv is None else argv
+    )
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as fdes:
+            baseline = json.load(fdes)
+
+    report = run(
+        names=args.corpus or list(CORPORA) + [BATCH], lines=args.lines,
+        repeat=args.repeat, lexer=Lexer(args.lexer) if args.lexer else None
+    )
+    print_results(report=report, baseline=baseline)
+    if args.output:
+        with open(args.output, "w") as fdes:
+            json.dump(report, fdes, indent=4)
+
+
+if __name__ == "__main__":
+    main()
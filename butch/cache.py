@@ -0,0 +1,259 @@
+"""Module for caching tokenized Batch files on the disk."""
+
+import os
+import pickle
+from functools import partial
+from hashlib import sha256
+from os import environ, listdir, makedirs, remove, replace, stat, utime
+from os.path import abspath, expanduser, join
+from tempfile import NamedTemporaryFile
+from typing import Any, Iterable, Iterator, List, Optional
+
+from butch import get_version
+from butch.tokens import Token
+
+CACHE_ENV = "BUTCH_CACHE_DIR"
+CACHE_SIZE_ENV = "BUTCH_CACHE_SIZE"
+CACHE_SIZE = 64 * 1024 * 1024
+CACHE_SUFFIX = ".pickle"
+# only the owner can access the folder, the entries are unpickled
+CACHE_MODE = 0o700
+# write permission for the group and others
+CACHE_SHARED = 0o022
+READ_CHUNK = 65536
+
+
+def hash_chunks(chunks: Iterable[str], digest: Any) -> Iterator[str]:
+    """
+    Pass text chunks through while hashing them.
+
+    Args:
+        chunks (Iterable[str]): consecutive parts of the text
+        digest (Any): hashlib object to update, e.g. sha256()
+
+    Yields:
+        the same chunks
+    """
+    for chunk in chunks:
+        digest.update(chunk.encode("utf-8"))
+        yield chunk
+
+
+def text_digest(chunks: Iterable[str]) -> str:
+    """
+    Compute a hash of text coming in chunks.
+
+    Args:
+        chunks (Iterable[str]): consecutive parts of the text
+
+    Returns:
+        hex digest string
+    """
+    digest = sha256()
+    for _ in hash_chunks(chunks=chunks, digest=digest):
+        pass  # noqa: WPS328
+    return digest.hexdigest()
+
+
+class ScriptCache:
+    """
+    Folder with tokenized Batch files, a .pyc equivalent.
+
+    An entry is stored per path with its size, mtime, content hash
+    and Butch version. A different mtime with the same size and content
+    is still a hit. The least recently used entries are removed when
+    the folder grows over its size limit.
+    """
+
+    _folder: str
+    _limit: int
+
+    def __init__(self, folder: str, limit: int = CACHE_SIZE):
+        """
+        Initialize ScriptCache instance.
+
+        Args:
+            folder (str): path to the cache folder, created if missing
+                with access for the owner only
+            limit (int): maximum size of all entries in bytes
+        """
+        self._folder = folder
+        self._limit = limit
+
+    @property
+    def folder(self):
+        """
+        Get the path to the cache folder.
+
+        Returns:
+            path string
+        """
+        return self._folder
+
+    def entry_path(self, path: str) -> str:
+        """
+        Get the path of the cache entry for a Batch file.
+
+        Args:
+            path (str): path to the Batch file
+
+        Returns:
+            path string
+        """
+        name = sha256(abspath(path).encode("utf-8")).hexdigest()
+        return join(self._folder, name + CACHE_SUFFIX)
+
+    def trusted(self) -> bool:
+        """
+        Check whether the entries in the folder can be unpickled.
+
+        Unpickling runs code, so the folder has to be owned by the user
+        and not writable by anyone else. The owner isn't checked where
+        the system has no user IDs.
+
+        Returns:
+            whether the folder is safe to use
+        """
+        try:
+            folder_stat = stat(self._folder)
+        except OSError:
+            return False
+        if hasattr(os, "getuid") and folder_stat.st_uid != os.getuid():
+            return False
+        return not folder_stat.st_mode & CACHE_SHARED
+
+    def load(self, path: str) -> Optional[List[Token]]:
+        """
+        Load tokens of a Batch file if the file hasn't changed.
+
+        Args:
+            path (str): path to the Batch file
+
+        Returns:
+            list of tokens or None if missing, outdated or the folder
+            isn't trusted()
+        """
+        if not self.trusted():
+            return None
+
+        entry_path = self.entry_path(path=path)
+        try:
+            with open(entry_path, "rb") as fdes:
+                entry = pickle.load(fdes)
+            file_stat = stat(path)
+        except Exception:  # pylint: disable=broad-except
+            # missing, corrupted or pickled by an incompatible version
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("version") != get_version():
+            return None
+        if entry["path"] != abspath(path):
+            return None
+        if entry["size"] != file_stat.st_size:
+            return None
+
+        if entry["mtime"] != file_stat.st_mtime_ns:
+            # touched or copied, but the content might be the same
+            with open(path) as fdes:
+                digest = text_digest(iter(partial(fdes.read, READ_CHUNK), ""))
+            if digest != entry["digest"]:
+                return None
+            self.store(
+                path=path, size=file_stat.st_size,
+                mtime=file_stat.st_mtime_ns, digest=digest,
+                tokens=entry["tokens"]
+            )
+            return entry["tokens"]
+
+        # mark as recently used for the eviction
+        try:
+            utime(entry_path)
+        except OSError:
+            pass  # noqa: WPS420
+        return entry["tokens"]
+
+    def store(  # pylint: disable=too-many-arguments
+            self, path: str, size: int, mtime: int, digest: str,
+            tokens: List[Token]
+    ) -> None:
+        """
+        Store tokens of a Batch file and evict the old entries.
+
+        Caching is best effort, an unwritable or untrusted folder
+        is ignored.
+
+        Args:
+            path (str): path to the Batch file
+            size (int): size of the file when read
+            mtime (int): modification time in nanoseconds when read
+            digest (str): hash of the file content from text_digest()
+            tokens (list): tokenized content of the file
+        """
+        entry = {
+            "version": get_version(),
+            "path": abspath(path),
+            "size": size,
+            "mtime": mtime,
+            "digest": digest,
+            "tokens": tokens
+        }
+        try:
+            makedirs(self._folder, mode=CACHE_MODE, exist_ok=True)
+            if not self.trusted():
+                return
+
+            # write aside and replace, so that a parallel run never
+            # loads an unfinished entry
+            with NamedTemporaryFile(
+                    mode="wb", dir=self._folder, suffix=".tmp", delete=False
+            ) as fdes:
+                pickle.dump(entry, fdes, protocol=pickle.HIGHEST_PROTOCOL)
+            replace(fdes.name, self.entry_path(path=path))
+            self.evict()
+        except OSError:
+            return
+
+    def evict(self) -> None:
+        "Remove the least recently used entries over the size limit."
+        entries = []
+        for name in listdir(self._folder):
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            entry_path = join(self._folder, name)
+            try:
+                entry_stat = stat(entry_path)
+            except OSError:
+                continue
+            entries.append((
+                entry_stat.st_mtime_ns, entry_stat.st_size, entry_path
+            ))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self._limit:
+                break
+            try:
+                remove(entry_path)
+            except OSError:
+                continue
+            total -= size
+
+
+def get_cache() -> Optional[ScriptCache]:
+    """
+    Get the cache configured by BUTCH_CACHE_DIR and BUTCH_CACHE_SIZE.
+
+    Returns:
+        ScriptCache or None if disabled with an empty BUTCH_CACHE_DIR
+    """
+    default = join(
+        environ.get("XDG_CACHE_HOME", expanduser(join("~", ".cache"))),
+        "butch"
+    )
+    folder = environ.get(CACHE_ENV, default)
+    if not folder:
+        return None
+    limit = int(environ.get(CACHE_SIZE_ENV, CACHE_SIZE))
+    return ScriptCache(folder=folder, limit=limit)
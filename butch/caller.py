@@ -5,16 +5,18 @@ The call function takes the already parsed and tokenized Batch input (by
 tokenizer module) and executes according to the provided tokens and context.
 """
 
-from typing import Union
+from threading import Thread
+from typing import List, TextIO, Union
 
-from butch.commands import get_cmd_map
+from butch.commands.external import run_external
 from butch.context import Context
 from butch.inputs import CommandInput
+from butch.logger import emptyf
+from butch.outputs import CommandOutput, PipeBuffer
 from butch.tokenizer import Command, Connector, Pipe, Redirection, RedirType
 from butch.tokens import Block
 
 
-FILE_CHUNK = 512
 REDIR_NULL = "nul"
 
 
@@ -22,42 +24,117 @@ class UnknownCommand(Exception):
     """Exception if CommandType.UNKNOWN was passed."""
 
 
-def _handle_redirection_output(redir_target: str, ctx: Context):
-    log = ctx.log.debug
-    log("\t- redirect collected output to: %r", redir_target)
+def _handle_redirection_output(
+        redir_target: str, ctx: Context, append: bool = False
+) -> TextIO:
+    """
+    Open the target of output redirection as the collected output.
+
+    The commands write straight into the file, nothing is buffered
+    in memory except for the file object's own buffer.
+
+    Args:
+        redir_target (str): path to the file
+        ctx (Context): Context instance
+        append (bool): append to the file (>>) instead of overwriting (>)
+
+    Returns:
+        opened file, closed by the caller when the command finishes
+    """
+    log = ctx.log.debug if ctx.trace else emptyf
+    log("\t- redirect output to: %r", redir_target)
 
-    # read ctx.output.stdout/stderr
-    # and write to whatever provided as cmd.right
     path = redir_target.replace("\\", "/")
-    log("\t\t- writing collected stdout to %r", path)
+    log("\t\t- %s %r", "appending to" if append else "writing", path)
+    output_descr = open(path, "a" if append else "w")
+    ctx.output = CommandOutput(stream=output_descr)
+    return output_descr
 
-    out = ctx.output.stdout
-    out.seek(0)
 
-    with open(path, "w") as output_descr:
-        while True:
-            chunk = out.read(FILE_CHUNK)
-            if not chunk:
-                break
-            output_descr.write(chunk)
+def _handle_redirection_input(redir_target: str, ctx: Context) -> TextIO:
+    """
+    Open the source of input redirection as the standard input.
 
+    The file is read lazily through its own buffer, so a command reading
+    a single line (e.g. SET /P) doesn't load the rest of it.
 
-def _handle_redirection_input(redir_target: str, ctx: Context):
-    log = ctx.log.debug
-    log("\t\t- should create STDIN")
-    ctx.inputted = True
-    ctx.input = CommandInput()
-    input_buff = ctx.input.stdin
+    Args:
+        redir_target (str): path to the file
+        ctx (Context): Context instance
 
+    Returns:
+        opened file, closed by the caller when the command finishes
+    """
+    log = ctx.log.debug if ctx.trace else emptyf
     path = redir_target.replace("\\", "/")
-    log("\t\t\t- creating from %r", path)
-    with open(path) as stdin:
-        while True:
-            chunk = stdin.read(FILE_CHUNK)
-            if not chunk:
-                break
-            input_buff.write(chunk)
-    input_buff.seek(0)
+    log("\t\t- reading STDIN from %r", path)
+    input_descr = open(path)
+    ctx.inputted = True
+    ctx.input = CommandInput(stream=input_descr)
+    return input_descr
+
+
+def _write_pipe(
+        cmd: Union[Block, Command, Connector], ctx: Context,
+        stream: PipeBuffer, errors: List[Exception]
+):
+    "Run the left side of a pipe in a thread, then close the pipe."
+    try:
+        new_call(cmd=cmd, ctx=ctx, child=True)
+    except Exception as exc:  # noqa: WPS440
+        # re-raised in the reading thread
+        errors.append(exc)
+    finally:
+        stream.close()
+
+
+def _handle_pipe(pipe: Pipe, ctx: Context):
+    """
+    Run both sides of a pipe concurrently, connected by a bounded buffer.
+
+    The left side writes from a thread with an isolated copy of the
+    Context, so that it has its own output, flags, variables and SETLOCAL
+    scopes, while the right side reads and changes the Context itself.
+    Writing waits while the buffer is full, so any amount of output passes
+    through a pipe in constant memory.
+
+    Args:
+        pipe (Pipe): Pipe token
+        ctx (Context): Context instance
+    """
+    log = ctx.log.debug if ctx.trace else emptyf
+    stream = PipeBuffer()
+    writer = ctx.isolated()
+    # an outer pipe still feeds the left side
+    writer.input = ctx.input
+    writer.inputted = ctx.inputted
+    writer.error_level = ctx.error_level
+    writer.collect_output = True
+    writer.output = CommandOutput(stream=stream)
+    errors: List[Exception] = []
+    thread = Thread(
+        target=_write_pipe, name="butch-pipe", daemon=True, kwargs={
+            "cmd": pipe.left, "ctx": writer, "stream": stream,
+            "errors": errors
+        }
+    )
+    log("\t- piping %r into %r", pipe.left, pipe.right)
+    thread.start()
+
+    old_input = (ctx.input, ctx.inputted)
+    ctx.input = CommandInput(stream=stream)
+    ctx.inputted = True
+    ctx.piped = True
+    try:
+        new_call(cmd=pipe.right, ctx=ctx, child=True)
+    finally:
+        # the right side doesn't have to read everything
+        stream.close_reader()
+        thread.join()
+        ctx.input, ctx.inputted = old_input
+        ctx.piped = False
+    if errors:
+        raise errors[0]
 
 
 def new_call(  # noqa: WPS317
@@ -75,7 +152,7 @@ def new_call(  # noqa: WPS317
     Raises:
         UnknownCommand: for unknown token (mistake or tokenization error)
     """
-    log = ctx.log.debug
+    log = ctx.log.debug if ctx.trace else emptyf
     log("Calling command %r", cmd)
 
     command = cmd
@@ -84,45 +161,71 @@ def new_call(  # noqa: WPS317
             new_call(cmd=subcmd, ctx=ctx, child=False)
         ctx.history = command
         return
+    elif isinstance(command, Pipe):
+        log("\t- unpacking pipe")
+        _handle_pipe(pipe=command, ctx=ctx)
+        if not child:
+            ctx.history = cmd
+        return
     elif isinstance(command, Connector):
         log("\t- unpacking connector")
         is_redir = isinstance(command, Redirection)
-        is_pipe = isinstance(command, Pipe)
         is_redir_output = False
 
         if is_redir and command.type == RedirType.OUTPUT:
             is_redir_output = True
 
-        if is_redir or is_pipe:
-            if is_redir_output or is_pipe:
+        redir_descr = None
+        old_output = (ctx.collect_output, ctx.output)
+        old_input = (ctx.input, ctx.inputted)
+        if is_redir:
+            if is_redir_output:
                 log("\t\t- should collect STDOUT+STDERR")
                 ctx.collect_output = True
+                redir_target = command.right.value
+                if redir_target.lower().strip() == REDIR_NULL:
+                    ctx.output = CommandOutput(discard=True)
+                else:
+                    redir_descr = _handle_redirection_output(
+                        redir_target=redir_target, ctx=ctx,
+                        append=command.append
+                    )
             else:
-                _handle_redirection_input(
+                redir_descr = _handle_redirection_input(
                     redir_target=command.right.value, ctx=ctx
                 )
         left = command.left
         log("\t- recursion to connector's left: %r", left)
-        new_call(cmd=left, ctx=ctx, child=True)
-        ctx.collect_output = False
-        ctx.piped = isinstance(command, Pipe)
+        try:
+            new_call(cmd=left, ctx=ctx, child=True)
+        finally:
+            if redir_descr is not None:
+                redir_descr.close()
+            if is_redir:
+                log("\t- finishing redirection")
+                # e.g. back to a pipe if redirected inside of it, even
+                # if the command failed, so nothing uses a closed file
+                if is_redir_output:
+                    ctx.collect_output, ctx.output = old_output
+                else:
+                    ctx.input, ctx.inputted = old_input
+        ctx.piped = False
 
         if is_redir:
-            log("\t- finishing redirection")
-            if is_redir_output:
-                log("\t\t- writing output")
-                redir_target = command.right.value
-                if redir_target.lower().strip() != REDIR_NULL:
-                    _handle_redirection_output(
-                        redir_target=redir_target, ctx=ctx
-                    )
             log("\t\t- done")
             return
         command = command.right
 
-    cmd_map = get_cmd_map()
-    log("\t- function lookup by: %r", command.cmd)
-    func = cmd_map.get(command.cmd)
+    func = None
+    if isinstance(command, Command):
+        func = command.func
+    log("\t- function resolved by tokenizer: %r", func)
+    if not func and isinstance(command, Command) and command.value:
+        log("\t- looking for an external command: %r", command.value)
+        if not child:
+            ctx.history = cmd
+        run_external(name=command.value, params=command.args, ctx=ctx)
+        return
     if not func:
         raise UnknownCommand(f"Unknown function: '{cmd}'")
 
@@ -0,0 +1,230 @@
+"""
+Thin client for the Butch server, see butch.server.
+
+Run as ``python -m butch.client [butch arguments]``. The client imports
+only a few standard modules, sends the arguments, the current folder and
+the environment to the server together with its STDIN, STDOUT and STDERR
+file descriptors and exits with the exit code of the run. The output goes
+straight to the passed descriptors, it isn't copied through the socket.
+Even ``json`` or ``typing`` would be a noticeable part of the client's
+startup, so the request is just a list of NUL-separated strings.
+
+Without a running server the arguments are run by Butch in the process.
+"""
+
+import array
+import os
+import socket
+import stat
+import struct
+import sys
+
+SOCKET_ENV = "BUTCH_SOCKET"
+HEADER = struct.Struct("!I")
+CODE = struct.Struct("!i")
+STD_FDS = (0, 1, 2)
+SEPARATOR = "\0"
+# write permission for the group and others
+SHARED_MODE = 0o022
+
+
+def get_socket_path() -> str:
+    """
+    Get the path of the server's socket.
+
+    Returns:
+        BUTCH_SOCKET or a socket in a per-user folder in XDG_RUNTIME_DIR
+        or TMPDIR
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    folder = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get(
+        "TMPDIR", "/tmp"  # noqa: S108
+    )
+    return os.path.join(folder, f"butch-{os.getuid()}", "butch.sock")
+
+
+def check_folder(path: str) -> None:
+    """
+    Check that only the user can use the folder of a socket.
+
+    The client sends its environment and standard streams to whoever
+    listens on the socket, so a folder created first by someone else
+    in a shared TMPDIR must not be used.
+
+    Args:
+        path (str): socket path
+
+    Raises:
+        PermissionError: when the folder is a symlink, owned by someone
+            else or writable by the group or others
+    """
+    folder = os.path.dirname(path) or "."
+    folder_stat = os.lstat(folder)
+    trusted = (
+        stat.S_ISDIR(folder_stat.st_mode)
+        and folder_stat.st_uid == os.getuid()
+        and not folder_stat.st_mode & SHARED_MODE
+    )
+    if not trusted:
+        raise PermissionError(f"Untrusted socket folder: {folder}")
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    "Receive exactly the number of bytes or raise EOFError."
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise EOFError("Connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def encode_request(argv: list, cwd: str, env: dict) -> bytes:
+    """
+    Encode a request for the server.
+
+    Args:
+        argv (list): Butch's command line arguments
+        cwd (str): current folder
+        env (dict): environment variables
+
+    Returns:
+        bytes
+    """
+    fields = [cwd, str(len(argv))] + argv
+    fields.extend(f"{key}={value}" for key, value in env.items())
+    return SEPARATOR.join(fields).encode("utf-8", "surrogateescape")
+
+
+def decode_request(data: bytes) -> dict:
+    """
+    Decode a request from encode_request().
+
+    Args:
+        data (bytes): encoded request
+
+    Returns:
+        dict with argv, cwd and env keys
+    """
+    fields = data.decode("utf-8", "surrogateescape").split(SEPARATOR)
+    count = int(fields[1])
+    env = {}
+    for pair in fields[2 + count:]:
+        key, _, value = pair.partition("=")
+        env[key] = value
+    return {"argv": fields[2:2 + count], "cwd": fields[0], "env": env}
+
+
+def send_request(sock: socket.socket, data: bytes, fds: list):
+    """
+    Send a request with file descriptors attached.
+
+    Args:
+        sock (socket.socket): connected Unix socket
+        data (bytes): request from encode_request()
+        fds (list): file descriptors to pass to the server
+    """
+    sock.sendmsg(
+        [HEADER.pack(len(data))],
+        [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))]
+    )
+    sock.sendall(data)
+
+
+def recv_request(sock: socket.socket) -> tuple:
+    """
+    Receive a request sent by send_request().
+
+    Args:
+        sock (socket.socket): connected Unix socket
+
+    Returns:
+        the decoded request and the received file descriptors
+
+    Raises:
+        EOFError: when the connection is closed too early
+    """
+    fds = array.array("i")
+    header, ancdata, _, _ = sock.recvmsg(
+        HEADER.size, socket.CMSG_LEN(len(STD_FDS) * fds.itemsize)
+    )
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            usable = len(data) - len(data) % fds.itemsize
+            fds.frombytes(data[:usable])
+    if len(header) < HEADER.size:
+        header += _recv_exact(sock, HEADER.size - len(header))
+    size = HEADER.unpack(header)[0]
+    return decode_request(_recv_exact(sock, size)), list(fds)
+
+
+def connect(path: str = None) -> socket.socket:
+    """
+    Connect to the server.
+
+    Args:
+        path (str): socket path, get_socket_path() if None
+
+    Returns:
+        connected socket
+
+    Raises:
+        OSError: when the server isn't running or its folder isn't
+            private, see check_folder()
+    """
+    path = path or get_socket_path()
+    check_folder(path=path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def run(sock: socket.socket, argv: list, fds: tuple = STD_FDS) -> int:
+    """
+    Run Butch with arguments in the server, wait for the run to finish.
+
+    Args:
+        sock (socket.socket): socket from connect()
+        argv (list): Butch's command line arguments
+        fds (tuple): STDIN, STDOUT and STDERR for the run
+
+    Returns:
+        exit code of the run
+    """
+    with sock:
+        data = encode_request(
+            argv=argv, cwd=os.getcwd(), env=dict(os.environ)
+        )
+        send_request(sock=sock, data=data, fds=list(fds))
+        return CODE.unpack(_recv_exact(sock, CODE.size))[0]
+
+
+def main(argv: list = None):
+    """
+    Run the client with the command line arguments.
+
+    Args:
+        argv (list): arguments, sys.argv if None
+    """
+    args = sys.argv[1:] if argv is None else argv
+    try:
+        sock = connect()
+    except OSError:
+        # no server, pay for the imports here
+        # pylint: disable=import-outside-toplevel
+        from butch.__main__ import main as butch_main
+        butch_main(args)
+        return
+    sys.exit(run(sock=sock, argv=args))
+
+
+if __name__ == "__main__":
+    main()
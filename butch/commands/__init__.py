@@ -0,0 +1,324 @@
+"""
+Package holding command-representing functions for their Batch names.
+
+Every command lives in its own module, which is imported only when the
+command is called for the first time, so that e.g. ECHO doesn't pay for
+the imports of DIR or MOVE. The commands are looked up in CMD_MAP.
+
+Other packages can add commands with the ``butch.commands`` entry points,
+the name is the command name and the value the function, for example
+``choice = butch_pack.choice:cmd_choice``. The entry points are read only
+when a name isn't a builtin command, before PATH is searched for it,
+and their modules are imported only when called too. A builtin command
+can't be replaced this way, similarly to PATH not replacing it either.
+"""
+
+from importlib import import_module
+from typing import Callable, Dict, Iterator, Optional, Union
+
+from butch.commandtype import CommandType
+
+ENTRY_POINTS = "butch.commands"
+SPEC_SEPARATOR = ":"
+
+# command or a name of a command from an entry point
+Key = Union[CommandType, str]
+# function or its "module:function" path
+Entry = Union[Callable, str]
+
+
+def get_cmd_map() -> Dict[CommandType, str]:
+    """
+    Get mapping of CommandType into its functions for execution.
+
+    Returns:
+        dict with mapping Command enum to "module:function" path
+        of the function it should call
+    """
+    prefix = "butch.commands"
+    return {
+        CommandType.ECHO: f"{prefix}.echo:cmd_echo",
+        CommandType.CD: f"{prefix}.cd:cmd_cd",
+        CommandType.SET: f"{prefix}.set_:cmd_set",
+        CommandType.PROMPT: f"{prefix}.prompt:cmd_prompt",
+        CommandType.TITLE: f"{prefix}.title:cmd_title",
+        CommandType.PAUSE: f"{prefix}.pause:cmd_pause",
+        CommandType.EXIT: f"{prefix}.exit_:cmd_exit",
+        CommandType.SETLOCAL: f"{prefix}.setlocal:cmd_setlocal",
+        CommandType.ENDLOCAL: f"{prefix}.endlocal:cmd_endlocal",
+        CommandType.DEL: f"{prefix}.del_:cmd_del",
+        CommandType.ERASE: f"{prefix}.del_:cmd_del",
+        CommandType.HELP: f"{prefix}.help_:cmd_help",
+        CommandType.MKDIR: f"{prefix}.mkdir:cmd_mkdir",
+        CommandType.MD: f"{prefix}.mkdir:cmd_mkdir",
+        CommandType.DIR: f"{prefix}.dir_:cmd_dir",
+        CommandType.CLS: f"{prefix}.cls:cmd_cls",
+        CommandType.DATE: f"{prefix}.date:cmd_date",
+        CommandType.RMDIR: f"{prefix}.rmdir:cmd_rmdir",
+        CommandType.RD: f"{prefix}.rmdir:cmd_rmdir",
+        CommandType.TYPE: f"{prefix}.type_:cmd_type",
+        CommandType.PATH: f"{prefix}.path:cmd_path",
+        CommandType.REM: f"{prefix}.rem:cmd_rem",
+        CommandType.PUSHD: f"{prefix}.pushd:cmd_pushd",
+        CommandType.POPD: f"{prefix}.popd:cmd_popd",
+        CommandType.TIME: f"{prefix}.time:cmd_time",
+        CommandType.GOTO: f"{prefix}.goto:cmd_goto",
+        CommandType.VER: f"{prefix}.ver:cmd_ver",
+        CommandType.MOVE: f"{prefix}.move:cmd_move",
+        CommandType.START: f"{prefix}.start:cmd_start"
+    }
+
+
+def get_reverse_cmd_map():
+    """
+    Get reverse mapping for CommandType.
+
+    Returns:
+        dictionary with CommandType name: CommantType instance pairs
+    """
+    rev_cmd_map = {}
+    for attr_name in dir(CommandType):
+        resolved = getattr(CommandType, attr_name)
+        if not isinstance(resolved, CommandType):
+            continue
+        if attr_name == CommandType.UNKNOWN.name:
+            continue
+        rev_cmd_map[resolved.value] = resolved
+    return rev_cmd_map
+
+
+def load_command(spec: str) -> Callable:
+    """
+    Import a command function from its path.
+
+    Args:
+        spec (str): "module:function" path, e.g. an entry point's value
+
+    Returns:
+        the function
+
+    Raises:
+        ValueError: when the path has no function part
+    """
+    module, _, name = spec.partition(SPEC_SEPARATOR)
+    # entry point extras, e.g. "pack.cmd:func [extra]"
+    name = name.split("[")[0].strip()
+    if not name:
+        raise ValueError(f"Not a module:function path: {spec!r}")
+    func = import_module(module.strip())
+    for attr in name.split("."):
+        func = getattr(func, attr)
+    return func
+
+
+def iter_entry_points(group: str = ENTRY_POINTS) -> Iterator[tuple]:
+    """
+    Iterate over the installed entry points without loading them.
+
+    Args:
+        group (str): entry point group
+
+    Yields:
+        (name, value) pairs, nothing without importlib.metadata (< 3.8)
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from importlib.metadata import entry_points
+    except ImportError:
+        return
+    found = entry_points()
+    if hasattr(found, "select"):
+        found = found.select(group=group)
+    else:
+        found = found.get(group, [])
+    for point in found:
+        yield point.name, point.value
+
+
+class CommandRegistry:
+    """
+    Commands to call, imported on their first lookup.
+
+    Behaves as a dict of the functions, the not yet imported ones are
+    kept as their "module:function" paths until looked up.
+    """
+
+    _entries: Dict[Key, Entry]
+    _discovered: bool
+
+    def __init__(self, entries: Dict[Key, Entry] = None):
+        """
+        Initialize CommandRegistry instance.
+
+        Args:
+            entries (dict): functions or their paths per command
+        """
+        self._entries = dict(entries or {})
+        self._discovered = False
+
+    def __len__(self):
+        """
+        Get the number of commands.
+
+        Returns:
+            int
+        """
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Key]:
+        """
+        Iterate over the commands.
+
+        Returns:
+            iterator of the CommandType keys and names
+        """
+        return iter(list(self._entries))
+
+    def __contains__(self, key: Key):
+        """
+        Check the command is registered.
+
+        Args:
+            key (Key): CommandType or a command name
+
+        Returns:
+            bool
+        """
+        return key in self._entries
+
+    def __getitem__(self, key: Key) -> Callable:
+        """
+        Get the function of a command, import it if necessary.
+
+        Args:
+            key (Key): CommandType or a command name
+
+        Returns:
+            the function
+
+        Raises:
+            KeyError: when the command isn't registered
+        """
+        entry = self._entries[key]
+        if isinstance(entry, str):
+            entry = load_command(spec=entry)
+            self._entries[key] = entry
+        return entry
+
+    def __setitem__(self, key: Key, entry: Entry):
+        """
+        Register a command.
+
+        Args:
+            key (Key): CommandType or a command name
+            entry (Entry): function or its "module:function" path
+        """
+        if isinstance(key, str):
+            key = key.lower()
+        self._entries[key] = entry
+
+    def __delitem__(self, key: Key):
+        """
+        Unregister a command.
+
+        Args:
+            key (Key): CommandType or a command name
+        """
+        del self._entries[key]  # noqa: WPS420
+
+    def get(self, key: Key, default: Callable = None) -> Optional[Callable]:
+        """
+        Get the function of a command, import it if necessary.
+
+        Args:
+            key (Key): CommandType or a command name
+            default (Callable): returned for a missing command
+
+        Returns:
+            the function or the default value
+        """
+        if key not in self._entries:
+            return default
+        return self[key]
+
+    def copy(self) -> Dict[Key, Entry]:
+        """
+        Get the registered commands without importing them.
+
+        Returns:
+            dict with the functions or their paths
+        """
+        return dict(self._entries)
+
+    def update(self, entries: Dict[Key, Entry]) -> None:
+        """
+        Register multiple commands.
+
+        Args:
+            entries (dict): functions or their paths per command
+        """
+        for key, entry in entries.items():
+            self[key] = entry
+
+    def clear(self) -> None:
+        """Unregister all of the commands."""
+        self._entries.clear()
+
+    def loaded(self, key: Key) -> bool:
+        """
+        Check the function of a command is imported already.
+
+        Args:
+            key (Key): CommandType or a command name
+
+        Returns:
+            bool
+        """
+        return not isinstance(self._entries.get(key, ""), str)
+
+    def load(self) -> None:
+        """Import all of the registered commands, e.g. before forking."""
+        for key in self:
+            self.get(key)
+
+    def find(self, name: str) -> Optional[Callable]:
+        """
+        Get the function of a command which isn't a CommandType.
+
+        The entry points are read on the first call.
+
+        Args:
+            name (str): command name
+
+        Returns:
+            the function or None if there's no such command
+        """
+        if not self._discovered:
+            self._discovered = True
+            for point, spec in iter_entry_points():
+                if point.lower() in REVERSE_CMD_MAP:
+                    continue
+                self._entries.setdefault(point.lower(), spec)
+        return self.get(name.lower())
+
+    def resolve(self, cmd: CommandType, name: str = "") -> Optional[Callable]:
+        """
+        Get the function to call for a Command token.
+
+        Args:
+            cmd (CommandType): type of the command
+            name (str): name of an unknown command
+
+        Returns:
+            the function or None for an unknown command, e.g. a program
+        """
+        if cmd != CommandType.UNKNOWN:
+            return self.get(cmd)
+        if not name:
+            return None
+        return self.find(name=name)
+
+
+# built once, looked up for every command in tokenizer and caller
+CMD_MAP = CommandRegistry(get_cmd_map())
+REVERSE_CMD_MAP = get_reverse_cmd_map()
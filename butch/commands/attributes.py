@@ -0,0 +1,101 @@
+"""Module with the file attributes of /A shared by DIR and DEL."""
+
+import os
+from os import DirEntry
+from stat import (
+    FILE_ATTRIBUTE_ARCHIVE, FILE_ATTRIBUTE_HIDDEN, FILE_ATTRIBUTE_READONLY,
+    FILE_ATTRIBUTE_SYSTEM, S_IWUSR
+)
+from typing import Tuple
+
+from butch.constants import PARAM_FORMAT
+from butch.walker import entry_stat
+
+ATTRIBUTE_BITS = {
+    "h": FILE_ATTRIBUTE_HIDDEN,
+    "s": FILE_ATTRIBUTE_SYSTEM,
+    "r": FILE_ATTRIBUTE_READONLY,
+    "a": FILE_ATTRIBUTE_ARCHIVE
+}
+WINDOWS = os.name == "nt"
+
+# letter of an attribute or a sort order and whether it's negated
+Flags = Tuple[Tuple[str, bool], ...]
+
+# without /A the hidden and the system files are skipped
+DEFAULT_ATTRIBUTES: Flags = (("h", True), ("s", True))
+
+
+def parse_flags(text: str, allowed: str) -> Flags:
+    """
+    Parse the letters of /A or /O.
+
+    Args:
+        text (str): letters, each optionally negated with "-"
+        allowed (str): allowed letters
+
+    Returns:
+        tuple of (letter, negated) pairs
+
+    Raises:
+        ValueError: with the text to print for an unknown letter
+    """
+    flags = []
+    negated = False
+    for letter in text.lstrip(":"):
+        if letter == "-":
+            negated = True
+            continue
+        if letter not in allowed:
+            raise ValueError(PARAM_FORMAT.format(letter))
+        flags.append((letter, negated))
+        negated = False
+    return tuple(flags)
+
+
+def has_attribute(entry: DirEntry, letter: str) -> bool:
+    """
+    Check an item has an attribute of /A.
+
+    Without the Windows attributes, the dot files are hidden, no file
+    is a system one, the files not writable by the owner are read-only
+    and all of the files are ready for archiving.
+
+    Args:
+        entry (DirEntry): item from scandir()
+        letter (str): attribute letter
+
+    Returns:
+        bool
+    """
+    if letter == "d":
+        return entry.is_dir()
+    if letter == "l":
+        return entry.is_symlink()
+    if not WINDOWS and letter in {"h", "s"}:
+        return letter == "h" and entry.name.startswith(".")
+    raw = entry_stat(entry)
+    if raw is None:
+        return False
+    if WINDOWS:
+        return bool(raw.st_file_attributes & ATTRIBUTE_BITS[letter])
+    if letter == "r":
+        return not raw.st_mode & S_IWUSR
+    return letter == "a" and not entry.is_dir()
+
+
+def accepts(entry: DirEntry, attributes: Flags) -> bool:
+    """
+    Check an item passes the /A filter.
+
+    Args:
+        entry (DirEntry): item from scandir()
+        attributes (Flags): required and excluded attributes
+
+    Returns:
+        bool
+    """
+    return all(
+        has_attribute(entry, letter) != negated
+        for letter, negated in attributes
+    )
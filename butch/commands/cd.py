@@ -0,0 +1,44 @@
+"""Module for CD command."""
+
+import sys
+from os import environ
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP, PATH_NOT_FOUND
+from butch.context import Context
+from butch.help import print_help
+
+
+# pylint: disable=invalid-name
+@what_func
+def cmd_cd(params: list, ctx: Context) -> None:
+    """
+    Batch: CD command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    ctx.error_level = 0
+
+    out = get_output(ctx=ctx)
+
+    params_len = len(params)
+    if not params:
+        # linux
+        ctx.cwd = environ.get("HOME")
+        # windows
+        return
+
+    params = expand_params(params=params, ctx=ctx)
+    first = params[0]
+    if params_len == 1 and first == PARAM_HELP:
+        print_help(cmd=CommandType.CD, file=out)
+        return
+
+    try:
+        ctx.cwd = first
+    except FileNotFoundError:
+        ctx.error_level = 1
+        print(PATH_NOT_FOUND, file=sys.stderr)
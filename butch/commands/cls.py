@@ -0,0 +1,29 @@
+"""Module for CLS command."""
+
+from os import environ
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP, OCTAL_CLEAR
+from butch.context import Context
+from butch.help import print_help
+
+
+@what_func
+def cmd_cls(params: list, ctx: Context) -> None:
+    """
+    Batch: CLS command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    ctx.error_level = 0
+    out = get_output(ctx=ctx)
+    params = expand_params(params=params, ctx=ctx)
+
+    first = params[0] if params else ""
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.CLS, file=out)
+        return
+    print(OCTAL_CLEAR if "DEBUG" not in environ else "<clear>", file=out)
@@ -0,0 +1,103 @@
+"""Module with the helpers shared by the commands."""
+
+import sys
+from functools import wraps
+from os.path import exists
+from typing import List
+
+from butch.context import Context
+from butch.expansion import expand_argument
+from butch.logger import emptyf
+from butch.outputs import CommandOutput
+from butch.tokens import Argument
+
+
+LOG_STR = "<cmd: %-8.8s>, params: %r, ctx: %r"
+
+
+def what_func(func):
+    """
+    Command logging decorator.
+
+    Args:
+        func (Callable): function to wrap in the decorator
+
+    Returns:
+        function wrapper
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        ctx = kwargs.get("ctx")
+        if ctx and ctx.trace:
+            ctx.log.debug(LOG_STR, func.__name__, kwargs.get("params"), ctx)
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def expand_params(params: List[Argument], ctx: Context):
+    """
+    Expand the arguments of a command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+
+    Returns:
+        list of str
+    """
+    return [expand_argument(arg=param, ctx=ctx) for param in params]
+
+
+def is_switch(param: str) -> bool:
+    """
+    Check a parameter is a switch and not an absolute POSIX path.
+
+    A path starts with an existing item of the root folder, e.g. "tmp"
+    in /tmp/*.log, which is never a single letter switch.
+
+    Args:
+        param (str): expanded parameter, e.g. "/s/b"
+
+    Returns:
+        bool
+    """
+    if not param.startswith("/"):
+        return False
+    first = param[1:].split("/")[0]
+    return len(first) < 2 or not exists("/" + first)
+
+
+def get_output(ctx: Context):
+    """
+    Get STDOUT buffer according to the Context settings.
+
+    Args:
+        ctx (Context): Context instance
+    """
+    out = sys.stdout
+    log = ctx.log.debug if ctx.trace else emptyf
+    if ctx.collect_output:
+        log("\t- should collect output")
+        if not ctx.output:
+            log("\t\t- using existing output instance")
+            ctx.output = CommandOutput(discard=ctx.discard_output)
+        out = ctx.output.stdout
+    return out
+
+
+def get_error(ctx: Context):
+    """
+    Get STDERR buffer according to the Context settings.
+
+    Args:
+        ctx (Context): Context instance
+    """
+    err = sys.stderr
+    log = ctx.log.debug if ctx.trace else emptyf
+    if ctx.collect_output:
+        log("\t- should collect error")
+        if not ctx.output:
+            log("\t\t- using existing output instance")
+            ctx.output = CommandOutput()
+        err = ctx.output.stderr
+    return err
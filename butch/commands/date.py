@@ -0,0 +1,43 @@
+"""Module for DATE command."""
+
+import sys
+from datetime import datetime
+
+from butch.commands.common import get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+
+
+@what_func
+def cmd_date(params: list, ctx: Context) -> None:
+    """
+    Batch: DATE command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    ctx.error_level = 0
+    out = get_output(ctx=ctx)
+
+    first = params[0].value if params else ""
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.DATE, file=out)
+        return
+
+    now = datetime.now()
+    if first.upper() == "/T":
+        # should match the locale format
+        print(now.strftime("%x"), file=out)
+        return
+
+    now = now.strftime("%a %x")
+    print(f"The current date is: {now}", file=out)
+    print("Enter the new date: (mm-dd-yy)", file=out)
+    print("Setting the date is not implemented, use /T", file=sys.stderr)
+    try:
+        input()
+    except KeyboardInterrupt:
+        ctx.error_level = 1
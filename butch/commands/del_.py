@@ -0,0 +1,448 @@
+"""
+Module for DEL and ERASE commands.
+
+The names are matched with the wildcards of cmd in a single scandir()
+pass per folder and the folders are walked by butch.walker with /S.
+Where the system allows, the files are unlinked relative to the open
+folder, so the path isn't resolved again for every file. On a slow
+(e.g. network) file system BUTCH_DEL_WORKERS threads can unlink
+the files in batches in parallel.
+"""
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+from os import DirEntry, chmod, environ, unlink
+from os.path import abspath, basename, dirname, isdir, join
+from stat import S_IWRITE
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from butch.commands.attributes import (
+    DEFAULT_ATTRIBUTES, Flags, accepts, parse_flags
+)
+from butch.commands.common import (
+    expand_params, get_output, is_switch, what_func
+)
+from butch.commandtype import CommandType
+from butch.constants import (
+    ACCESS_DENIED, DELETE, INVALID_SWITCH, PARAM_HELP, PARAM_YES, SURE,
+    SYNTAX_INCORRECT
+)
+from butch.context import Context
+from butch.help import print_help
+from butch.tokens import Argument
+from butch.walker import walk
+from butch.wildcard import (
+    MATCH_ALL, Matcher, compile_pattern, has_wildcards
+)
+
+DEL_PROMPT = "p"
+DEL_FORCE = "f"
+DEL_SUBFOLDERS = "s"
+DEL_QUIET = "q"
+DEL_ATTRIBUTES = "a"
+DEL_ATTRIBUTE_LETTERS = "rhsa"
+DEL_DELETED = "Deleted file - {}"  # noqa: P103
+DEL_NOT_FOUND = "Could Not Find {}"  # noqa: P103
+
+DEL_WORKERS_ENV = "BUTCH_DEL_WORKERS"
+# files unlinked by a thread at once
+DEL_BATCH = 256
+# batches waiting for a thread, per thread
+DEL_AHEAD = 4
+
+# unlinking relative to an open folder, not on Windows
+DEL_DIR_FD = unlink in os.supports_dir_fd
+DEL_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+# unlinks names of a folder, returns an error or None per name
+Unlinker = Callable[[List[str]], List[Optional[OSError]]]
+
+
+class DelOptions:
+    """Switches of a DEL command."""
+
+    prompt: bool
+    force: bool
+    recursive: bool
+    quiet: bool
+    attributes: Flags
+
+    def __init__(self):
+        """Initialize DelOptions instance with the cmd defaults."""
+        self.prompt = False
+        self.force = False
+        self.recursive = False
+        self.quiet = False
+        self.attributes = DEFAULT_ATTRIBUTES
+
+
+def get_workers() -> int:
+    """
+    Get the number of the threads unlinking the files.
+
+    Returns:
+        BUTCH_DEL_WORKERS, 0 for unlinking in the calling thread
+    """
+    return int(environ.get(DEL_WORKERS_ENV, 0) or 0)
+
+
+def _parse_params(params: List[str]) -> Tuple[DelOptions, List[str]]:
+    """
+    Split the parameters into switches and names.
+
+    Args:
+        params (list): expanded parameters, e.g. "/s/q" or "*.tmp"
+
+    Returns:
+        DelOptions and a list of names
+
+    Raises:
+        ValueError: with the text to print for an invalid switch
+    """
+    options = DelOptions()
+    names = []
+    for param in params:
+        if not is_switch(param):
+            names.append(param.replace('"', ""))
+            continue
+        for switch in param.lower().split("/")[1:]:
+            if switch == DEL_PROMPT:
+                options.prompt = True
+            elif switch == DEL_FORCE:
+                options.force = True
+            elif switch == DEL_SUBFOLDERS:
+                options.recursive = True
+            elif switch == DEL_QUIET:
+                options.quiet = True
+            elif switch[:1] == DEL_ATTRIBUTES:
+                options.attributes = parse_flags(
+                    switch[1:], DEL_ATTRIBUTE_LETTERS
+                )
+            else:
+                raise ValueError(INVALID_SWITCH.format(switch))
+    return options, names
+
+
+def _display(path: str) -> str:
+    """
+    Get a path as shown by cmd.
+
+    Args:
+        path (str): absolute path
+
+    Returns:
+        str
+    """
+    return path.replace("/", "\\")
+
+
+def _ask(text: str, ctx: Context, out) -> bool:
+    """
+    Ask for a confirmation.
+
+    Args:
+        text (str): question
+        ctx (Context): Context instance
+        out: file or standard output
+
+    Returns:
+        whether the answer is yes
+    """
+    if ctx.piped:
+        answer = ctx.input.stdin.read(1)
+        print(f"{text} {answer}", file=out)
+    else:
+        answer = input(f"{text} ")
+    return answer[:1].lower() == PARAM_YES
+
+
+@contextmanager
+def _open_folder(folder: str) -> Iterator[Optional[int]]:
+    """
+    Open a folder for unlinking its files relative to it.
+
+    Args:
+        folder (str): path to the folder
+
+    Yields:
+        file descriptor or None if unsupported or the folder can't
+        be opened
+    """
+    fdes = None
+    if DEL_DIR_FD:
+        try:
+            fdes = os.open(folder, DEL_OPEN_FLAGS)
+        except OSError:
+            pass  # noqa: WPS420
+    try:
+        yield fdes
+    finally:
+        if fdes is not None:
+            os.close(fdes)
+
+
+def _unlink_names(
+        names: List[str], folder: str, fdes: Optional[int], force: bool
+) -> List[Optional[OSError]]:
+    """
+    Unlink files of a folder.
+
+    Args:
+        names (list): names of the files
+        folder (str): path to the folder
+        fdes (int): descriptor of the folder or None
+        force (bool): make read-only files writable if they can't be
+            unlinked (/F)
+
+    Returns:
+        list with an error or None per name
+    """
+    errors: List[Optional[OSError]] = []
+    for name in names:
+        try:
+            if fdes is None:
+                unlink(join(folder, name))
+            else:
+                unlink(name, dir_fd=fdes)
+        except PermissionError as exc:
+            if not force:
+                errors.append(exc)
+                continue
+            try:
+                chmod(join(folder, name), S_IWRITE)
+                unlink(join(folder, name))
+            except OSError as retry_exc:
+                errors.append(retry_exc)
+                continue
+        except OSError as exc:
+            errors.append(exc)
+            continue
+        errors.append(None)
+    return errors
+
+
+def _batches(names: Iterable[str]) -> Iterator[List[str]]:
+    """
+    Group names into batches for unlinking.
+
+    Args:
+        names (Iterable): names of the files
+
+    Yields:
+        lists of at most DEL_BATCH names
+    """
+    names = iter(names)
+    batch = list(islice(names, DEL_BATCH))
+    while batch:
+        yield batch
+        batch = list(islice(names, DEL_BATCH))
+
+
+def _unlink_all(
+        names: Iterable[str], unlink_names: Unlinker, pool=None,
+        ahead: int = 0
+) -> Iterator[Tuple[str, Optional[OSError]]]:
+    """
+    Unlink files in batches, in a pool of threads if any.
+
+    Only a few batches are waiting for the pool, so that the names are
+    read from the folder while the files are being unlinked.
+
+    Args:
+        names (Iterable): names of the files, e.g. streamed from scandir()
+        unlink_names (Unlinker): function unlinking a batch
+        pool (ThreadPoolExecutor): pool or None
+        ahead (int): number of batches submitted ahead to the pool
+
+    Yields:
+        (name, error or None) pairs in the order of the names
+    """
+    if pool is None:
+        for batch in _batches(names):
+            yield from zip(batch, unlink_names(batch))
+        return
+
+    pending = deque()
+    for batch in _batches(names):
+        pending.append((batch, pool.submit(unlink_names, batch)))
+        if len(pending) >= ahead:
+            batch, future = pending.popleft()
+            yield from zip(batch, future.result())
+    while pending:
+        batch, future = pending.popleft()
+        yield from zip(batch, future.result())
+
+
+def _iter_files(
+        entries: Iterable[DirEntry], match: Matcher, options: DelOptions,
+        ctx: Context, out
+) -> Iterator[str]:
+    """
+    Select the files to delete from a folder.
+
+    Args:
+        entries (Iterable): DirEntry instances
+        match (Matcher): name filter
+        options (DelOptions): switches
+        ctx (Context): Context instance
+        out: file or standard output
+
+    Yields:
+        names of the files
+    """
+    for entry in entries:
+        if entry.is_dir() or not match(entry.name):
+            continue
+        if not accepts(entry, options.attributes):
+            continue
+        if options.prompt and not _ask(
+                text=f"{_display(entry.path)}, {DELETE}", ctx=ctx, out=out
+        ):
+            continue
+        yield entry.name
+
+
+def _delete(
+        folder: str, pattern: str, options: DelOptions, ctx: Context,
+        out, pool=None
+) -> int:
+    """
+    Delete the files matching a pattern in a folder or its tree.
+
+    Args:
+        folder (str): absolute path to the folder
+        pattern (str): name with or without wildcards
+        options (DelOptions): switches
+        ctx (Context): Context instance
+        out: file or standard output
+        pool (ThreadPoolExecutor): pool for unlinking or None
+
+    Returns:
+        number of the files found
+    """
+    match = compile_pattern(pattern)
+    ahead = DEL_AHEAD * get_workers()
+    found = 0
+    for path, entries in walk(root=folder, recursive=options.recursive):
+        names = _iter_files(
+            entries=entries, match=match, options=options, ctx=ctx, out=out
+        )
+        with _open_folder(path) as fdes:
+            unlink_names = partial(
+                _unlink_names, folder=path, fdes=fdes, force=options.force
+            )
+            for name, error in _unlink_all(
+                    names=names, unlink_names=unlink_names, pool=pool,
+                    ahead=ahead
+            ):
+                found += 1
+                file_path = _display(join(path, name))
+                if error is None:
+                    if options.recursive:
+                        print(DEL_DELETED.format(file_path), file=out)
+                elif not isinstance(error, FileNotFoundError):
+                    print(file_path, ACCESS_DENIED, sep="\n", file=sys.stderr)
+    return found
+
+
+def _delete_name(
+        name: str, options: DelOptions, ctx: Context, out, pool=None
+) -> None:
+    """
+    Delete the files of a DEL parameter.
+
+    Args:
+        name (str): file, folder or a name with wildcards
+        options (DelOptions): switches
+        ctx (Context): Context instance
+        out: file or standard output
+        pool (ThreadPoolExecutor): pool for unlinking or None
+    """
+    path = abspath(name.replace("\\", "/"))
+    folder, pattern = dirname(path), basename(path)
+    whole = not has_wildcards(pattern) and isdir(path)
+    if whole:
+        # a folder means all of its files
+        folder, pattern = path, "*"
+
+    asks = options.prompt or not options.quiet
+    if asks and (whole or pattern in MATCH_ALL):
+        text = f"{_display(join(folder, '*'))}, {SURE}"
+        if not _ask(text=text, ctx=ctx, out=out):
+            return
+
+    literal = not has_wildcards(pattern) and not options.recursive
+    if literal and options.attributes == DEFAULT_ATTRIBUTES:
+        # a single file, no need to look through the folder
+        if options.prompt and not _ask(
+                text=f"{_display(path)}, {DELETE}", ctx=ctx, out=out
+        ):
+            return
+        error = _unlink_names(
+            names=[pattern], folder=folder, fdes=None, force=options.force
+        )[0]
+        if isinstance(error, FileNotFoundError):
+            print(DEL_NOT_FOUND.format(_display(path)), file=sys.stderr)
+        elif error is not None:
+            print(_display(path), ACCESS_DENIED, sep="\n", file=sys.stderr)
+        return
+
+    found = _delete(
+        folder=folder, pattern=pattern, options=options, ctx=ctx, out=out,
+        pool=pool
+    )
+    if not found and not whole:
+        print(DEL_NOT_FOUND.format(_display(path)), file=sys.stderr)
+
+
+@what_func
+def cmd_del(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: DEL/ERASE command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+    params = expand_params(params=params, ctx=ctx)
+
+    if len(params) == 1 and params[0].lower() == PARAM_HELP:
+        print_help(cmd=CommandType.DEL, file=out)
+        return
+
+    try:
+        options, names = _parse_params(params)
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        ctx.error_level = 1
+        ctx.piped = False
+        return
+
+    if not names:
+        print(SYNTAX_INCORRECT, file=out)
+        ctx.error_level = 1
+        ctx.piped = False
+        return
+
+    workers = get_workers()
+    pool = None
+    if workers:
+        pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="butch-del"
+        )
+    try:
+        for name in names:
+            _delete_name(
+                name=name, options=options, ctx=ctx, out=out, pool=pool
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    ctx.error_level = 0
+    ctx.piped = False
@@ -0,0 +1,431 @@
+"""Module for DIR command."""
+
+import sys
+from collections import defaultdict
+from functools import lru_cache, partial
+from itertools import chain
+from os import DirEntry, getcwd, stat, statvfs, stat_result
+from os.path import abspath, basename, dirname, isdir, join, splitext
+from time import localtime, strftime
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from butch.commands.attributes import (
+    DEFAULT_ATTRIBUTES, Flags, accepts, parse_flags
+)
+from butch.commands.common import (
+    expand_params, get_output, is_switch, what_func
+)
+from butch.commandtype import CommandType
+from butch.constants import (
+    INVALID_SWITCH, NO_FILE_FOUND, NOT_SUPPORTED, PARAM_HELP
+)
+from butch.context import Context
+from butch.help import print_help
+from butch.tokens import Argument
+from butch.walker import entry_stat, walk
+from butch.wildcard import compile_pattern, has_wildcards
+
+
+DIR_FORMAT_TOTAL_SIZE_RJUST = 14
+DIR_FORMAT_FILE_COUNT_RJUST = 17
+DIR_FORMAT_FOLDER_COUNT_RJUST = 18
+DIR_FORMAT_FREE_BYTES_RJUST = 14
+DIR_FORMAT_FOLDER_SYMBOL_LJUST = 14
+DIR_FORMAT_FILE_BYTES_RJUST = 14
+DIR_FORMAT_DATE = "%x  %X"
+DIR_THOUSANDS_SEPARATOR = ","
+
+DIR_SUBFOLDERS = "s"
+DIR_BARE = "b"
+DIR_ATTRIBUTES = "a"
+DIR_ORDER = "o"
+# valid switches of cmd which aren't supported
+DIR_UNSUPPORTED = frozenset("cdlnpqtwx4")
+# /O without a sort order, directories first, then by name
+DIR_DEFAULT_ORDER = "gn"
+DIR_ATTRIBUTE_LETTERS = "dhsral"
+
+
+class DirOptions:
+    """Switches of a DIR command."""
+
+    bare: bool
+    recursive: bool
+    attributes: Flags
+    order: Flags
+
+    def __init__(self):
+        """Initialize DirOptions instance with the cmd defaults."""
+        self.bare = False
+        self.recursive = False
+        self.attributes = DEFAULT_ATTRIBUTES
+        self.order = ()
+
+
+def _parse_params(params: List[str]) -> Tuple[DirOptions, List[str]]:
+    """
+    Split the parameters into switches and paths.
+
+    Args:
+        params (list): expanded parameters, e.g. "/s/b" or "*.txt"
+
+    Returns:
+        DirOptions and a list of paths
+
+    Raises:
+        ValueError: with the text to print for an invalid or unsupported
+            switch
+    """
+    options = DirOptions()
+    paths = []
+    for param in params:
+        if not is_switch(param):
+            paths.append(param.replace('"', ""))
+            continue
+        for switch in param.lower().split("/")[1:]:
+            letter, rest = switch[:1], switch[1:]
+            if switch == DIR_SUBFOLDERS:
+                options.recursive = True
+            elif switch == DIR_BARE:
+                options.bare = True
+            elif letter == DIR_ATTRIBUTES:
+                options.attributes = parse_flags(rest, DIR_ATTRIBUTE_LETTERS)
+            elif letter == DIR_ORDER:
+                options.order = parse_flags(
+                    rest or DIR_DEFAULT_ORDER, "nsedg"
+                )
+            elif letter in DIR_UNSUPPORTED:
+                raise ValueError(NOT_SUPPORTED.format(switch))
+            else:
+                raise ValueError(INVALID_SWITCH.format(switch))
+    return options, paths
+
+
+def _size(entry: DirEntry) -> int:
+    """
+    Get the size of an item for sorting.
+
+    Args:
+        entry (DirEntry): item from scandir()
+
+    Returns:
+        number of bytes, 0 for a folder
+    """
+    raw = entry_stat(entry)
+    if raw is None or entry.is_dir():
+        return 0
+    return raw.st_size
+
+
+def _time(entry: DirEntry) -> float:
+    """
+    Get the listed time of an item for sorting.
+
+    Args:
+        entry (DirEntry): item from scandir()
+
+    Returns:
+        timestamp
+    """
+    raw = entry_stat(entry)
+    return raw.st_ctime if raw else 0
+
+
+DIR_SORT_KEYS: Dict[str, Callable[[DirEntry], object]] = {
+    "n": lambda entry: entry.name.lower(),
+    "e": lambda entry: splitext(entry.name)[1].lower(),
+    "g": lambda entry: not entry.is_dir(),
+    "s": _size,
+    "d": _time
+}
+
+
+def _sort_entries(entries: List[DirEntry], order: Flags) -> None:
+    """
+    Sort the items of a folder in place by the /O order.
+
+    Args:
+        entries (list): DirEntry instances
+        order (Flags): sort keys, the first one is the most significant
+    """
+    # the sort is stable, the least significant key goes first
+    for letter, negated in reversed(order):
+        entries.sort(key=DIR_SORT_KEYS[letter], reverse=negated)
+
+
+def _format_number(number: int) -> str:
+    """
+    Format a number with the thousands separator of DIR.
+
+    The process-wide locale isn't switched for that, unlike with "{0:n}".
+
+    Args:
+        number (int): number of bytes
+
+    Returns:
+        str
+    """
+    return f"{number:,}".replace(",", DIR_THOUSANDS_SEPARATOR)
+
+
+@lru_cache(maxsize=1024)
+def _format_date(stamp: int) -> str:
+    """
+    Format a timestamp, cached as the files tend to share them.
+
+    Args:
+        stamp (int): seconds since the epoch
+
+    Returns:
+        str with the date and the time
+    """
+    return strftime(DIR_FORMAT_DATE, localtime(stamp))
+
+
+def _format_line(name: str, raw: stat_result, is_dir: bool) -> str:
+    """
+    Format a line of the listing.
+
+    Args:
+        name (str): name of the file or the folder
+        raw (stat_result): stat of the item
+        is_dir (bool): whether the item is a folder
+
+    Returns:
+        str
+    """
+    cdate = _format_date(int(raw.st_ctime))
+    if is_dir:
+        dir_text = "<DIR>".ljust(DIR_FORMAT_FOLDER_SYMBOL_LJUST)
+        size = ""
+    else:
+        dir_text = ""
+        size = _format_number(raw.st_size).rjust(DIR_FORMAT_FILE_BYTES_RJUST)
+    return f"{cdate}    {dir_text}  {size} {name}"
+
+
+def _format_files(files: int, size: int) -> str:
+    """
+    Format the line with the number and the size of the files.
+
+    Args:
+        files (int): number of files
+        size (int): bytes of the files
+
+    Returns:
+        str
+    """
+    file_count = str(files).rjust(DIR_FORMAT_FILE_COUNT_RJUST)
+    used_bytes = _format_number(size).rjust(DIR_FORMAT_TOTAL_SIZE_RJUST)
+    return f"{file_count} File(s){used_bytes} bytes"
+
+
+def _display(path: str) -> str:
+    """
+    Get a path as shown in the listing header.
+
+    Args:
+        path (str): absolute path
+
+    Returns:
+        str
+    """
+    return path.replace("/", "\\")
+
+
+def _accepts_dots(attributes: Flags) -> bool:
+    """
+    Check "." and ".." pass the /A filter, they are plain folders.
+
+    Args:
+        attributes (Flags): required and excluded attributes
+
+    Returns:
+        bool
+    """
+    return all(
+        (letter == "d") != negated for letter, negated in attributes
+    )
+
+
+def _iter_bare(
+        folders: Iterable[Tuple[str, Iterable[DirEntry]]],
+        match: Callable[[str], object], options: DirOptions
+) -> Iterator[str]:
+    """
+    Stream the lines of /B, the names or with /S the full paths.
+
+    Args:
+        folders (Iterable): (path, items) pairs from walk()
+        match (Callable): name filter
+        options (DirOptions): switches
+
+    Yields:
+        str lines without a line break
+    """
+    for _, entries in folders:
+        for entry in entries:
+            if not match(entry.name) or not accepts(
+                    entry, options.attributes
+            ):
+                continue
+            yield entry.path if options.recursive else entry.name
+
+
+def _get_listdir_lines(
+        folder: str, ctx: Context, options: DirOptions = None,
+        pattern: str = "*"
+) -> Iterator[str]:
+    """
+    Stream the lines of a folder listing.
+
+    The items are listed in the order of the file system unless sorted
+    by /O, only a sorted folder is held in memory. The folder flag comes
+    with the item from scandir() and at most a single stat() is necessary
+    per item, none on Windows. With /S the subfolders are read ahead
+    in threads.
+
+    Args:
+        folder (str): path to the folder
+        ctx (Context): Context instance
+        options (DirOptions): switches, the defaults if None
+        pattern (str): wildcards for the names of the items
+
+    Yields:
+        str lines without a line break
+
+    Raises:
+        FileNotFoundError: when the folder is missing or, after the lines
+            of the header, when no item matched
+    """
+    # pylint: disable=too-many-locals
+    options = options or DirOptions()
+    folder = abspath(folder)
+    if not isdir(folder):
+        raise FileNotFoundError(folder)
+    match = compile_pattern(pattern)
+    folders = walk(
+        root=folder, recursive=options.recursive,
+        with_stat=not options.bare or any(
+            letter in {"s", "d", "r", "a"}
+            for letter, _ in options.order + options.attributes
+        ),
+        sort=partial(_sort_entries, order=options.order)
+        if options.order else None
+    )
+    if options.bare:
+        found = False
+        for line in _iter_bare(folders=folders, match=match, options=options):
+            found = True
+            yield line
+        if not found:
+            raise FileNotFoundError(folder)
+        return
+
+    yield " Volume in drive <NYI> has no label."
+    yield " Volume Serial Number is <NYI>"
+
+    total = defaultdict(int)
+    dots = match(".") and _accepts_dots(options.attributes)
+    for path, entries in folders:
+        entries = (
+            entry for entry in entries
+            if match(entry.name) and accepts(entry, options.attributes)
+        )
+        first = next(entries, None)
+        if first is None and (options.recursive or not dots):
+            continue
+        if first is not None:
+            entries = chain((first, ), entries)
+
+        count = defaultdict(int)
+        yield ""
+        yield f" Directory of {_display(path)}"
+        yield ""
+        if dots:
+            count["folders"] = 2
+            yield _format_line(name=".", raw=stat(path), is_dir=True)
+            yield _format_line(
+                name="..", raw=stat(join(path, "..")), is_dir=True
+            )
+        for entry in entries:
+            raw = entry_stat(entry)
+            if raw is None:
+                continue
+            is_dir = entry.is_dir()
+            if is_dir:
+                count["folders"] += 1
+            else:
+                count["files"] += 1
+                count["total_size"] += raw.st_size
+            yield _format_line(name=entry.name, raw=raw, is_dir=is_dir)
+        yield _format_files(files=count["files"], size=count["total_size"])
+        for key, value in count.items():
+            total[key] += value
+
+    if not total:
+        raise FileNotFoundError(folder)
+    if options.recursive:
+        yield ""
+        yield "     Total Files Listed:"
+        yield _format_files(files=total["files"], size=total["total_size"])
+
+    free_bytes = statvfs(folder)
+    free_bytes = _format_number(free_bytes.f_frsize * free_bytes.f_bavail)
+    free_bytes = free_bytes.rjust(DIR_FORMAT_FREE_BYTES_RJUST)
+    folder_count = str(total["folders"]).rjust(DIR_FORMAT_FOLDER_COUNT_RJUST)
+    yield f"{folder_count} Dir(s){free_bytes} bytes free"
+
+
+def _split_path(path: str) -> Tuple[str, str]:
+    """
+    Split a path argument into the folder and the wildcards.
+
+    Args:
+        path (str): folder, file or a path with wildcards
+
+    Returns:
+        folder and pattern
+    """
+    path = path.replace("\\", "/")
+    if not has_wildcards(path) and isdir(path):
+        return path, "*"
+    return dirname(path) or getcwd(), basename(path)
+
+
+@what_func
+def cmd_dir(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: DIR command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+    params = expand_params(params=params, ctx=ctx)
+
+    if len(params) == 1 and params[0].lower() == PARAM_HELP:
+        print_help(cmd=CommandType.DIR, file=out)
+        return
+
+    try:
+        options, paths = _parse_params(params)
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        ctx.error_level = 1
+        return
+
+    ctx.error_level = 0
+    targets = [_split_path(path) for path in paths] or [(getcwd(), "*")]
+    for folder, pattern in targets:
+        lines = _get_listdir_lines(
+            folder=folder, ctx=ctx, options=options, pattern=pattern
+        )
+        try:
+            # line by line for huge folders
+            for line in lines:
+                print(line, file=out)
+        except FileNotFoundError:
+            print(NO_FILE_FOUND, file=sys.stderr)
+            ctx.error_level = 1
@@ -0,0 +1,45 @@
+"""Module for ECHO command."""
+
+from typing import List
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP, ECHO_STATE
+from butch.context import Context
+from butch.help import print_help
+from butch.tokens import Argument
+
+
+@what_func
+def cmd_echo(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: ECHO command.
+
+    Must NOT set error level to 0.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+
+    params = expand_params(params=params, ctx=ctx)
+    params_len = len(params)
+    state_map = {True: "on", False: "off"}
+    state_rev = {state: key for key, state in state_map.items()}
+
+    if params_len == 1:
+        first = params[0].lower()
+        if first in ("on", "off"):
+            ctx.echo = state_rev[first]
+            return
+        if first == PARAM_HELP:
+            print_help(cmd=CommandType.ECHO, file=out)
+            return
+
+    if not params_len:
+        echo_state = state_map[ctx.echo]
+        print(ECHO_STATE.format(echo_state), file=out)
+        return
+
+    print(*params, file=out)
@@ -0,0 +1,27 @@
+"""Module for ENDLOCAL command."""
+
+from butch.commands.common import get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+
+
+@what_func
+def cmd_endlocal(params: list, ctx: Context) -> None:
+    """
+    Batch: ENDLOCAL command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+
+    first = params[0].value if params else ""
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.ENDLOCAL, file=out)
+        return
+
+    # without a SETLOCAL there's nothing to restore and it's not an error
+    ctx.pop_scope()
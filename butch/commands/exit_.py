@@ -0,0 +1,38 @@
+"""Module for EXIT command."""
+
+import sys
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+
+
+@what_func
+def cmd_exit(params: list, ctx: Context) -> None:
+    """
+    Batch: EXIT command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    ctx.error_level = 0
+    out = get_output(ctx=ctx)
+    params = expand_params(params=params, ctx=ctx)
+
+    if not params:
+        sys.exit(0)
+        return
+
+    first = params[0]
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.EXIT, file=out)
+        return
+
+    if "/B" in params:
+        params.remove("/B")
+
+    ctx.error_level = int(params[0])
+    sys.exit(ctx.error_level)
@@ -0,0 +1,88 @@
+"""Module for running the programs and Batch files from PATH."""
+
+import sys
+from typing import List
+
+from butch.commands.common import expand_params, get_output
+from butch.constants import NOT_RECOGNIZED
+from butch.context import Context
+from butch.external import NOT_FOUND_LEVEL, is_batch, run_program
+from butch.tokens import Argument
+
+
+def find_external(name: str, ctx: Context):
+    """
+    Find a program or a Batch file by its name in PATH of a Context.
+
+    Args:
+        name (str): command name
+        ctx (Context): Context instance
+
+    Returns:
+        path or None if not found
+    """
+    return ctx.command_cache.resolve(
+        name=name, path=ctx.get_variable("PATH"),
+        pathext=ctx.get_variable("PATHEXT")
+    )
+
+
+def program_args(args: List[str]) -> List[str]:
+    """
+    Convert expanded arguments to the arguments of a program.
+
+    Args:
+        args (list): expanded arguments
+
+    Returns:
+        list of arguments without the quotes
+    """
+    # quotes only group the words, programs don't see them
+    return [arg.replace('"', "") for arg in args]
+
+
+def run_external(name: str, params: List[Argument], ctx: Context) -> None:
+    """
+    Run a program or a Batch file found in PATH for an unknown command.
+
+    A Batch file runs in the same Context like a nested one with its own
+    %0..%9, a program gets the variables as its environment and its exit
+    code sets ERRORLEVEL. A program which can't be started sets
+    ERRORLEVEL 1.
+
+    Args:
+        name (str): command name as written
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    path = find_external(name=name, ctx=ctx)
+    if path is None:
+        print(NOT_RECOGNIZED.format(name), file=sys.stderr)
+        ctx.error_level = NOT_FOUND_LEVEL
+        return
+
+    args = expand_params(params=params, ctx=ctx)
+    if is_batch(path):
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from butch.handler import handle_file
+
+        # %0..%9 with the quotes, like for CALL
+        old_arguments = ctx.arguments
+        ctx.arguments = [name, *args]
+        try:
+            handle_file(path=path, ctx=ctx)
+        finally:
+            ctx.arguments = old_arguments
+        return
+
+    try:
+        ctx.error_level = run_program(
+            argv=[path, *program_args(args)],
+            env=ctx.command_cache.environment(variables=ctx.variables),
+            stdin=ctx.input.stdin if ctx.inputted else None,
+            stdout=get_output(ctx)
+        )
+    except OSError as exc:
+        # e.g. not executable or a script without a shebang
+        print(str(exc), file=sys.stderr)
+        ctx.error_level = 1
@@ -0,0 +1,41 @@
+"""Module for GOTO command."""
+
+from typing import List
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+from butch.jumptype import JumpType, JumpTypeEof
+from butch.tokens import Argument
+
+
+@what_func
+def cmd_goto(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: GOTO command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+    params = expand_params(params=params, ctx=ctx)
+    params_len = len(params)
+
+    if not params_len:
+        ctx.error_level = 1
+        return
+
+    first = params[0]
+    first_lower = first.lower()
+    if first_lower == PARAM_HELP:
+        print_help(cmd=CommandType.GOTO, file=out)
+        return
+
+    if first_lower == JumpTypeEof._target:
+        ctx.jump = JumpTypeEof()
+        return
+
+    ctx.jump = JumpType(target=first)
@@ -0,0 +1,55 @@
+"""Module for HELP command."""
+
+import sys
+from typing import List
+
+from butch.commands import REVERSE_CMD_MAP
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import HELP_NOT_FOUND, PARAM_HELP, SYNTAX_INCORRECT
+from butch.context import Context
+from butch.help import print_all, print_found, print_help
+from butch.tokens import Argument
+
+HELP_ALL = "/all"
+HELP_KEYWORD = "/k"
+
+
+@what_func
+def cmd_help(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: HELP command.
+
+    Besides a command's help, /ALL prints all of them and /K keyword lists
+    the commands mentioning the keyword.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+
+    params = expand_params(params=params, ctx=ctx)
+    first = params[0].lower() if params else PARAM_HELP
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.HELP, file=out)
+        return
+
+    if first == HELP_ALL:
+        print_all(file=out)
+        return
+
+    if first == HELP_KEYWORD:
+        keyword = " ".join(params[1:])
+        if not keyword:
+            print(SYNTAX_INCORRECT, file=sys.stderr)
+            ctx.error_level = 1
+            return
+        if not print_found(keyword=keyword, file=out):
+            print(HELP_NOT_FOUND.format(keyword), file=sys.stderr)
+            ctx.error_level = 1
+        return
+
+    print_help(
+        cmd=REVERSE_CMD_MAP.get(first, CommandType.UNKNOWN), file=out
+    )
@@ -0,0 +1,60 @@
+"""Module for MKDIR and MD commands."""
+
+import sys
+from os import makedirs
+from os.path import abspath
+from typing import List
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP, PATH_EXISTS, SYNTAX_INCORRECT
+from butch.context import Context
+from butch.help import print_help
+from butch.tokens import Argument
+
+
+@what_func
+def cmd_mkdir(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: MKDIR/MD command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+    params = expand_params(params=params, ctx=ctx)
+    params_len = len(params)
+
+    if not params_len:
+        # do this also for piped input as mkdir does not care about pipes
+        # echo hello | mkdir -> syntax incorrect
+        print(SYNTAX_INCORRECT, file=sys.stderr)
+        ctx.error_level = 1
+        return
+
+    if params_len == 1:
+        first = params[0]
+        if first.lower() == PARAM_HELP:
+            print_help(cmd=CommandType.MKDIR, file=out)
+            return
+        first = first.replace("\\", "/")
+        dir_path = abspath(first)
+        try:
+            makedirs(dir_path)
+            ctx.error_level = 0
+        except FileExistsError:
+            print(PATH_EXISTS.format(first), file=sys.stderr)
+            ctx.error_level = 1
+        return
+
+    failed = False
+    for param in params:
+        try:
+            makedirs(param)
+        except FileExistsError:
+            print(PATH_EXISTS.format(param), file=sys.stderr)
+            failed = True
+
+    ctx.error_level = failed
+    ctx.piped = False
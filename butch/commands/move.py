@@ -0,0 +1,123 @@
+"""Module for MOVE command."""
+
+import sys
+from os import rename
+from os.path import abspath, exists, isdir, join
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import (
+    FILE_NOT_FOUND, PARAM_HELP, PATH_NOT_FOUND, SYNTAX_INCORRECT,
+    MULTI_TO_SINGLE
+)
+from butch.context import Context
+from butch.help import print_help
+from butch.logger import emptyf
+
+
+@what_func
+def cmd_move(params: list, ctx: Context) -> None:
+    """
+    Batch: MOVE command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    # pylint: disable=import-outside-toplevel
+    from glob import glob
+    from shutil import move, _basename
+
+    ctx.error_level = 0
+    out = get_output(ctx=ctx)
+    log = ctx.log.debug if ctx.trace else emptyf
+    params = expand_params(params=params, ctx=ctx)
+    params = [param.replace("\\", "/") for param in params]
+    params_len = len(params)
+
+    # move
+    if not params_len:
+        print(SYNTAX_INCORRECT, file=sys.stderr)
+        ctx.error_level = 1
+        ctx.piped = False
+        return
+
+    # move [<anything> ...] /?
+    if PARAM_HELP in params:
+        print_help(cmd=CommandType.MOVE, file=out)
+        ctx.piped = False
+        return
+
+    suppress = "/Y" in params or "/y" in params
+    prompt = "/-Y" in params or "/-y" in params
+
+    params = [
+        param for param in params
+        if param not in ("/Y", "/y", "/-Y", "/-y")
+    ]
+    *sources, target = params
+
+    # disable multiple values for source, but allow wildcards
+    if len(sources) > 1:
+        print(SYNTAX_INCORRECT, file=sys.stderr)
+        ctx.error_level = 1
+        ctx.piped = False
+        return
+
+    source = abspath(sources[0])
+    dest_slash = target.endswith("/")
+    dest = abspath(target)
+
+    # move nonexisting [...]
+    if not exists(source) and not all(src for src in glob(source) or [False]):
+        print(FILE_NOT_FOUND, file=sys.stderr)
+        ctx.error_level = 1
+        ctx.piped = False
+        return
+
+    dest_exists = exists(dest)
+    dest_isdir = dest_slash or isdir(dest)
+    # move <anything> nonexisting
+    if not dest_exists:
+        patterns = glob(source)
+        # move <anything> folder\
+        if dest_isdir:
+            print(PATH_NOT_FOUND, file=sys.stderr)
+            if len(patterns) > 1:
+                print("\t0 file(s) moved.", file=out)
+            ctx.error_level = 1
+            ctx.piped = False
+            return
+
+        # move *.py newfile = fail
+        if len(patterns) > 1:
+            print(MULTI_TO_SINGLE, file=sys.stderr)
+            ctx.error_level = 1
+            ctx.piped = False
+            return
+
+        # move singlefile newname
+        rename(patterns[0], dest)
+        ctx.error_level = 0
+        ctx.piped = False
+        return
+
+    patterns = glob(source)
+    if len(patterns) > 1 and dest_isdir:
+        pass_all = False
+        for src in patterns:
+            new_name = join(dest, _basename(src))
+            if not exists(new_name):
+                move(src, dest)
+                continue
+            if not pass_all and not suppress:
+                answer = input(f"Overwrite {new_name}? (Yes/No/All)")
+                answer = answer.lower()[:3]
+                if "all" in answer:
+                    pass_all = True
+                if not pass_all and "yes" not in answer:
+                    continue
+            rename(abspath(src), new_name)
+        ctx.error_level = 0
+        ctx.piped = False
+        return
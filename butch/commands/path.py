@@ -0,0 +1,43 @@
+"""Module for PATH command."""
+
+from typing import List
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+from butch.tokens import Argument
+
+
+@what_func
+def cmd_path(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: PATH command.
+
+    Must NOT set errorlevel.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+
+    params = expand_params(params=params, ctx=ctx)
+    params_len = len(params)
+
+    if not params_len:
+        path = ctx.get_variable("PATH") or "(null)"
+        print(f"PATH={path}", file=out)
+        return
+
+    first = params[0].lower()
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.PATH, file=out)
+        return
+
+    if first == ";":
+        ctx.delete_variable(key="PATH")
+        return
+
+    ctx.set_variable(key="PATH", value_to_set=" ".join(params))
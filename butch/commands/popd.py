@@ -0,0 +1,40 @@
+"""Module for POPD command."""
+
+from typing import List
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+from butch.logger import emptyf
+from butch.tokens import Argument
+
+
+@what_func
+def cmd_popd(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: POPD command.
+
+    Must NOT set errorlevel.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    log = ctx.log.debug if ctx.trace else emptyf
+    out = get_output(ctx=ctx)
+
+    params = expand_params(params=params, ctx=ctx)
+
+    first = params[0].lower() if params else ""
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.POPD, file=out)
+        return
+
+    try:
+        ctx.cwd = ctx.pop_folder()
+    except FileNotFoundError:
+        log("Folder for POPD not found, ignoring.")
+    except IndexError:
+        log("Empty popd history, ignoring.")
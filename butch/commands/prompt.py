@@ -0,0 +1,35 @@
+"""Module for PROMPT command."""
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+
+
+@what_func
+def cmd_prompt(params: list, ctx: Context) -> None:
+    """
+    Batch: PROMPT command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    ctx.error_level = 0
+
+    out = get_output(ctx=ctx)
+
+    params_len = len(params)
+    if not params_len:
+        ctx.error_level = 1
+        print(file=out)
+        return
+
+    params = expand_params(params=params, ctx=ctx)
+    first = params[0]
+    if params_len == 1 and first == PARAM_HELP:
+        print_help(cmd=CommandType.PROMPT, file=out)
+        return
+    text = first
+    ctx.prompt = text
@@ -0,0 +1,44 @@
+"""Module for PUSHD command."""
+
+import sys
+from typing import List
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP, PATH_NOT_FOUND
+from butch.context import Context
+from butch.help import print_help
+from butch.tokens import Argument
+
+
+@what_func
+def cmd_pushd(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: PUSHD command.
+
+    Must NOT set error_level on empty param list.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+
+    params = expand_params(params=params, ctx=ctx)
+    params_len = len(params)
+
+    if not params_len:
+        print(file=out)
+        return
+
+    first = params[0].lower()
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.PUSHD, file=out)
+        return
+
+    path = " ".join(params)
+    try:
+        ctx.push_folder(path=path)
+    except FileNotFoundError:
+        ctx.error_level = 1
+        print(PATH_NOT_FOUND, file=sys.stderr)
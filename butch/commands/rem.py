@@ -0,0 +1,31 @@
+"""Module for REM command."""
+
+from typing import List
+
+from butch.commands.common import get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+from butch.tokens import Argument
+
+
+@what_func
+def cmd_rem(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: REM command.
+
+    Must NOT modify errorlevel.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+    params_len = len(params)
+    if not params_len:
+        return
+
+    params = [param.value for param in params]
+    if params_len == 1 and params[0] == PARAM_HELP:
+        print_help(cmd=CommandType.REM, file=out)
@@ -0,0 +1,76 @@
+"""Module for RMDIR and RD commands."""
+
+from os import listdir
+from os.path import isdir
+from typing import List
+
+from butch.commands.common import expand_params, what_func
+from butch.commandtype import CommandType
+from butch.constants import (
+    DIR_INVALID, DIR_NONEMPTY, PARAM_HELP, PARAM_YES, SURE, SYNTAX_INCORRECT
+)
+from butch.context import Context
+from butch.help import print_help
+from butch.logger import emptyf
+from butch.tokens import Argument
+
+
+@what_func
+def cmd_rmdir(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: RMDIR command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    # pylint: disable=too-many-branches
+    log = ctx.log.debug if ctx.trace else emptyf
+
+    params = expand_params(params=params, ctx=ctx)
+    params_len = len(params)
+
+    if not params_len:
+        print(SYNTAX_INCORRECT)
+        ctx.error_level = 0
+        return
+
+    is_help = False
+    ignore_files = False
+    quiet = False
+    out = []
+    while params:
+        current_param = params.pop(0)
+        item_low = current_param.lower()
+        if current_param == PARAM_HELP:
+            is_help = True
+        elif item_low == "/s":
+            ignore_files = True
+        elif item_low == "/q":
+            quiet = True
+        else:
+            out.append(current_param)
+
+    if is_help:
+        print_help(cmd=CommandType.RMDIR)
+        return
+
+    for param in out:
+        if not isdir(param):
+            log("got %r, is not dir", param)
+            print(DIR_INVALID)
+            continue
+        if listdir(param):
+            if not ignore_files:
+                print(DIR_NONEMPTY)
+                continue
+            text = f"{param}, {SURE}"
+            if ctx.piped:
+                answer = ctx.input.stdin.read(1)
+                print(f"{text} {answer}")
+            else:
+                answer = PARAM_YES if quiet else input(f"{text} ").lower()
+            if answer != PARAM_YES:
+                continue
+        from shutil import rmtree  # pylint: disable=import-outside-toplevel
+        rmtree(param)
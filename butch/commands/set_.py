@@ -0,0 +1,110 @@
+"""Module for SET command."""
+
+import sys
+from typing import List
+
+from butch.commands.common import get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import ENV_VAR_UNDEFINED, PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+from butch.logger import emptyf
+from butch.tokens import Argument
+
+
+def _print_all_variables(ctx: Context, file=sys.stdout) -> None:
+    for key, found_value in ctx.variables.items():
+        print(f"{key}={found_value}", file=file)
+
+
+def _print_single_variable(key: str, ctx: Context, file=sys.stdout) -> None:
+    # SET P lists all defined variables starting with P
+    found = [
+        (name, found_value)
+        for name, found_value in ctx.variables.prefixed(prefix=key)
+        if found_value
+    ]
+    if not found:
+        found_value = ctx.get_variable(key=key)
+        if not found_value:
+            print(ENV_VAR_UNDEFINED, file=file)
+            return
+        found = [(key, found_value)]
+    for name, found_value in found:
+        print(f"{name}={found_value}", file=file)
+
+
+@what_func
+def cmd_set(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: SET command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    ctx.error_level = 0
+    log = ctx.log.debug if ctx.trace else emptyf
+    out = get_output(ctx=ctx)
+
+    should_prompt = False
+
+    params_len = len(params)
+    if not params_len:
+        _print_all_variables(ctx=ctx, file=out)
+        return
+
+    param = params[0]
+    quoted = param.quoted
+    param_value = param.value
+    if params_len == 1 and param_value == PARAM_HELP:
+        print_help(cmd=CommandType.SET, file=out)
+        return
+
+    if params_len >= 2 and param_value.lower() == "/p":
+        should_prompt = True
+        param_value = " ".join(param.value for param in params[1:])
+
+    # >1 values are ignored
+    if quoted:
+        log("\t- quoted variable")
+        param_value = param_value[1:param_value.rfind('"')]
+
+    eq_sign = "="
+    if eq_sign not in param_value and not should_prompt:
+        log("\t- single variable print: %r", param_value)
+        _print_single_variable(key=param_value, ctx=ctx, file=out)
+        return
+
+    left, right = param_value.split(eq_sign)
+    if left and not right:
+        if should_prompt:
+            log("\t- single variable prompt: %r", left)
+            if ctx.inputted:
+                value_to_set = ctx.input.stdin.readline().rstrip("\n")
+            else:
+                value_to_set = input()
+            if not value_to_set:
+                ctx.error_level = 1
+                return
+            ctx.set_variable(key=left, value_to_set=value_to_set)
+        else:
+            log("\t- single variable delete: %r", left)
+            ctx.delete_variable(key=left)
+        return
+
+    log("\t- single variable create: %r, %r", left, right)
+    if should_prompt:
+        log("\t- single variable prompt: %r", left)
+        if ctx.inputted:
+            print(right, file=out)
+            value_to_set = ctx.input.stdin.readline().rstrip("\n")
+            log("\t- read from STDIN: %r", value_to_set)
+        else:
+            value_to_set = input(right)
+        if not value_to_set:
+            ctx.error_level = 1
+            return
+        ctx.set_variable(key=left, value_to_set=value_to_set)
+    else:
+        ctx.set_variable(key=left, value_to_set=right)
@@ -0,0 +1,51 @@
+"""Module for SETLOCAL command."""
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+
+SETLOCAL_OPTIONS = frozenset((
+    "enabledelayedexpansion", "disabledelayedexpansion",
+    "enableextensions", "disableextensions"
+))
+
+
+@what_func
+def cmd_setlocal(params: list, ctx: Context) -> None:
+    """
+    Batch: SETLOCAL command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+
+    out = get_output(ctx=ctx)
+
+    params = expand_params(params=params, ctx=ctx)
+    if len(params) == 1 and params[0] == PARAM_HELP:
+        print_help(cmd=CommandType.SETLOCAL, file=out)
+        return
+
+    options = [param.lower() for param in params]
+    if any(option not in SETLOCAL_OPTIONS for option in options):
+        # no scope is opened for an invalid argument
+        ctx.error_level = 1
+        return
+
+    ctx.push_scope()
+    if not options:
+        return
+
+    ctx.error_level = 0
+    for option in options:
+        if option == "enabledelayedexpansion":
+            ctx.delayed_expansion_enabled = True
+        elif option == "disabledelayedexpansion":
+            ctx.delayed_expansion_enabled = False
+        elif option == "enableextensions":
+            ctx.extensions_enabled = True
+        elif option == "disableextensions":
+            ctx.extensions_enabled = False
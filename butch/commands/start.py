@@ -0,0 +1,113 @@
+"""Module for START command."""
+
+import sys
+from typing import List
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commands.external import find_external, program_args
+from butch.commandtype import CommandType
+from butch.constants import FILE_NOT_FOUND, PARAM_HELP, START_PARAM
+from butch.context import Context
+from butch.external import is_batch, start_program
+from butch.help import print_help
+from butch.tokens import Argument
+
+
+# no windows or priority classes, START /B is the only behavior
+START_IGNORED = {
+    "/b", "/i", "/min", "/max", "/separate", "/shared", "/low", "/normal",
+    "/high", "/realtime", "/abovenormal", "/belownormal"
+}
+START_WAIT = "/wait"
+START_NOT_FOUND_LEVEL = 9059
+
+
+def _start_job(path: str, args: List[str], ctx: Context):
+    """
+    Start a program or a Batch file as a job.
+
+    The job is started right away, so that it gets the current output
+    even if it's redirected only for the START command. A Batch file runs
+    in a separate interpreter (butch.start_runner) like in cmd, so that its CD
+    doesn't move the starting one and it has its own %1..%9.
+
+    Args:
+        path (str): path to the program or the Batch file
+        args (list): expanded arguments for the program or the Batch file
+        ctx (Context): Context instance
+
+    Returns:
+        function waiting for the job and returning its exit code
+    """
+    argv = [path, *program_args(args)]
+    if is_batch(path):
+        argv = [sys.executable, "-m", "butch.start_runner", path, *args]
+    return start_program(
+        argv=argv,
+        env=ctx.command_cache.environment(variables=ctx.variables),
+        stdin=None, stdout=get_output(ctx)
+    )
+
+
+@what_func
+def cmd_start(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: START command.
+
+    The command runs concurrently in the same console and it's added to
+    the job table of the Context. With /WAIT the command is waited for
+    and its exit code sets ERRORLEVEL, without a command /WAIT waits for
+    all the jobs and the first failed one sets ERRORLEVEL.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+
+    first = params[0].value if params else ""
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.START, file=out)
+        return
+
+    args = expand_params(params=params, ctx=ctx)
+    idx = 0
+    if args and args[0].startswith('"'):
+        # window title
+        idx = 1
+    wait = False
+    while idx < len(args) and args[idx].startswith("/"):
+        switch = args[idx].lower()
+        if switch == START_WAIT:
+            wait = True
+        elif switch not in START_IGNORED:
+            print(START_PARAM.format(args[idx]), file=sys.stderr)
+            ctx.error_level = 1
+            return
+        idx += 1
+
+    ctx.error_level = 0
+    if idx == len(args):
+        if wait:
+            codes = [job.code for job in ctx.jobs.wait() if job.code]
+            ctx.error_level = codes[0] if codes else 0
+        return
+
+    name = args[idx].replace('"', "")
+    path = find_external(name=name, ctx=ctx)
+    if path is None:
+        print(FILE_NOT_FOUND, file=sys.stderr)
+        ctx.error_level = START_NOT_FOUND_LEVEL
+        return
+
+    try:
+        run = _start_job(path=path, args=args[idx + 1:], ctx=ctx)
+    except OSError as exc:
+        # e.g. not executable or a script without a shebang
+        print(str(exc), file=sys.stderr)
+        ctx.error_level = 1
+        return
+    if wait:
+        ctx.error_level = run()
+        return
+    ctx.jobs.start(name=" ".join(args[idx:]), run=run)
@@ -0,0 +1,43 @@
+"""Module for TIME command."""
+
+import sys
+from datetime import datetime
+
+from butch.commands.common import get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+
+
+@what_func
+def cmd_time(params: list, ctx: Context) -> None:
+    """
+    Batch: TIME command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    ctx.error_level = 0
+    out = get_output(ctx=ctx)
+
+    first = params[0].value if params else ""
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.TIME, file=out)
+        return
+
+    now = datetime.now()
+    now = now.strftime("%X")
+    if first.upper() == "/T":
+        # should match the locale format
+        print(now, file=out)
+        return
+
+    print(f"The current time is: {now}", file=out)
+    print("Enter the new time: ", file=out)
+    print("Setting the date is not implemented, use /T", file=sys.stderr)
+    try:
+        input()
+    except KeyboardInterrupt:
+        ctx.error_level = 1
@@ -0,0 +1,50 @@
+"""Module for TITLE command."""
+
+import sys
+from platform import system
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+
+
+@what_func
+def cmd_title(params: list, ctx: Context) -> None:
+    """
+    Batch: TITLE command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+
+    Raises:
+        WinError: raised when console title can't be set via Win32 API
+    """
+    ctx.error_level = 0
+
+    out = get_output(ctx=ctx)
+    params = expand_params(params=params, ctx=ctx)
+
+    params_len = len(params)
+    if not params_len:
+        print(file=out)
+        return
+
+    first = params[0]
+    if params_len == 1 and first == PARAM_HELP:
+        print_help(cmd=CommandType.TITLE, file=out)
+        return
+
+    platform_name = system()
+    if platform_name == "Linux":
+        text = params[0]
+        sys.stdout.write(f"\x1b]2;{text}\x07")
+    elif platform_name == "Windows":
+        import ctypes  # pylint: disable=import-outside-toplevel
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.SetConsoleTitleW(text)
+        error = ctypes.get_last_error()
+        if error:
+            raise ctypes.WinError(error)
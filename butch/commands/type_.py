@@ -0,0 +1,93 @@
+"""Module for TYPE command."""
+
+from os.path import exists, isdir
+from typing import List
+
+from butch.commands.common import expand_params, get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import (
+    ACCESS_DENIED, ERROR_PROCESSING, FILE_NOT_FOUND, PARAM_HELP,
+    SYNTAX_INCORRECT
+)
+from butch.context import Context
+from butch.help import print_help
+from butch.tokens import Argument
+
+
+TYPE_CHUNK = 65536
+
+
+@what_func
+def cmd_type(params: List[Argument], ctx: Context) -> None:
+    """
+    Batch: TYPE command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    out = get_output(ctx=ctx)
+
+    params = expand_params(params=params, ctx=ctx)
+    params = [param.replace("\\", "/") for param in params]
+    params_len = len(params)
+
+    if not params_len:
+        print(SYNTAX_INCORRECT, file=out)
+        ctx.error_level = 1
+        return
+
+    if params_len == 1:
+        first = params[0]
+        if first == PARAM_HELP:
+            print_help(cmd=CommandType.TYPE, file=out)
+            return
+
+        if isdir(first):
+            print(ACCESS_DENIED, file=out)
+            ctx.error_level = 1
+            return
+
+        if not exists(first):
+            print(FILE_NOT_FOUND, file=out)
+            ctx.error_level = 1
+            return
+
+        _type_file(path=first, output=out)
+        return
+
+    for idx, item_path in enumerate(params):
+        print(item_path, file=out)
+
+        if isdir(item_path):
+            print(ACCESS_DENIED, file=out)
+            print(ERROR_PROCESSING.format(item_path), file=out)
+            ctx.error_level = 1
+            continue
+
+        if not exists(item_path):
+            print(FILE_NOT_FOUND, file=out)
+            print(ERROR_PROCESSING.format(item_path), file=out)
+            ctx.error_level = 1
+            continue
+
+        for _ in range(2):
+            print("\n", file=out)
+
+        _type_file(path=item_path, output=out)
+        # no trailing newline after files
+        if idx != params_len - 1:
+            print("\n", file=out)
+
+
+def _type_file(path: str, output):
+    with open(path) as file_desc:
+        # in chunks, a pipe holds only a part of the file at a time
+        chunk = file_desc.read(TYPE_CHUNK)
+        while True:
+            next_chunk = file_desc.read(TYPE_CHUNK)
+            if not next_chunk:
+                print(chunk, file=output)
+                break
+            print(chunk, end="", file=output)
+            chunk = next_chunk
@@ -0,0 +1,30 @@
+"""Module for VER command."""
+
+from platform import platform
+
+from butch.commands.common import get_output, what_func
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.context import Context
+from butch.help import print_help
+
+
+@what_func
+def cmd_ver(params: list, ctx: Context) -> None:
+    """
+    Batch: VER command.
+
+    Args:
+        params (list): list of Argument instances for the Command
+        ctx (Context): Context instance
+    """
+    ctx.error_level = 0
+    out = get_output(ctx=ctx)
+
+    first = params[0].value if params else ""
+    if first == PARAM_HELP:
+        print_help(cmd=CommandType.VER, file=out)
+        return
+
+    print(platform(), file=out)
+    ctx.error_level = 0
@@ -14,6 +14,7 @@ class CommandType(enum.Enum):
     PAUSE = "pause"
     EXIT = "exit"
     SETLOCAL = "setlocal"
+    ENDLOCAL = "endlocal"
     DEL = "del"
     ERASE = "erase"
     HELP = "help"
@@ -33,3 +34,4 @@ class CommandType(enum.Enum):
     GOTO = "goto"
     VER = "ver"
     MOVE = "move"
+    START = "start"
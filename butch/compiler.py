@@ -0,0 +1,233 @@
+"""
+Module for compiling tokens into a flat list of instructions.
+
+Blocks and concatenations are unpacked into consecutive instructions,
+labels become only offsets of the instructions following them and GOTO
+with a literal label jumps to the resolved offset directly. The history
+of the Context gets the same entries as from new_call() for the tokens.
+"""
+
+from bisect import bisect_right
+from enum import Enum, auto
+from typing import Dict, Iterator, List, Tuple
+
+from butch.commandtype import CommandType
+from butch.constants import PARAM_HELP
+from butch.expansion import compile_argument
+from butch.jumptype import JumpTypeEof
+from butch.tokenizer import Command, Concat, Connector
+from butch.tokens import Block, Label, Token
+
+_END = object()
+EXPANSION_CHARS = ("%", "!")
+
+
+class Op(Enum):
+    "Enum of instruction types."
+
+    # new_call() for the token
+    CALL = auto()
+    # new_call() for a side of a concatenation, not in the history
+    CHILD = auto()
+    # add a block, concatenation or GOTO to the history
+    HISTORY = auto()
+    # reset the output flags before the right side of concatenation
+    RESET = auto()
+    # GOTO for a literal label, not yet resolved
+    GOTO = auto()
+    # GOTO resolved to an offset
+    JUMP = auto()
+    # end of the code or GOTO :EOF
+    EOF = auto()
+
+
+Instruction = Tuple[Op, object]
+
+
+def label_key(label: str) -> str:
+    """
+    Normalize a label for lookup, GOTO ignores the case and a colon prefix.
+
+    Args:
+        label (str): label or GOTO target
+
+    Returns:
+        normalized label
+    """
+    if label.startswith(":"):
+        label = label[1:]
+    return label.casefold()
+
+
+def _literal_goto(token: Token) -> str:
+    """
+    Get the target of GOTO which doesn't need the command to run.
+
+    Args:
+        token (Token): any token
+
+    Returns:
+        target or empty string if it's not a literal GOTO
+    """
+    if not isinstance(token, Command) or token.cmd != CommandType.GOTO:
+        return ""
+    if not token.args:
+        return ""
+
+    target = token.args[0].value
+    if target == PARAM_HELP or not target:
+        return ""
+    for char in EXPANSION_CHARS:
+        if char in target:
+            return ""
+    return target
+
+
+def _compile_arguments(token: Token) -> None:
+    """
+    Compile the arguments of commands for the percent expansion.
+
+    Args:
+        token (Token): command or a connector of commands
+    """
+    stack = [token]
+    while stack:
+        token = stack.pop()
+        if isinstance(token, Command):
+            for arg in token.args:
+                compile_argument(arg=arg)
+        elif isinstance(token, Connector):
+            stack.extend((token.left, token.right))
+
+
+class Program:
+    """
+    Instructions compiled from a token stream only when needed.
+
+    Keeps the already compiled instructions for jumping back and offsets
+    of the labels for jumping forward.
+    """
+
+    _stream: Iterator[Token]
+    _done: bool
+    _tokens: List[Token]
+    _code: List[Instruction]
+    _labels: Dict[str, List[int]]
+
+    def __init__(self, stream: Iterator[Token]):
+        """
+        Initialize Program instance.
+
+        Args:
+            stream (Iterator[Token]): top-level tokens
+        """
+        self._stream = stream
+        self._done = False
+        self._tokens = []
+        self._code = []
+        self._labels = {}
+
+    @property
+    def code(self):
+        """
+        Get the compiled instructions, grown by compile_next().
+
+        Returns:
+            list of (Op, argument) pairs
+        """
+        return self._code
+
+    def compile_next(self) -> bool:
+        """
+        Compile the next token from the stream, EOF at its end.
+
+        Returns:
+            False if the stream already ended
+        """
+        if self._done:
+            return False
+        token = next(self._stream, _END)
+        if token is _END:
+            self._done = True
+            self._code.append((Op.EOF, None))
+            return True
+
+        self._tokens.append(token)
+        self._compile(token=token)
+        return True
+
+    def compile_all(self) -> List[Token]:
+        """
+        Compile the rest of the stream.
+
+        Returns:
+            list of all tokens read from the stream
+        """
+        while self.compile_next():
+            pass  # noqa: WPS328
+        return self._tokens
+
+    def resolve(self, inst_ptr: int, target: str) -> int:
+        """
+        Find the next label after GOTO, then from the beginning.
+
+        Reads ahead only when the label isn't known past the GOTO
+        and the labels are searched in the whole stream later.
+
+        Args:
+            inst_ptr (int): offset of the GOTO instruction
+            target (str): GOTO target
+
+        Returns:
+            offset of the instruction after the label or -1 if missing
+        """
+        key = label_key(target)
+        labels = self._labels
+        positions = labels.get(key, [])
+        nxt = bisect_right(positions, inst_ptr)
+        while nxt == len(positions):
+            if not self.compile_next():
+                break
+            positions = labels.get(key, [])
+
+        if nxt < len(positions):
+            return positions[nxt]
+        if positions:
+            return positions[0]
+        return -1
+
+    def _compile(self, token: Token, child: bool = False) -> None:
+        """
+        Append instructions for a token.
+
+        Args:
+            token (Token): token to compile
+            child (bool): a side of a concatenation, like for new_call()
+        """
+        code = self._code
+        if isinstance(token, Label):
+            # the label isn't executed, points to the next instruction
+            key = label_key(token.value)
+            self._labels.setdefault(key, []).append(len(code))
+        elif isinstance(token, Block):
+            for subtoken in token:
+                self._compile(token=subtoken)
+            code.append((Op.HISTORY, token))
+        elif isinstance(token, Concat):
+            self._compile(token=token.left, child=True)
+            code.append((Op.RESET, None))
+            if not child:
+                code.append((Op.HISTORY, token))
+            self._compile(token=token.right, child=True)
+        else:
+            target = _literal_goto(token)
+            if not target:
+                _compile_arguments(token=token)
+                code.append((Op.CHILD if child else Op.CALL, token))
+                return
+            if not child:
+                code.append((Op.HISTORY, token))
+            if target.lower() == JumpTypeEof._target:
+                code.append((Op.EOF, None))
+            else:
+                code.append((Op.GOTO, target))
@@ -18,3 +18,15 @@ ECHO_STATE = "ECHO is {}."
 OCTAL_ESC = "\033"
 OCTAL_CLEAR = f"{OCTAL_ESC}c"
 MULTI_TO_SINGLE = "Cannot move multiple files to a single file."
+START_PARAM = (  # noqa: P103
+    "The system cannot accept the START command parameter {}."
+)
+NOT_RECOGNIZED = (  # noqa: P103
+    "'{}' is not recognized as an internal or external command,\n"
+    "operable program or batch file."
+)
+HELP_NOT_FOUND = "No help topic contains {}."  # noqa: P103
+NO_FILE_FOUND = "File Not Found"
+INVALID_SWITCH = 'Invalid switch - "{}".'  # noqa: P103
+PARAM_FORMAT = 'Parameter format not correct - "{}".'  # noqa: P103
+NOT_SUPPORTED = 'Switch not supported - "{}".'  # noqa: P103
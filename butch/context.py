@@ -1,18 +1,19 @@
 """Module for global or local (command) state related classes and functions."""
 
 import sys
-from logging import RootLogger
+from copy import copy
 from os import chdir, getcwd
 from os.path import abspath, exists, isdir
 from random import randint
-from tempfile import gettempdir
 from time import strftime
-from typing import Union
+from typing import Any, Union
 
-from butch.logger import get_logger
+from butch.logger import DEBUG_LEVEL, debug_enabled, get_logger
 from butch.inputs import CommandInput
+from butch.jobs import JobTable
 from butch.outputs import CommandOutput
 from butch.jumptype import JumpType
+from butch.variables import VariableStore
 
 PROMPT_KEY = "prompt"
 PROMPT_SYMBOL = "$"
@@ -53,19 +54,11 @@ class Context:  # noqa: WPS214,WPS338
     # pylint: disable=too-many-instance-attributes,too-many-public-methods
 
     _cwd: str
-    _variables: dict
+    _variables: VariableStore
     _error_level: int
     _extensions_enabled: bool
     _delayed_expansion_enabled: bool
-    _dynamic_variables: list = [
-        "cd",
-        "cmdcmdline",
-        "cmdextversion",
-        "date",
-        "errorlevel",
-        "random",
-        "time"
-    ]
+    _scopes: list
     _history: list
     _history_enabled: bool
     _pushd_history: list
@@ -77,8 +70,10 @@ class Context:  # noqa: WPS214,WPS338
     _discard_output: bool
     _piped: bool
     _inputted: bool
-    _logger: RootLogger
+    _logger: Any
     _jump: JumpType
+    _jobs: JobTable
+    _arguments: Union[list, None]
 
     def __init__(self, **kwargs):
         """
@@ -97,16 +92,23 @@ class Context:  # noqa: WPS214,WPS338
         self._echo = True
         self._error_level = 0
         self._extensions_enabled = True
+        self._scopes = []
         self._history = []
         self._history_enabled = True
         self._pushd_history = []
-        self._logger = get_logger()
+        self._logger = None
         self._input = None
         self._output = None
         self._piped = False
         self._inputted = False
         self._jump = None
-        self._variables = self._get_default_variables()
+        self._commands = None
+        self._jobs = JobTable()
+        self._arguments = None
+        self._variables = VariableStore(
+            values=self._get_default_variables(),
+            dynamic=self._get_dynamic_variables()
+        )
 
         # dynamic
         self._prompt = self._variables.get(PROMPT_KEY, "")
@@ -142,10 +144,25 @@ class Context:  # noqa: WPS214,WPS338
         Property.
 
         Returns:
-            reference to the Butch's logger.
+            reference to the Butch's logger, created on the first use.
         """
+        if self._logger is None:
+            self._logger = get_logger()
         return self._logger
 
+    @property
+    def trace(self):
+        """
+        Property.
+
+        Returns:
+            flag whether the debug logging is enabled.
+        """
+        if self._logger is None and not debug_enabled():
+            # the level comes from DEBUG until the logger is in use
+            return False
+        return self.log.isEnabledFor(DEBUG_LEVEL)
+
     @property
     def cwd(self):
         """
@@ -335,6 +352,110 @@ class Context:  # noqa: WPS214,WPS338
     def delayed_expansion_enabled(self, enabled):
         self._delayed_expansion_enabled = enabled
 
+    @property
+    def scope_depth(self):
+        """
+        Property.
+
+        Returns:
+            number of SETLOCAL scopes not ended yet
+        """
+        return len(self._scopes)
+
+    def push_scope(self) -> None:
+        """
+        Localize the changes of variables and flags until pop_scope().
+
+        Only the changes are recorded, no variables are copied.
+        """
+        self._scopes.append((
+            self._delayed_expansion_enabled, self._extensions_enabled
+        ))
+        self._variables.push()
+
+    def pop_scope(self) -> bool:
+        """
+        Restore the variables and flags from before the last push_scope().
+
+        Returns:
+            False if there was no scope to end
+        """
+        if not self._scopes:
+            return False
+        delayed, extensions = self._scopes.pop()
+        self._delayed_expansion_enabled = delayed
+        self._extensions_enabled = extensions
+        self._variables.pop()
+        return True
+
+    @property
+    def command_cache(self):
+        """
+        Property.
+
+        Returns:
+            CommandCache with the resolved external commands
+        """
+        if self._commands is None:
+            # pylint: disable=import-outside-toplevel
+            from butch.external import CommandCache
+            self._commands = CommandCache()
+        return self._commands
+
+    @property
+    def jobs(self):
+        """
+        Property.
+
+        Returns:
+            JobTable with the jobs started by START, shared by the copies
+        """
+        return self._jobs
+
+    @property
+    def arguments(self) -> list:
+        """
+        Property.
+
+        Returns:
+            the Batch file and its arguments for %0..%9 and %*,
+            sys.argv if not set.
+        """
+        if self._arguments is None:
+            return sys.argv
+        return self._arguments
+
+    @arguments.setter
+    def arguments(self, values: Union[list, None]):
+        self._arguments = values
+
+    def isolated(self) -> "Context":
+        """
+        Copy the Context for Batch code running concurrently.
+
+        The copy starts with the current variables and flags, but without
+        SETLOCAL scopes, history or the piped input.
+
+        Returns:
+            Context instance
+        """
+        ctx = copy(self)
+        # the resolved commands are shared
+        ctx._commands = self.command_cache
+        ctx._variables = VariableStore(
+            values=dict(self._variables.items()),
+            dynamic=ctx._get_dynamic_variables()
+        )
+        ctx._scopes = []
+        ctx._history = []
+        ctx._pushd_history = list(self._pushd_history)
+        ctx._input = None
+        ctx._inputted = False
+        ctx._piped = False
+        ctx._jump = None
+        ctx._error_level = 0
+        return ctx
+
     @property
     def dynamic_variables(self):
         """
@@ -343,7 +464,7 @@ class Context:  # noqa: WPS214,WPS338
         Returns:
             list of dynamic variables' names.
         """
-        return self._dynamic_variables
+        return list(self._variables.dynamic)
 
     @property
     def variables(self):
@@ -351,7 +472,7 @@ class Context:  # noqa: WPS214,WPS338
         Property.
 
         Returns:
-            all stored variables in the context except dynamic
+            VariableStore with all stored variables except dynamic
         """
         return self._variables
 
@@ -367,9 +488,12 @@ class Context:  # noqa: WPS214,WPS338
         Returns:
             value of a variable as string
         """
-        if self.extensions_enabled and key in self.dynamic_variables:
-            return self._get_dynamic_variable(key)
-        return self.variables.get(key)
+        variables = self._variables
+        if self._extensions_enabled:
+            found_value = variables.get_dynamic(key)
+            if found_value is not None:
+                return found_value
+        return variables.get(key)
 
     def set_variable(self, key, value_to_set):
         """
@@ -379,7 +503,7 @@ class Context:  # noqa: WPS214,WPS338
             key: variable name
             value_to_set: same as the name
         """
-        self._variables[key] = value_to_set
+        self._variables.set(name=key, value=value_to_set)
 
     def delete_variable(self, key):
         """
@@ -388,7 +512,7 @@ class Context:  # noqa: WPS214,WPS338
         Args:
             key: variable name
         """
-        self._variables[key] = ""
+        self._variables.set(name=key, value="")
 
     @property
     def history(self):
@@ -477,7 +601,7 @@ class Context:  # noqa: WPS214,WPS338
             "sessionname": None,
             "systemdrive": None,
             "systemroot": None,
-            "temp": gettempdir(),
+            "temp": None,
             "tmp": None,
             "userdomain": None,
             "username": None,
@@ -485,7 +609,48 @@ class Context:  # noqa: WPS214,WPS338
             "windir": None
         }
 
-    def _get_dynamic_variable(self, name: str) -> str:  # noqa: WPS212
+    def _get_dynamic_variables(self) -> dict:
+        """
+        Get the getters of dynamic variables.
+
+        Returns:
+            dict of names and functions returning the current values
+        """
+        return {
+            "cd": getcwd,
+            "cmdcmdline": lambda: sys.argv[0],
+            "cmdextversion": lambda: "2",
+            "date": lambda: strftime("%x"),
+            "errorlevel": lambda: str(self._error_level),
+            "random": lambda: str(
+                randint(0, DYNAMIC_RAND_MAX)  # noqa: S311
+            ),
+            "temp": lambda: self._get_temp(name="temp"),
+            "time": lambda: strftime("%X"),
+            "tmp": lambda: self._get_temp(name="tmp")
+        }
+
+    def _get_temp(self, name: str) -> str:
+        """
+        Get TEMP or TMP, the system's temporary folder unless it's set.
+
+        The folder is looked up on the first access, so that tempfile
+        isn't imported by every Context.
+
+        Args:
+            name: "temp" or "tmp"
+
+        Returns:
+            str: the stored value or the temporary folder
+        """
+        found_value = self._variables.get(name)
+        if found_value is not None:
+            return found_value
+        # pylint: disable=import-outside-toplevel
+        from tempfile import gettempdir
+        return gettempdir()
+
+    def _get_dynamic_variable(self, name: str) -> str:
         """
         Create and return a dynamic value for dynamic variable.
 
@@ -495,22 +660,10 @@ class Context:  # noqa: WPS214,WPS338
         Returns:
             str: value of a dynamic variable
         """
-        # pylint: disable=too-many-return-statements
-        if name == "cd":
-            return getcwd()
-        if name == "date":
-            return strftime("%x")
-        if name == "time":
-            return strftime("%X")
-        if name == "random":
-            return str(randint(0, DYNAMIC_RAND_MAX))  # noqa: S311
-        if name == "errorlevel":
-            return str(self.error_level)
-        if name == "cmdextversion":
-            return "2"
-        if name == "cmdcmdline":
-            return sys.argv[0]
-        return ""
+        found_value = self._variables.get_dynamic(name)
+        if found_value is None:
+            return ""
+        return found_value
 
     def resolve_prompt(self) -> str:
         """
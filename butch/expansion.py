@@ -1,13 +1,27 @@
 """Module for handling % and ! expansion into variables."""
 
-import sys
+from enum import Enum, auto
+from typing import Tuple, Union
 
 from butch.context import Context
+from butch.tokens import Argument
+from butch.variables import VariableStore, fold
 
 PERCENT = "%"
 
 
-def percent_expansion(line: str, ctx: Context) -> str:  # noqa: WPS210,WPS231
+class Segment(Enum):
+    "Enum of parts of a value compiled for the percent expansion."
+    LITERAL = auto()
+    VARIABLE = auto()
+    ARGV = auto()
+    ARGS = auto()
+
+
+Template = Tuple[Tuple[Segment, object], ...]
+
+
+def percent_expansion(line: str, ctx: Context) -> str:
     """
     Expand percent-encapsulated values into variables.
 
@@ -18,48 +32,64 @@ def percent_expansion(line: str, ctx: Context) -> str:  # noqa: WPS210,WPS231
     Returns:
         string with expanded values
     """
+    expanded = expand_template(template=compile_percent(line=line), ctx=ctx)
+    if ctx.trace:
+        ctx.log.debug("percent expansion result: %r", expanded)
+    return expanded
+
+
+def compile_percent(line: str) -> Template:  # noqa: WPS210,WPS231
+    """
+    Split a value into segments for the percent expansion.
+
+    Scans the value the same way as percent_expansion(), but instead of
+    the values it stores what to look up, so that the expansion of the
+    same value only joins the pieces.
+
+    Args:
+        line (str): string value to expand
+
+    Returns:
+        tuple of (Segment, str or int) pairs
+    """
     # pylint: disable=too-many-statements, too-many-branches
-    tmp = ""
+    segments = []
+    literal = ""
     idx = 0
     line_len = len(line)
     while idx < line_len:
         char = line[idx]
         if char != PERCENT:
-            tmp += char
-            idx += 1
+            # everything up to the next % at once
+            next_perc = line.find(PERCENT, idx)
+            if next_perc < 0:
+                next_perc = line_len
+            literal += line[idx:next_perc]
+            idx = next_perc
             continue
 
         if line_len == 1:
             break
 
         next_perc = line.find(PERCENT, idx + 1)
-        # %%
-        if idx == next_perc:
-            if idx + 1 != line_len:
-                tmp += PERCENT
-            idx += 1
-            continue
-
         next_idx = idx + 1
-        # sys argv
+        # arguments of the Batch file
         # %1hello% -> <argv>hello instead of <1hello value>
         if idx < line_len - 1:
             next_char = line[next_idx]
-            if next_char.isdigit():
-                pos = int(line[next_idx])
-                argvs = sys.argv[pos:pos + 1]
-                # value or position/number
-                tmp += argvs[0] if argvs else str(pos)
-                idx = next_idx + 1
-                continue
-
-            if next_char == "*":
-                tmp += " ".join(sys.argv[1:10])
+            if next_char.isdigit() or next_char == "*":
+                if literal:
+                    segments.append((Segment.LITERAL, literal))
+                    literal = ""
+                if next_char == "*":
+                    segments.append((Segment.ARGS, None))
+                else:
+                    segments.append((Segment.ARGV, int(next_char)))
                 idx = next_idx + 1
                 continue
 
             if next_char == PERCENT:
-                tmp += next_char
+                literal += next_char
                 idx = next_idx + 1
                 continue
 
@@ -70,23 +100,119 @@ def percent_expansion(line: str, ctx: Context) -> str:  # noqa: WPS210,WPS231
         # variable expansion
         idx_ahead = next_perc + 1
         perc_range = next_perc - idx
-        if next_perc and perc_range > 1 and " " not in line[idx:idx_ahead]:
-            key = line[next_idx:next_perc]
-            found_value = ctx.get_variable(key=key)
-            if found_value:
-                tmp += found_value
+        if perc_range > 1 and " " not in line[idx:idx_ahead]:
+            if literal:
+                segments.append((Segment.LITERAL, literal))
+                literal = ""
+            segments.append((Segment.VARIABLE, line[next_idx:next_perc]))
             idx = idx_ahead
             continue
 
-        # escaped %, as %% -> %
-        if next_perc and perc_range == 1:
-            tmp += PERCENT
-            idx = idx_ahead
-            continue
-        if next_perc and not perc_range:
-            idx += 1
-            if idx != line_len:
-                tmp += PERCENT
-            continue
-    ctx.log.debug("percent expansion result: %r", tmp)
-    return tmp
+        # not a variable, keep the % as is
+        literal += PERCENT
+        idx = next_idx
+    if literal:
+        segments.append((Segment.LITERAL, literal))
+    return tuple(segments)
+
+
+def expand_template(template: Template, ctx: Context) -> str:
+    """
+    Expand a value compiled with compile_percent().
+
+    Args:
+        template (Template): segments of the value
+        ctx (Context): Context instance
+
+    Returns:
+        string with expanded values
+    """
+    parts = []
+    for kind, payload in template:
+        if kind is Segment.LITERAL:
+            parts.append(payload)
+        elif kind is Segment.VARIABLE:
+            found_value = ctx.get_variable(key=payload)
+            if found_value:
+                parts.append(found_value)
+        elif kind is Segment.ARGV:
+            argvs = ctx.arguments[payload:payload + 1]
+            # value or position/number
+            parts.append(argvs[0] if argvs else str(payload))
+        else:
+            parts.append(" ".join(ctx.arguments[1:10]))
+    return "".join(parts)
+
+
+def compile_argument(arg: Argument) -> Union[str, Template]:
+    """
+    Compile the value of an Argument once and keep it in the Argument.
+
+    Args:
+        arg (Argument): Argument instance
+
+    Returns:
+        tuple of segments or the string if there's nothing to expand
+    """
+    template = arg.template
+    if template is None:
+        template = compile_percent(line=arg.value)
+        if not template:
+            template = ""
+        elif len(template) == 1 and template[0][0] is Segment.LITERAL:
+            template = template[0][1]
+        arg.template = template
+    return template
+
+
+def expand_argument(arg: Argument, ctx: Context) -> str:
+    """
+    Expand the value of an Argument, same as percent_expansion().
+
+    Args:
+        arg (Argument): Argument instance
+        ctx (Context): Context instance
+
+    Returns:
+        string with expanded values
+    """
+    template = arg.template
+    if template is None:
+        template = compile_argument(arg=arg)
+    if template.__class__ is str:
+        return template
+
+    # same variables as for the last expansion
+    variables = ctx.variables
+    cached = arg.expanded
+    if cached is not None and cached[0] == variables.uid:
+        if cached[1] == variables.version:
+            return cached[2]
+
+    expanded = expand_template(template=template, ctx=ctx)
+    if ctx.trace:
+        ctx.log.debug("percent expansion result: %r", expanded)
+    if _cacheable(template=template, variables=variables):
+        arg.expanded = (variables.uid, variables.version, expanded)
+    return expanded
+
+
+def _cacheable(template: Template, variables: VariableStore) -> bool:
+    """
+    Check an expansion depends only on the stored variables.
+
+    Args:
+        template (Template): segments of the value
+        variables (VariableStore): variables of the Context
+
+    Returns:
+        False for argv and dynamic variables
+    """
+    dynamic = variables.dynamic
+    for kind, payload in template:
+        if kind is Segment.VARIABLE:
+            if fold(payload) in dynamic:
+                return False
+        elif kind is not Segment.LITERAL:
+            return False
+    return True
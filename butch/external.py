@@ -0,0 +1,401 @@
+"""
+Module for running external programs.
+
+The names are resolved against PATH and PATHEXT and remembered, similarly
+to the ``hash`` builtin of POSIX shells, including the names that weren't
+found. The table is emptied when PATH or PATHEXT changes. The programs are
+started with ``posix_spawn()`` where available, which is cheaper than
+forking the interpreter.
+"""
+
+import os
+from codecs import getincrementaldecoder
+from functools import partial
+from io import UnsupportedOperation
+from os.path import isfile, join, splitext
+from threading import Thread
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+from butch.variables import VariableStore, fold
+
+PATHEXT = ".COM;.EXE;.BAT;.CMD"
+BATCH_EXTENSIONS = (".bat", ".cmd")
+# cmd.exe's error level for a missing command
+NOT_FOUND_LEVEL = 9009
+# exit status of POSIX shells for a missing command, a process exit
+# status keeps only 8 bits and 9009 would end up as 49
+NOT_FOUND_STATUS = 127
+PIPE_CHUNK = 65536
+
+
+def exit_status(level: int) -> int:
+    """
+    Get the exit status of the process for an error level.
+
+    Args:
+        level (int): ERRORLEVEL
+
+    Returns:
+        the level, NOT_FOUND_STATUS for a missing command
+    """
+    if level == NOT_FOUND_LEVEL:
+        return NOT_FOUND_STATUS
+    return level
+
+
+def split_paths(value: str) -> List[str]:
+    """
+    Split PATH into folders, ";" works as a separator on any system.
+
+    Args:
+        value (str): PATH value
+
+    Returns:
+        list of non-empty folders
+    """
+    paths = value.split(";")
+    if os.pathsep != ";":
+        paths = [
+            path for part in paths for path in part.split(os.pathsep)
+        ]
+    return [path for path in paths if path]
+
+
+def is_batch(path: str) -> bool:
+    """
+    Check a path is a Batch file.
+
+    Args:
+        path (str): path to a file
+
+    Returns:
+        bool
+    """
+    return splitext(path)[1].lower() in BATCH_EXTENSIONS
+
+
+def _candidates(name: str, extensions: List[str]) -> List[str]:
+    "File names a command name can refer to, in the order of preference."
+    if splitext(name)[1]:
+        return [name]
+    with_ext = []
+    for ext in extensions:
+        with_ext.append(name + ext)
+        if ext.lower() != ext:
+            with_ext.append(name + ext.lower())
+    if os.name == "nt":
+        return with_ext
+    # programs without an extension are the usual ones elsewhere
+    return [name] + with_ext
+
+
+def _runnable(path: str) -> bool:
+    "Check a file can be executed directly or as a Batch file."
+    if not isfile(path):
+        return False
+    return is_batch(path) or os.access(path, os.X_OK)
+
+
+def find_program(name: str, path: str, pathext: str) -> Optional[str]:
+    """
+    Look up a command name in the folders.
+
+    A name with a folder in it is looked up only relative to the current
+    folder, any other name only in PATH.
+
+    Args:
+        name (str): command name with or without an extension
+        path (str): PATH value
+        pathext (str): PATHEXT value
+
+    Returns:
+        path to the program or None if not found
+    """
+    extensions = [ext for ext in pathext.split(";") if ext]
+    names = _candidates(name=name, extensions=extensions)
+    if "/" in name or "\\" in name:
+        folders = [""]
+        names = [item.replace("\\", "/") for item in names]
+    else:
+        folders = split_paths(path)
+
+    for folder in folders:
+        for item in names:
+            full = join(folder, item) if folder else item
+            if _runnable(full):
+                return full
+    return None
+
+
+class CommandCache:
+    """
+    Resolved paths of external commands and their environment.
+
+    Missing programs are remembered as None, so that a typo in a loop
+    doesn't search PATH again and again.
+    """
+
+    _paths: Dict[str, Optional[str]]
+    _key: Tuple[str, str]
+    _env: Dict[str, str]
+    _env_key: Tuple[int, int]
+
+    def __init__(self):
+        """Initialize CommandCache instance."""
+        self._paths = {}
+        self._key = ("", "")
+        self._env = {}
+        self._env_key = (-1, -1)
+
+    def __len__(self):
+        """
+        Get the number of remembered names.
+
+        Returns:
+            int
+        """
+        return len(self._paths)
+
+    def clear(self) -> None:
+        """Forget all of the resolved names."""
+        self._paths.clear()
+
+    def resolve(
+            self, name: str, path: str = None, pathext: str = None
+    ) -> Optional[str]:
+        """
+        Find a program by its name, use the remembered result if possible.
+
+        Args:
+            name (str): command name
+            path (str): PATH value, the process' PATH if None
+            pathext (str): PATHEXT value, the default one if None
+
+        Returns:
+            path to the program or None if not found
+        """
+        if path is None:
+            path = os.environ.get("PATH", os.defpath)
+        if pathext is None:
+            pathext = PATHEXT
+        key = (path, pathext)
+        if key != self._key:
+            self._paths.clear()
+            self._key = key
+
+        relative = "/" in name or "\\" in name
+        if not relative and name in self._paths:
+            return self._paths[name]
+        found = find_program(name=name, path=path, pathext=pathext)
+        if not relative:
+            # depends on the current folder otherwise
+            self._paths[name] = found
+        return found
+
+    def environment(self, variables: VariableStore) -> Dict[str, str]:
+        """
+        Get the environment for a program, built again only after a change.
+
+        Args:
+            variables (VariableStore): variables of a Context
+
+        Returns:
+            the process' environment updated by the variables
+        """
+        key = (variables.uid, variables.version)
+        if key == self._env_key:
+            return self._env
+
+        env = dict(os.environ)
+        names = {fold(name): name for name in env}
+        for name, value in variables.items():  # noqa: WPS110
+            if value is None:
+                continue
+            name = names.get(fold(name), name)
+            if value:
+                env[name] = str(value)
+            else:
+                env.pop(name, None)
+        self._env = env
+        self._env_key = key
+        return env
+
+
+def _fileno(stream: TextIO) -> Optional[int]:
+    "Get a file descriptor of a stream if it has one."
+    try:
+        fdes = stream.fileno()
+    except (AttributeError, UnsupportedOperation, ValueError, OSError):
+        return None
+    return fdes if isinstance(fdes, int) else None
+
+
+def _exit_code(status: int) -> int:
+    "Convert a status from waitpid() to an exit code."
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _wait_pid(pid: int) -> int:
+    "Wait for a spawned process to finish."
+    return _exit_code(os.waitpid(pid, 0)[1])
+
+
+def spawn(
+        argv: List[str], env: Dict[str, str],
+        stdin: Optional[int] = None, stdout: Optional[int] = None
+) -> Callable[[], int]:
+    """
+    Start a program with posix_spawn() or Popen where it's missing.
+
+    Args:
+        argv (list): path to the program and its arguments
+        env (dict): environment of the program
+        stdin (int): file descriptor to use as STDIN, inherited if None
+        stdout (int): file descriptor to use as STDOUT, inherited if None
+
+    Returns:
+        function waiting for the program and returning its exit code
+    """
+    posix_spawn = getattr(os, "posix_spawn", None)
+    if posix_spawn is None:
+        # pylint: disable=import-outside-toplevel
+        from subprocess import Popen  # nosec
+        proc = Popen(argv, env=env, stdin=stdin, stdout=stdout)  # nosec
+        return proc.wait
+
+    actions = []
+    for fdes, target in ((stdin, 0), (stdout, 1)):
+        if fdes is not None and fdes != target:
+            actions.append((os.POSIX_SPAWN_DUP2, fdes, target))
+    pid = posix_spawn(argv[0], argv, env, file_actions=actions)
+    return partial(_wait_pid, pid)
+
+
+def _feed(stream: TextIO, fdes: int) -> None:
+    "Copy a text stream into a pipe to a program, then close the pipe."
+    # pylint: disable=import-outside-toplevel
+    from locale import getpreferredencoding
+    encoding = getpreferredencoding(False)
+    try:
+        while True:
+            chunk = stream.read(PIPE_CHUNK)
+            if not chunk:
+                break
+            os.write(fdes, chunk.encode(encoding, errors="replace"))
+    except BrokenPipeError:
+        # the program doesn't read everything
+        pass  # noqa: WPS420
+    finally:
+        os.close(fdes)
+
+
+def _drain(fdes: int, stream: TextIO) -> None:
+    "Copy the output of a program from a pipe into a text stream."
+    # pylint: disable=import-outside-toplevel
+    from locale import getpreferredencoding
+    decoder = getincrementaldecoder(getpreferredencoding(False))(
+        errors="replace"
+    )
+    try:
+        while True:
+            chunk = os.read(fdes, PIPE_CHUNK)
+            if not chunk:
+                break
+            stream.write(decoder.decode(chunk))
+        stream.write(decoder.decode(b"", final=True))
+    finally:
+        os.close(fdes)
+
+
+def _finish(
+        wait: Callable[[], int], threads: List[Thread],
+        read_fd: Optional[int], stdout: TextIO
+) -> int:
+    "Copy the rest of the output and wait for a started program."
+    if read_fd is not None:
+        _drain(fdes=read_fd, stream=stdout)
+    code = wait()
+    for thread in threads:
+        thread.join()
+    return code
+
+
+def start_program(
+        argv: List[str], env: Dict[str, str],
+        stdin: Optional[TextIO], stdout: TextIO
+) -> Callable[[], int]:
+    """
+    Start a program connected to the streams of a command.
+
+    Streams backed by a file descriptor (files, the console) are passed to
+    the program directly, so they can be closed right after this returns.
+    The others (pipes between the commands, captured output) are copied
+    through OS pipes until the program ends.
+
+    Args:
+        argv (list): path to the program and its arguments
+        env (dict): environment of the program
+        stdin (TextIO): stream to read from, inherited if None
+        stdout (TextIO): stream to write to
+
+    Returns:
+        function copying the output, waiting for the program
+        and returning its exit code
+    """
+    stdin_fd = None
+    threads = []
+    if stdin is not None:
+        stdin_fd = _fileno(stdin)
+        if stdin_fd is None:
+            stdin_fd, write_fd = os.pipe()
+            threads.append(Thread(
+                target=_feed, args=(stdin, write_fd), daemon=True
+            ))
+
+    stdout.flush()
+    stdout_fd = _fileno(stdout)
+    read_fd = None
+    if stdout_fd is None:
+        read_fd, stdout_fd = os.pipe()
+
+    try:
+        wait = spawn(argv=argv, env=env, stdin=stdin_fd, stdout=stdout_fd)
+    except OSError:
+        if read_fd is not None:
+            os.close(read_fd)
+        if threads:
+            os.close(write_fd)
+        raise
+    finally:
+        # the program has its own copies now
+        if read_fd is not None:
+            os.close(stdout_fd)
+        if threads:
+            os.close(stdin_fd)
+
+    for thread in threads:
+        thread.start()
+    return partial(
+        _finish, wait=wait, threads=threads, read_fd=read_fd, stdout=stdout
+    )
+
+
+def run_program(
+        argv: List[str], env: Dict[str, str],
+        stdin: Optional[TextIO], stdout: TextIO
+) -> int:
+    """
+    Run a program connected to the streams of a command and wait for it.
+
+    Args:
+        argv (list): path to the program and its arguments
+        env (dict): environment of the program
+        stdin (TextIO): stream to read from, inherited if None
+        stdout (TextIO): stream to write to
+
+    Returns:
+        exit code of the program
+    """
+    return start_program(argv=argv, env=env, stdin=stdin, stdout=stdout)()
@@ -1,64 +1,156 @@
+from functools import partial
+from os import fstat
 from os.path import exists
-from typing import List
+from typing import Any, Iterable
 
 from butch.caller import new_call
+from butch.compiler import Op, Program
 from butch.context import Context
 from butch.jumptype import JumpTypeEof
-from butch.tokenizer import tokenize
-from butch.tokens import Label, Token
+from butch.tokenizer import iter_tokenize
 
+READ_CHUNK = 65536
 
-def collect_labels(cmds: List[Token]):
-    return {
-        cmd.value: idx
-        for idx, cmd in enumerate(cmds)
-        if isinstance(cmd, Label)
-    }
 
-
-def handle_input(inp: str, ctx: Context):
+def handle_stream(chunks: Iterable[str], ctx: Context, size: int = 0):
     """
-    Handle a Batch input from CLI.
+    Handle a Batch code while reading it in chunks.
 
     Args:
-        inp: Batch commands as a string
+        chunks: consecutive parts of Batch code
         ctx: Context instance
+        size: expected size of the whole code if known
     """
-    jump_eof = JumpTypeEof()
+    _run(
+        program=Program(stream=iter_tokenize(
+            chunks=chunks, ctx=ctx, size=size
+        )),
+        ctx=ctx
+    )
 
-    instructions = tokenize(text=inp, ctx=ctx)
-    labels = collect_labels(cmds=instructions)
 
-    inst_len = len(instructions)
+def _run(program: Program, ctx: Context):
+    "Execute the instructions from the first one and follow the jumps."
+    code = program.code
     inst_ptr = 0
-    while 0 <= inst_ptr < inst_len:
-        cmd = instructions[inst_ptr]
-        new_call(cmd=cmd, ctx=ctx)
-
-        jump = ctx.jump
-        if jump == jump_eof:
+    while True:
+        while inst_ptr == len(code):
+            # a label or an empty block has no instructions
+            program.compile_next()
+        operation, arg = code[inst_ptr]
+
+        if operation is Op.CALL or operation is Op.CHILD:
+            new_call(cmd=arg, ctx=ctx, child=operation is Op.CHILD)
+            jump = ctx.jump
+            if jump is None:
+                inst_ptr += 1
+                continue
+            ctx.jump = None
+            if isinstance(jump, JumpTypeEof):
+                break
+            target = program.resolve(inst_ptr=inst_ptr, target=jump.target)
+            inst_ptr = target if target >= 0 else inst_ptr + 1
+        elif operation is Op.JUMP:
+            inst_ptr = arg
+        elif operation is Op.GOTO:
+            target = program.resolve(inst_ptr=inst_ptr, target=arg)
+            if target >= 0:
+                # resolved once, the next time it's just a jump
+                code[inst_ptr] = (Op.JUMP, target)
+                inst_ptr = target
+            else:
+                inst_ptr += 1
+        elif operation is Op.RESET:
+            ctx.collect_output = False
+            ctx.piped = False
+            inst_ptr += 1
+        elif operation is Op.HISTORY:
+            ctx.history = arg
+            inst_ptr += 1
+        else:
             break
 
-        if jump and jump.target in labels:
-            # the position after the label
-            # as the label isn't an executable command
-            inst_ptr = labels[jump.target] + 1
-            ctx.jump = None
-            continue
-        inst_ptr += 1
+
+def handle_input(inp: str, ctx: Context):
+    """
+    Handle a Batch input from CLI.
+
+    Args:
+        inp: Batch commands as a string
+        ctx: Context instance
+    """
+    handle_stream(chunks=(inp,), ctx=ctx)
 
 
 def handle_file(path: str, ctx: Context):
     """
-    Open and handle a Batch file.
+    Open and handle a Batch file, executing it while it's being read.
+
+    The tokens are stored in the cache (BUTCH_CACHE_DIR) and loaded from
+    it for the next runs of the unchanged file. The SETLOCAL scopes left
+    open by the file are ended when it ends.
 
     Args:
         path: path to the Batch file
         ctx: Context instance
     """
+    depth = ctx.scope_depth
+    try:
+        _handle_file(path=path, ctx=ctx)
+    finally:
+        # implied ENDLOCAL
+        while ctx.scope_depth > depth:
+            ctx.pop_scope()
+
+
+def _handle_file(path: str, ctx: Context):
+    "Execute a Batch file from the cache or while reading it."
+    # pickle and hashlib aren't needed for the commands from the CLI
+    # pylint: disable=import-outside-toplevel
+    from hashlib import sha256
+    from butch.cache import get_cache, hash_chunks
+
+    cache = get_cache()
+    tokens = cache.load(path=path) if cache else None
+    if tokens is not None:
+        _run(program=Program(stream=iter(tokens)), ctx=ctx)
+        return
+
     with open(path) as fdes:
-        batch_file = fdes.read()
-    handle_input(inp=batch_file, ctx=ctx)
+        chunks = iter(partial(fdes.read, READ_CHUNK), "")
+        file_stat = fstat(fdes.fileno())
+        if not cache:
+            handle_stream(chunks=chunks, ctx=ctx, size=file_stat.st_size)
+            return
+
+        digest = sha256()
+        program = Program(stream=iter_tokenize(
+            chunks=hash_chunks(chunks=chunks, digest=digest), ctx=ctx,
+            size=file_stat.st_size
+        ))
+        store = partial(
+            _store, cache=cache, path=path, file_stat=file_stat,
+            digest=digest, program=program
+        )
+        try:
+            _run(program=program, ctx=ctx)
+        except SystemExit:
+            # EXIT command, the file itself is fine
+            store()
+            raise
+        store()
+
+
+def _store(  # pylint: disable=too-many-arguments
+        cache: Any, path: str, file_stat: Any, digest: Any,
+        program: Program
+):
+    "Tokenize the rest of a file and store all of its tokens in cache."
+    tokens = program.compile_all()
+    cache.store(
+        path=path, size=file_stat.st_size, mtime=file_stat.st_mtime_ns,
+        digest=digest.hexdigest(), tokens=tokens
+    )
 
 
 def handle(text: str, ctx: Context):
@@ -1,20 +1,189 @@
-"""Module for reading the help files from "help" folder."""
+"""
+Module for reading the help texts from the catalog in "help" folder.
+
+The texts are compiled from the <command>.txt files by butch.help.build
+into one resource, which is read once through importlib.resources when
+the help is needed for the first time. Every text is decoded at most once.
+"""
 
 import sys
-from os.path import abspath, dirname, join
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from butch.commandtype import CommandType
 
+CATALOG = "catalog.dat"
+HEADER = "butch-help 1\n"
+UNKNOWN = CommandType.UNKNOWN.value
+# HELP's list of the commands and their descriptions
+COMMANDS = "<commands>"
+
+
+class HelpCatalog:
+    """Help texts of the commands with an index by the command name."""
+
+    _index: Dict[str, Tuple[int, int, str, str]]
+    _data: memoryview
+    _texts: Dict[str, str]
+
+    def __init__(self, data: bytes):
+        """
+        Initialize HelpCatalog instance.
+
+        Args:
+            data (bytes): catalog from butch.help.build
+
+        Raises:
+            ValueError: when the data isn't a help catalog
+        """
+        head, sep, _ = data.partition(b"\n\n")
+        if not sep or not data.startswith(HEADER.encode("utf-8")):
+            raise ValueError("Not a help catalog")
+        self._index = {}
+        for line in head.decode("utf-8").split("\n")[1:]:
+            name, start, size, alias, summary = line.split("\t", 4)
+            self._index[name] = (int(start), int(size), alias, summary)
+        self._data = memoryview(data)[len(head) + len(sep):]
+        self._texts = {}
+
+    def __contains__(self, name: str):
+        """
+        Check the catalog has a text for a command.
+
+        Args:
+            name (str): lowercase command name
+
+        Returns:
+            bool
+        """
+        return name in self._index
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Property.
+
+        Returns:
+            sorted command names with a help text, without aliases
+            and the texts which aren't for a command
+        """
+        return sorted(
+            name for name, entry in self._index.items()
+            if not entry[2] and not name.startswith("<")
+        )
+
+    def text(self, name: str) -> Optional[str]:
+        """
+        Get the help text of a command.
+
+        Args:
+            name (str): lowercase command name
+
+        Returns:
+            str or None if there's no text for the command
+        """
+        found = self._texts.get(name)
+        if found is None and name in self._index:
+            start, size, _, _ = self._index[name]
+            found = str(self._data[start:start + size], "utf-8")
+            self._texts[name] = found
+        return found
+
+    def summary(self, name: str) -> str:
+        """
+        Get the description of a command.
+
+        Args:
+            name (str): lowercase command name
+
+        Returns:
+            str, empty if there's no text for the command
+        """
+        return self._index.get(name, (0, 0, "", ""))[3]
+
+    def search(self, keyword: str) -> List[str]:
+        """
+        Find the commands mentioning a keyword in their help.
+
+        Args:
+            keyword (str): case-insensitive word or phrase
+
+        Returns:
+            sorted command names
+        """
+        keyword = keyword.lower()
+        return [
+            name for name in self.names
+            if keyword in name or keyword in self.text(name).lower()
+        ]
+
+
+def _read_catalog() -> bytes:
+    "Read the catalog resource, even from a zip file."
+    # pylint: disable=import-outside-toplevel
+    try:
+        from importlib.resources import files
+    except ImportError:
+        # Python < 3.9
+        from pkgutil import get_data
+        return get_data(__name__, CATALOG)
+    return files(__name__).joinpath(CATALOG).read_bytes()
+
+
+@lru_cache(maxsize=1)
+def get_catalog() -> HelpCatalog:
+    """
+    Load the help catalog once.
+
+    Returns:
+        HelpCatalog instance
+    """
+    return HelpCatalog(data=_read_catalog())
+
 
 def print_help(cmd: CommandType, file=sys.stdout):  # noqa: WPS110
     """
-    Open a help file for passed CommandType and print it.
+    Print the help text of a CommandType.
 
     Args:
         cmd: CommandType instance
         file: file or standard output/error (default: sys.stdout)
     """
-    folder = dirname(abspath(__file__))
-    name = cmd.value.lower()
-    with open(join(folder, f"{name}.txt")) as fdes:
-        print(fdes.read(), file=file)
+    catalog = get_catalog()
+    text = catalog.text(cmd.value.lower())
+    if text is None:
+        text = catalog.text(UNKNOWN)
+    elif cmd == CommandType.HELP:
+        text += "\n" + catalog.text(COMMANDS)
+    print(text, file=file)
+
+
+def print_all(file=sys.stdout):  # noqa: WPS110
+    """
+    Print the help texts of all the commands, e.g. for HELP /ALL.
+
+    Args:
+        file: file or standard output/error (default: sys.stdout)
+    """
+    catalog = get_catalog()
+    for name in catalog.names:
+        print(name.upper(), file=file)
+        print(catalog.text(name), file=file)
+
+
+def print_found(keyword: str, file=sys.stdout) -> bool:  # noqa: WPS110
+    """
+    Print the commands with a keyword in their help and their descriptions.
+
+    Args:
+        keyword (str): case-insensitive word or phrase
+        file: file or standard output/error (default: sys.stdout)
+
+    Returns:
+        whether any command was found
+    """
+    catalog = get_catalog()
+    found = catalog.search(keyword=keyword)
+    for name in found:
+        print(f"{name.upper():<15}{catalog.summary(name)}", file=file)
+    return bool(found)
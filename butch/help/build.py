@@ -0,0 +1,146 @@
+"""
+Compile the help texts into the catalog read by butch.help.
+
+Run as ``python -m butch.help.build`` after changing a ``<command>.txt``
+file. The catalog is a single package resource with an index of the
+texts, so that ``HELP`` doesn't open a file per command and works from
+a zipapp as well. The list of the commands for ``HELP`` is compiled too.
+"""
+
+import re
+from glob import glob
+from os.path import basename, dirname, join, splitext
+from textwrap import fill
+from typing import Dict, List
+
+from butch.commands import get_cmd_map
+from butch.help import CATALOG, COMMANDS, HEADER, UNKNOWN
+
+# HELP's list, name column and a description
+LIST_WIDTH = 79
+LIST_INDENT = 15
+SENTENCE_END = re.compile(r"(?<=\.)\s+(?=[A-Z])")
+
+
+def summarize(text: str) -> str:
+    """
+    Get the description of a command from its help text.
+
+    Args:
+        text (str): help text
+
+    Returns:
+        the first sentence in a single line
+    """
+    paragraph = " ".join(text.strip().split("\n\n")[0].split())
+    return SENTENCE_END.split(paragraph, maxsplit=1)[0]
+
+
+def read_sources(folder: str = None) -> Dict[str, str]:
+    """
+    Read the help texts of the commands.
+
+    Args:
+        folder (str): folder with the <command>.txt files, butch.help's
+            one if None
+
+    Returns:
+        dict with the lowercase command names and their texts
+    """
+    folder = folder or dirname(__file__)
+    texts = {}
+    for path in sorted(glob(join(folder, "*.txt"))):
+        with open(path, newline="") as fdes:
+            texts[splitext(basename(path))[0].lower()] = fdes.read()
+    return texts
+
+
+def get_aliases() -> Dict[str, str]:
+    """
+    Find the commands sharing a function with another command.
+
+    Returns:
+        dict with the aliases and the names of their commands,
+        e.g. "erase": "del"
+    """
+    first = {}
+    aliases = {}
+    for cmd, spec in get_cmd_map().items():
+        if spec in first:
+            aliases[cmd.value] = first[spec]
+        else:
+            first[spec] = cmd.value
+    return aliases
+
+
+def command_list(summaries: Dict[str, str]) -> str:
+    """
+    Format the list of the commands with their descriptions.
+
+    Args:
+        summaries (dict): command names and their descriptions
+
+    Returns:
+        str
+    """
+    lines = []
+    for name in sorted(summaries):
+        lines.append(fill(
+            summaries[name], width=LIST_WIDTH,
+            initial_indent=name.upper().ljust(LIST_INDENT),
+            subsequent_indent=" " * LIST_INDENT
+        ))
+    return "\n".join(lines) + "\n"
+
+
+def build(texts: Dict[str, str]) -> bytes:
+    """
+    Compile the help texts into the catalog.
+
+    Args:
+        texts (dict): command names and their texts from read_sources()
+
+    Returns:
+        bytes of the catalog
+    """
+    aliases = {
+        alias: name for alias, name in get_aliases().items()
+        if alias not in texts and name in texts
+    }
+    summaries = {
+        name: summarize(text) for name, text in texts.items()
+        if name != UNKNOWN
+    }
+    summaries.update(
+        (alias, summaries[name]) for alias, name in aliases.items()
+    )
+    texts = dict(texts)
+    texts[COMMANDS] = command_list(summaries=summaries)
+
+    index: List[str] = []
+    bodies = []
+    offsets = {}
+    offset = 0
+    for name, text in sorted(texts.items()):
+        body = text.encode("utf-8")
+        offsets[name] = (offset, len(body))
+        bodies.append(body)
+        offset += len(body)
+    for name in sorted(list(texts) + list(aliases)):
+        alias = aliases.get(name, "")
+        start, size = offsets[alias or name]
+        summary = summaries.get(name, "")
+        index.append(f"{name}\t{start}\t{size}\t{alias}\t{summary}\n")
+    head = HEADER + "".join(index) + "\n"
+    return head.encode("utf-8") + b"".join(bodies)
+
+
+def main():
+    """Write the catalog next to the help texts."""
+    data = build(texts=read_sources())
+    with open(join(dirname(__file__), CATALOG), "wb") as fdes:
+        fdes.write(data)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Module for input containers."""
 from io import StringIO
+from typing import TextIO
 
 
 class CommandInput:
@@ -7,15 +8,17 @@ class CommandInput:
 
     _stdin: StringIO
 
-    def __init__(self, stdin: bool = True):
+    def __init__(self, stdin: bool = True, stream: TextIO = None):
         """
         Initialize STDIN buffer based on params.
 
         Args:
             stdin (bool): should create STDIN buffer
+            stream (TextIO): existing STDIN buffer to use (e.g. a pipe)
         """
-        # ask to allocate, don't provide custom though
         self._stdin = StringIO() if stdin else None
+        if stream is not None:
+            self._stdin = stream
 
     @property
     def stdin(self):
@@ -0,0 +1,221 @@
+"""Module for the commands running in the background, e.g. from START."""
+
+from itertools import count
+from threading import Lock, Thread
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+class Job:
+    """
+    Command running in a thread concurrently with the Batch code.
+
+    The thread only waits for a process started beforehand, a program or
+    a separate interpreter running a Batch file (butch.start_runner).
+    """
+
+    _number: int
+    _name: str
+    _code: Optional[int]
+    _error: Optional[Exception]
+    _thread: Thread
+
+    def __init__(self, number: int, name: str, run: Callable[[], int]):
+        """
+        Initialize Job instance, the job isn't running yet.
+
+        Args:
+            number (int): number unique in a JobTable
+            name (str): command line of the job
+            run (Callable): function returning the exit code
+        """
+        self._number = number
+        self._name = name
+        self._code = None
+        self._error = None
+        self._thread = Thread(
+            target=self._run, args=(run,), name=f"butch-job-{number}",
+            daemon=True
+        )
+
+    def __repr__(self):
+        """
+        Get a string representation of the job.
+
+        Returns:
+            str
+        """
+        state = "running" if self.running else f"done ({self._code})"
+        return f"<Job {self._number} {state}: {self._name}>"
+
+    @property
+    def number(self):
+        """
+        Property.
+
+        Returns:
+            number of the job
+        """
+        return self._number
+
+    @property
+    def name(self):
+        """
+        Property.
+
+        Returns:
+            command line of the job
+        """
+        return self._name
+
+    @property
+    def running(self):
+        """
+        Property.
+
+        Returns:
+            bool
+        """
+        return self._thread.is_alive()
+
+    @property
+    def code(self):
+        """
+        Property.
+
+        Returns:
+            exit code or None while running
+        """
+        return self._code
+
+    @property
+    def error(self):
+        """
+        Property.
+
+        Returns:
+            exception the job failed with or None
+        """
+        return self._error
+
+    def start(self) -> None:
+        """Start the job's thread."""
+        self._thread.start()
+
+    def wait(self, timeout: float = None) -> Optional[int]:
+        """
+        Wait for the job to finish.
+
+        Args:
+            timeout (float): seconds to wait at most, forever if None
+
+        Returns:
+            exit code or None if still running
+        """
+        self._thread.join(timeout)
+        return self._code
+
+    def _run(self, run: Callable[[], int]) -> None:
+        "Store the result of the job, the error is not for the thread."
+        try:
+            self._code = run()
+        except Exception as exc:  # pylint: disable=broad-except
+            self._error = exc
+            self._code = 1
+
+
+class JobTable:
+    """
+    Jobs started from a Context, each waiting for its own process.
+
+    The jobs are kept until waited for, so that the finished ones can
+    still be listed with their exit codes.
+    """
+
+    _jobs: Dict[int, Job]
+    _numbers: Iterator[int]
+    _lock: Lock
+
+    def __init__(self):
+        """Initialize JobTable instance."""
+        self._jobs = {}
+        self._numbers = count(1)
+        self._lock = Lock()
+
+    def __len__(self):
+        """
+        Get the number of jobs not waited for.
+
+        Returns:
+            int
+        """
+        return len(self._jobs)
+
+    def __iter__(self) -> Iterator[Job]:
+        """
+        Iterate over the jobs not waited for in the starting order.
+
+        Yields:
+            Job instances
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        yield from jobs
+
+    def __getitem__(self, number: int) -> Job:
+        """
+        Get a job by its number.
+
+        Args:
+            number (int): number of the job
+
+        Returns:
+            Job instance
+
+        Raises:
+            KeyError: when the job isn't in the table
+        """
+        return self._jobs[number]
+
+    @property
+    def running(self):
+        """
+        Property.
+
+        Returns:
+            list of the jobs still running
+        """
+        return [job for job in self if job.running]
+
+    def start(self, name: str, run: Callable[[], int]) -> Job:
+        """
+        Start a job and add it to the table.
+
+        Args:
+            name (str): command line of the job
+            run (Callable): function returning the exit code
+
+        Returns:
+            the started Job
+        """
+        with self._lock:
+            job = Job(number=next(self._numbers), name=name, run=run)
+            self._jobs[job.number] = job
+        job.start()
+        return job
+
+    def wait(self) -> List[Job]:
+        """
+        Wait for all jobs, including the ones started in the meantime.
+
+        Returns:
+            the finished jobs in the starting order, removed from the table
+        """
+        done = []
+        while self._jobs:
+            for job in self:
+                job.wait()
+                with self._lock:
+                    # another thread might have waited for it already
+                    if self._jobs.pop(job.number, None) is not None:
+                        done.append(job)
+        return done
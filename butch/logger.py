@@ -1,19 +1,49 @@
-"""Module containing all logging details."""
+"""
+Module containing all logging details.
 
-import logging
+The logging module is imported and configured only once the logger is
+used, which doesn't happen without DEBUG, because the debug messages
+are skipped then.
+"""
+
+from functools import lru_cache
 from os import environ
 
+# logging.DEBUG without importing logging
+DEBUG_LEVEL = 10
+
+
+def emptyf(*_, **__):
+    "Empty function that does nothing, replacement for disabled logging."
+
+
+def debug_enabled() -> bool:
+    """
+    Check the debug logging is requested by DEBUG.
+
+    Returns:
+        bool
+    """
+    return bool(environ.get("DEBUG"))
+
+
+@lru_cache(maxsize=1)
+def _configure() -> None:
+    "Configure the root logger, DEBUG is read only the first time."
+    import logging  # pylint: disable=import-outside-toplevel
+
+    level = logging.DEBUG if debug_enabled() else logging.INFO
+    logging.basicConfig(level=level, force=True)
+
 
 def get_logger():
     """
-    Create a basic logger and return it.
+    Create a basic logger and return it, configure logging only once.
 
     Returns:
         logging.RootLogger
     """
-    logger = logging.getLogger(__name__)
-    level = logging.INFO
-    if environ.get("DEBUG"):
-        level = logging.DEBUG
-    logging.basicConfig(level=level, force=True)
-    return logger
+    import logging  # pylint: disable=import-outside-toplevel
+
+    _configure()
+    return logging.getLogger(__name__)
@@ -1,13 +1,185 @@
 """Module for output containers if simple print() or return isn't enough."""
+from collections import deque
 from io import StringIO
+from threading import Condition
+from typing import Deque, Optional, TextIO
+
+# chars buffered between two commands in a pipe before the writer waits
+PIPE_SIZE = 65536
 
 
 class DevNull(StringIO):
-    """StringIO alias to collect and discard the output."""
+    """StringIO alias to discard the output."""
 
     def __repr__(self):
         return "</dev/null>"
 
+    def write(self, text: str) -> int:
+        """
+        Discard text instead of storing it.
+
+        Args:
+            text (str): text to write
+
+        Returns:
+            number of chars "written"
+        """
+        return len(text)
+
+
+class PipeBuffer:  # noqa: WPS214
+    """
+    Bounded text buffer connecting two commands running concurrently.
+
+    The writer waits while the buffer is full and the reader waits while
+    it's empty, so a pipe holds at most ``size`` chars no matter how much
+    text passes through it. The writer ends the text with close(), the
+    reader drops the rest with close_reader() and the writes are then
+    discarded, similarly to a broken pipe.
+    """
+
+    _chunks: Deque[str]
+    _buffered: int
+    _size: int
+    _closed: bool
+    _broken: bool
+    _cond: Condition
+
+    def __init__(self, size: int = PIPE_SIZE):
+        """
+        Initialize PipeBuffer instance.
+
+        Args:
+            size (int): max number of buffered chars
+        """
+        self._chunks = deque()
+        self._buffered = 0
+        self._size = max(size, 1)
+        self._closed = False
+        self._broken = False
+        self._cond = Condition()
+
+    def __repr__(self):
+        return f"<pipe {self._buffered}/{self._size}>"
+
+    def __iter__(self):
+        """
+        Iterate over the lines until the writer closes the pipe.
+
+        Yields:
+            lines including the line break
+        """
+        while True:
+            line = self.readline()
+            if not line:
+                return
+            yield line
+
+    def write(self, text: str) -> int:
+        """
+        Write text, wait for the reader while the buffer is full.
+
+        Args:
+            text (str): text to write
+
+        Returns:
+            number of chars written
+        """
+        cond = self._cond
+        written = len(text)
+        with cond:
+            while text and not self._broken:
+                free = self._size - self._buffered
+                if free <= 0:
+                    cond.wait()
+                    continue
+                part = text[:free]
+                text = text[free:]
+                self._chunks.append(part)
+                self._buffered += len(part)
+                cond.notify_all()
+        return written
+
+    def flush(self) -> None:
+        """Do nothing, the written text is readable immediately."""
+
+    def read(self, size: int = -1) -> str:
+        """
+        Read chars, wait for the writer until there are enough of them.
+
+        Args:
+            size (int): number of chars, all until closed if negative
+
+        Returns:
+            less than requested only if the writer closed the pipe
+        """
+        parts = []
+        missing = size
+        with self._cond:
+            while missing:
+                part = self._take(limit=missing)
+                if part is None:
+                    break
+                parts.append(part)
+                missing -= len(part)
+        return "".join(parts)
+
+    def readline(self) -> str:
+        """
+        Read a line, wait for the writer until it's complete.
+
+        Returns:
+            line with the line break or the rest of the text when closed
+        """
+        parts = []
+        with self._cond:
+            while True:
+                chunk = self._peek()
+                if chunk is None:
+                    break
+                brk = chunk.find("\n")
+                part = self._take(limit=-1 if brk < 0 else brk + 1)
+                parts.append(part)
+                if brk >= 0:
+                    break
+        return "".join(parts)
+
+    def close(self) -> None:
+        """Close the writing end, the reader gets the rest and then EOF."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def close_reader(self) -> None:
+        """Close the reading end, the buffered and further text is dropped."""
+        with self._cond:
+            self._broken = True
+            self._chunks.clear()
+            self._buffered = 0
+            self._cond.notify_all()
+
+    def _peek(self) -> Optional[str]:
+        "Wait for the first chunk, None if the pipe is closed and empty."
+        while not self._chunks:
+            if self._closed or self._broken:
+                return None
+            self._cond.wait()
+        return self._chunks[0]
+
+    def _take(self, limit: int) -> Optional[str]:
+        "Remove up to limit chars (all if negative) from the first chunk."
+        chunk = self._peek()
+        if chunk is None:
+            return None
+        if 0 <= limit < len(chunk):
+            self._chunks[0] = chunk[limit:]
+            chunk = chunk[:limit]
+        else:
+            self._chunks.popleft()
+        self._buffered -= len(chunk)
+        self._cond.notify_all()
+        return chunk
+
 
 class CommandOutput:
     """Container for STDOUT and STDERR buffers for piping and redirection."""
@@ -17,7 +189,7 @@ class CommandOutput:
 
     def __init__(
             self, stdout: bool = True, stderr: bool = False,
-            discard: bool = False
+            discard: bool = False, stream: TextIO = None
     ):
         """
         Initialize STDOUT and/or STDERR buffers based on params.
@@ -25,10 +197,13 @@ class CommandOutput:
         Args:
             stdout (bool): should create STDOUT buffer
             stderr (bool): should create STDERR buffer
+            discard (bool): should discard the output
+            stream (TextIO): existing STDOUT buffer to use (e.g. a pipe)
         """
-        # ask to allocate, don't provide custom though
         outclass = DevNull if discard else StringIO
         self._stdout = outclass() if stdout else None
+        if stream is not None:
+            self._stdout = stream
         self._stderr = outclass() if stderr else None
 
     @property
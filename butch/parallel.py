@@ -0,0 +1,346 @@
+"""
+Module for tokenizing huge Batch files in multiple processes.
+
+The code is split only after lines whose tokenizer state can be guessed
+from the line alone, each part is tokenized from the guessed state and
+the outputs are stitched in order. A part whose real starting state
+differs from the guessed one (e.g. the split ended up in a block or after
+a caret) is tokenized again sequentially, so the result is always the same
+as tokenizing the whole text at once.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count, environ
+from typing import Iterable, List, Optional, Tuple
+
+from butch.commandtype import CommandType
+from butch.context import Context
+from butch.grammar import DELIM_WHITE
+from butch.tokenizer import (
+    Command, Connector, Flag, TableLexer, _PLAIN_LINE
+)
+from butch.tokens import Token
+
+PARALLEL_ENV = "BUTCH_PARALLEL_SIZE"
+PARALLEL_SIZE = 16 * 1024 * 1024
+WORKERS_ENV = "BUTCH_PARALLEL_WORKERS"
+# how many lines to look at for a split point before giving up
+SPLIT_SEARCH = 1000
+
+Span = Tuple[int, int, Optional[bool]]
+
+
+def get_parallel_size() -> int:
+    """
+    Get the size from which a file is tokenized in parallel.
+
+    Returns:
+        number of chars, 0 if disabled with an empty BUTCH_PARALLEL_SIZE
+    """
+    return int(environ.get(PARALLEL_ENV, PARALLEL_SIZE) or 0)
+
+
+def get_workers() -> int:
+    """
+    Get the number of tokenizing processes.
+
+    Returns:
+        BUTCH_PARALLEL_WORKERS or the CPU count
+    """
+    return int(environ.get(WORKERS_ENV, 0) or cpu_count() or 1)
+
+
+def _word_flag(line: str) -> Optional[bool]:
+    """
+    Guess the word flag after a line without special chars.
+
+    Args:
+        line (str): line without the line break
+
+    Returns:
+        the flag or None if it depends on the previous lines
+    """
+    if not line:
+        return None
+    if line[-1] in DELIM_WHITE:
+        return False
+    for char in DELIM_WHITE:
+        if char in line:
+            return True
+    return None
+
+
+def _split_point(
+        text: str, start: int, part: int
+) -> Tuple[int, Optional[bool]]:
+    """
+    Find a line start at or after an offset suitable for a split.
+
+    Args:
+        text (str): Batch code
+        start (int): offset to look from
+        part (int): start of the previous part, assumed outside of a block
+
+    Returns:
+        offset of the line start (-1 if not found) and the guessed word flag
+    """
+    end = len(text) - 1
+    for _ in range(SPLIT_SEARCH):
+        brk = text.find("\n", start)
+        if brk < 0 or brk + 1 >= end:
+            break
+        line_start = text.rfind("\n", 0, brk) + 1
+        word = None
+        # most likely in a block, not worth trying
+        opened = text.count("(", part, brk) != text.count(")", part, brk)
+        if not opened and _PLAIN_LINE.match(text, line_start, brk + 1):
+            word = _word_flag(text[line_start:brk].rstrip("\r"))
+        if word is not None:
+            return brk + 1, word
+        start = brk + 1
+    return -1, None
+
+
+def split_text(text: str, parts: int) -> List[Span]:
+    """
+    Split Batch code into roughly equal parts at the line starts.
+
+    Args:
+        text (str): Batch code
+        parts (int): requested number of parts
+
+    Returns:
+        list of (start, end, guessed word flag) triples
+    """
+    size = len(text)
+    points = [(0, None)]
+    for part in range(1, parts):
+        target = max(size * part // parts, points[-1][0] + 1)
+        point, word = _split_point(
+            text=text, start=target, part=points[-1][0]
+        )
+        if point < 0:
+            break
+        points.append((point, word))
+
+    spans = []
+    for idx, (start, word) in enumerate(points):
+        end = points[idx + 1][0] if idx + 1 < len(points) else size
+        spans.append((start, end, word))
+    return spans
+
+
+def _tokenize_span(text: str, span: Span) -> Optional[tuple]:
+    """
+    Tokenize a part of Batch code from the guessed state in a worker.
+
+    The lexer continues after a placeholder command which must not be
+    touched if the guess about the previous line was right.
+
+    Args:
+        text (str): the part, the char before and after it (if any)
+        span (Span): (start, end, word flag) of the part in the whole code
+
+    Returns:
+        tokens and the state after the part or None if guessed wrong
+    """
+    start, end, word = span
+    lexer = TableLexer(ctx=Context())
+    placeholder = None
+    code = text
+    if start:
+        placeholder = Command(cmd=CommandType.UNKNOWN)
+        lexer.restore(state={
+            "flags": {Flag.WORD: word}, "compound": 0, "buff": "",
+            "found": None, "block": [], "tail": [placeholder]
+        }, prefix=text[0])
+        code = text[1:]
+
+    try:
+        output = lexer.feed(code)
+        if end == -1:
+            output.extend(lexer.close())
+    except Exception:  # pylint: disable=broad-except
+        # a wrong guess can break the tokenizer, the part is redone anyway
+        if start:
+            return None
+        raise
+
+    state = None
+    if end != -1:
+        state = lexer.save()
+        if len(state["rest"]) != 1:
+            return None
+        output.extend(state["tail"])
+
+    if placeholder is not None:
+        if not output or output[0] is not placeholder:
+            return None
+        if placeholder.args:
+            return None
+        output = output[1:]
+        # a splitter at the line start takes the previous command
+        if output and _leftmost(output[0]) is placeholder:
+            return None
+        if state is not None and state["tail"][0] is placeholder:
+            state["tail"] = []
+    return output, state
+
+
+def _leftmost(token: Token) -> Token:
+    """
+    Get the first command of a connector chain.
+
+    Args:
+        token (Token): any token
+
+    Returns:
+        the leftmost token or the token itself if it's not a Connector
+    """
+    while isinstance(token, Connector):
+        token = token.left
+    return token
+
+
+def _clean(state: dict) -> bool:
+    """
+    Check a state can be continued by a worker after a placeholder.
+
+    Args:
+        state (dict): state from TableLexer.save()
+
+    Returns:
+        True if nothing is unfinished and the last token is a command
+    """
+    if state["found"] or state["buff"] or state["block"]:
+        return False
+    # unmatched right parens make it negative, workers start from zero
+    if state["compound"]:
+        return False
+    tail = state["tail"]
+    return bool(tail) and isinstance(tail[0], Command)
+
+
+def _same_flags(state: dict, word: bool) -> bool:
+    """
+    Check the real flags are the ones a worker started with.
+
+    Args:
+        state (dict): state from TableLexer.save()
+        word (bool): guessed word flag
+
+    Returns:
+        True if the worker's guess was right
+    """
+    flags = state["flags"]
+    for flag in Flag:
+        expected = word if flag == Flag.WORD else False
+        if bool(flags.get(flag)) != expected:
+            return False
+    return True
+
+
+def _stitch(text: str, spans: List[Span], results: Iterable) -> list:
+    """
+    Join the outputs of the workers, tokenize the wrongly guessed parts.
+
+    A wrong guess is continued by a lexer in this process until a part
+    ends in a state the next worker could start from.
+
+    Args:
+        text (str): Batch code
+        spans (list): (start, end, word flag) of the parts
+        results (Iterable): outputs of _tokenize_span() for the parts
+
+    Returns:
+        list of tokens
+    """
+    output: list = []
+    state: dict = {}
+    lexer = None
+    fed = 0
+    for idx, (span, result) in enumerate(zip(spans, results)):
+        start, end, word = span
+        eof = idx == len(spans) - 1
+        if idx and lexer is None and (
+                result is None or not _clean(state)
+                or not _same_flags(state=state, word=word)
+        ):
+            lexer = TableLexer(ctx=Context())
+            lexer.restore(state=state, prefix=text[start - 1])
+            del output[len(output) - len(state["tail"]):]
+            fed = start
+
+        if lexer is not None:
+            # the char after the part is fed too, but not tokenized
+            stop = len(text) if eof else end + 1
+            output.extend(lexer.feed(text[fed:stop]))
+            fed = stop
+            if eof:
+                output.extend(lexer.close())
+                break
+            state = lexer.save()
+            if len(state["rest"]) == 1:
+                # back at the split, the next worker's guess can be used
+                lexer = None
+                output.extend(state["tail"])
+            continue
+
+        tokens, new_state = result
+        output.extend(tokens)
+        if new_state is not None and not new_state["tail"]:
+            # nothing new started, the previous token is still the last
+            new_state["tail"] = state.get("tail", [])
+        state = new_state
+    return output
+
+
+def tokenize_parallel(
+        text: str, ctx: Context, workers: int = None, parts: int = None
+) -> list:
+    """
+    Convert Batch code into tokens in multiple processes.
+
+    The output is the same as with the table lexer in a single process.
+
+    Args:
+        text (str): Batch code
+        ctx (Context): Context instance
+        workers (int): number of processes, defaults to get_workers()
+        parts (int): number of parts to split the code into,
+            defaults to the number of workers
+
+    Returns:
+        list of tokens
+    """
+    if workers is None:
+        workers = get_workers()
+    if parts is None:
+        parts = workers
+
+    # same as in TableLexer.feed(), applied before splitting
+    text = text.replace("\x1a", "\n")
+    spans = split_text(text=text, parts=parts)
+    if workers <= 1 or len(spans) == 1:
+        lexer = TableLexer(ctx=ctx)
+        output = lexer.feed(text)
+        output.extend(lexer.close())
+        return output
+
+    if ctx.trace:
+        ctx.log.debug(
+            "Tokenizing %d parts in %d processes", len(spans), workers
+        )
+    jobs = []
+    for idx, (start, end, word) in enumerate(spans):
+        last = idx == len(spans) - 1
+        jobs.append((
+            text[max(start - 1, 0):end if last else end + 1],
+            (start, -1 if last else end, word)
+        ))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _stitch(
+            text=text, spans=spans,
+            results=pool.map(_tokenize_span, *zip(*jobs))
+        )
@@ -0,0 +1,210 @@
+"""
+Server keeping a warm interpreter for running Batch from butch.client.
+
+Run as ``python -m butch.server [--socket PATH]``. Butch is imported and
+warmed up once, then every request is run in a process forked from
+the server, so it starts with all of the imports done, but nothing it
+changes (folder, environment, variables, open scopes or jobs) leaks into
+the other runs. The run gets the client's STDIN, STDOUT and STDERR and
+the exit code is sent back. POSIX only, it depends on Unix sockets,
+file descriptor passing and fork().
+"""
+
+import os
+import sys
+import traceback
+from argparse import ArgumentParser, Namespace
+from os.path import dirname, exists
+from signal import SIG_DFL, SIGTERM, signal
+from socketserver import BaseRequestHandler, ForkingMixIn, UnixStreamServer
+from typing import List
+
+from butch.__main__ import main as butch_main
+from butch.client import (
+    CODE, STD_FDS, check_folder, connect, get_socket_path, recv_request
+)
+from butch.commands import CMD_MAP
+from butch.context import Context
+from butch.tokenizer import tokenize
+
+# a socket connectable only by the server's user
+SOCKET_UMASK = 0o177
+FOLDER_MODE = 0o700
+WARM_UP = "@echo off\nset x=1 & echo %x% | type > nul\n"
+
+
+class ServerRunning(Exception):
+    """Raised when a server already listens on the socket."""
+
+
+def _exit_code(exc: SystemExit) -> int:
+    "Get the exit code the way the interpreter does on exit."
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def run_request(request: dict, fds: List[int]) -> int:
+    """
+    Run Butch for a client in a forked process.
+
+    Args:
+        request (dict): arguments, folder and environment of the client
+        fds (list): client's STDIN, STDOUT and STDERR
+
+    Returns:
+        exit code of the run
+    """
+    for target, fdes in zip(STD_FDS, fds):
+        os.dup2(fdes, target)
+        os.close(fdes)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+
+    code = 0
+    try:
+        butch_main(request["argv"])
+    except SystemExit as exc:
+        code = _exit_code(exc)
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return code
+
+
+class RunHandler(BaseRequestHandler):
+    """Handler of a client connection, running in a forked process."""
+
+    def handle(self):
+        """Run the request and send the exit code back."""
+        signal(SIGTERM, SIG_DFL)
+        try:
+            request, fds = recv_request(self.request)
+        except EOFError:
+            # e.g. checking whether the server is running
+            return
+        code = run_request(request=request, fds=fds)
+        self.request.sendall(CODE.pack(code))
+
+
+class ButchServer(ForkingMixIn, UnixStreamServer):
+    """Unix socket server forking a process per client."""
+
+    # CI starts many short runs at once, more wait for a free slot
+    max_children = 256
+
+
+def warm_up() -> None:
+    """Run the code paths used by the most of the scripts once."""
+    # the forked runs would import them on every call otherwise
+    CMD_MAP.load()
+    tokenize(text=WARM_UP, ctx=Context())
+
+
+def _remove_stale(path: str) -> None:
+    """
+    Remove a socket left by a server which didn't exit cleanly.
+
+    Args:
+        path (str): socket path
+
+    Raises:
+        ServerRunning: when a server listens on the socket
+    """
+    if not exists(path):
+        return
+    try:
+        sock = connect(path=path)
+    except OSError:
+        os.unlink(path)
+        return
+    sock.close()
+    raise ServerRunning(f"Server already running: {path}")
+
+
+def create_server(path: str = None) -> ButchServer:
+    """
+    Create a server listening on a socket only its user can connect to.
+
+    Args:
+        path (str): socket path, get_socket_path() if None
+
+    Returns:
+        ButchServer instance
+
+    Raises:
+        PermissionError: when the folder of the socket isn't private,
+            e.g. created by someone else, see check_folder()
+    """
+    path = path or get_socket_path()
+    os.makedirs(dirname(path) or ".", mode=FOLDER_MODE, exist_ok=True)
+    check_folder(path=path)
+    _remove_stale(path=path)
+    old_umask = os.umask(SOCKET_UMASK)
+    try:
+        return ButchServer(path, RunHandler)
+    finally:
+        os.umask(old_umask)
+
+
+def _terminate(*_):  # noqa: DAR101
+    "Exit on SIGTERM, so that the socket is removed."
+    sys.exit(0)
+
+
+def serve(path: str = None) -> None:
+    """
+    Serve the clients until interrupted or terminated.
+
+    Args:
+        path (str): socket path, get_socket_path() if None
+    """
+    warm_up()
+    server = create_server(path=path)
+    signal(SIGTERM, _terminate)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass  # noqa: WPS420
+        finally:
+            os.unlink(server.server_address)
+
+
+def get_cli_parser() -> ArgumentParser:
+    """
+    Assemble the argument parser of the server.
+
+    Returns:
+        argparse.ArgumentParser
+    """
+    cli = ArgumentParser(prog="python -m butch.server")
+    cli.add_argument(
+        "--socket", default=get_socket_path(),
+        help="socket path (default: BUTCH_SOCKET or %(default)s)"
+    )
+    return cli
+
+
+def main(argv: List[str] = None):
+    """
+    Run the server with the command line arguments.
+
+    Args:
+        argv (list): arguments, sys.argv if None
+    """
+    args: Namespace = get_cli_parser().parse_args(
+        sys.argv[1:] if argv is None else argv
+    )
+    serve(path=args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Interpreter running a Batch file started by START.
+
+Run as ``python -m butch.start_runner PATH [ARGUMENTS]``. Like in cmd,
+the Batch file runs in a separate process, so changing its folder,
+variables or open scopes never affects the interpreter which started it.
+The variables of the starting Context come as the environment, PATH and
+the arguments are %0 and %1..%9 of the Batch file.
+"""
+
+import sys
+from os import environ
+from typing import List
+
+from butch.__main__ import finish
+from butch.context import get_context
+from butch.handler import handle_file
+
+
+def main(argv: List[str] = None):
+    """
+    Run a Batch file with arguments, then exit with its ERRORLEVEL.
+
+    Args:
+        argv (list): path to the Batch file and its arguments,
+            sys.argv[1:] if None
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    ctx = get_context()
+    ctx.arguments = list(argv)
+    for name, value in environ.items():  # noqa: WPS110
+        ctx.set_variable(key=name, value_to_set=value)
+
+    handle_file(path=argv[0], ctx=ctx)
+    finish(ctx=ctx)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""
+Tests of Butch.
+
+The token cache is disabled for the whole suite, so that the tests never
+write into the cache folder of the user. Tests of the cache use their own
+temporary folder.
+"""
+
+from os import environ
+
+from butch.cache import CACHE_ENV
+
+environ[CACHE_ENV] = ""
@@ -0,0 +1,11 @@
+set outer=1
+setlocal
+set outer=2
+setlocal
+set outer=3
+endlocal
+echo %outer%
+endlocal
+echo %outer%
+setlocal enabledelayedexpansion
+set outer=left open
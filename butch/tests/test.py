@@ -8,7 +8,9 @@ import sys
 from io import StringIO
 from typing import Callable
 from unittest import main, TestCase
-from unittest.mock import patch, call as mock_call, _CallList, MagicMock
+from unittest.mock import (
+    patch, call as mock_call, _CallList, MagicMock, PropertyMock
+)
 from os.path import join, dirname, abspath, exists
 
 
@@ -48,6 +50,49 @@ class BetterParser(TestCase):
         self.assertEqual(pxp(line="-%%hello%-", ctx=ctx), "-%hello-")
         self.assertEqual(pxp(line="-%hello%%-", ctx=ctx), "-value-")
         self.assertEqual(pxp(line="-%%hello%%-", ctx=ctx), "-%hello%-")
+        # used to loop forever
+        self.assertEqual(pxp(line="%hello world%", ctx=ctx), "%hello world")
+
+    def test_expansion_template(self):
+        from butch.expansion import (
+            compile_percent, expand_argument, Segment
+        )
+        from butch.context import Context
+        from butch.tokens import Argument
+
+        self.assertEqual(compile_percent(line="-%%x%1%hello%%*"), (
+            (Segment.LITERAL, "-%x"), (Segment.ARGV, 1),
+            (Segment.VARIABLE, "hello"), (Segment.ARGS, None)
+        ))
+        self.assertEqual(compile_percent(line=""), ())
+
+        ctx = Context()
+        ctx.set_variable("hello", "value")
+        arg = Argument(value="<%hello%>")
+        self.assertEqual(expand_argument(arg=arg, ctx=ctx), "<value>")
+        template = arg.template
+        ctx.set_variable("hello", "other")
+        self.assertEqual(expand_argument(arg=arg, ctx=ctx), "<other>")
+        self.assertIs(arg.template, template)
+
+        # cached until the variables change
+        with patch("butch.expansion.expand_template") as expand:
+            self.assertEqual(expand_argument(arg=arg, ctx=ctx), "<other>")
+        expand.assert_not_called()
+        ctx.set_variable("HELLO", "third")
+        self.assertEqual(expand_argument(arg=arg, ctx=ctx), "<third>")
+        random = Argument(value="%random%")
+        self.assertNotEqual(
+            {expand_argument(arg=random, ctx=ctx) for _ in range(20)},
+            {expand_argument(arg=random, ctx=ctx)}
+        )
+
+        # recompiled after a change
+        arg.value = "plain"
+        self.assertIsNone(arg.template)
+        with patch("butch.expansion.expand_template") as expand:
+            self.assertEqual(expand_argument(arg=arg, ctx=ctx), "plain")
+        expand.assert_not_called()
 
 
 class Tokenizer(TestCase):
@@ -87,6 +132,81 @@ class Tokenizer(TestCase):
         self.assertFalse(flags[Flag.QUOTE])
         self.assertEqual(tokenize(text='"^\n', ctx=Context(), debug=False), [])
 
+    def test_pipe_chain(self):
+        from butch.tokenizer import tokenize, Lexer, Pipe
+        from butch.context import Context
+
+        for lexer in Lexer:
+            tokens = tokenize(
+                text="echo a | echo b c | echo d\n", ctx=Context(),
+                lexer=lexer
+            )
+            self.assertEqual(len(tokens), 1)
+            outer = tokens[0]
+            self.assertIsInstance(outer, Pipe)
+            self.assertIsInstance(outer.left, Pipe)
+            # the middle command isn't lost
+            self.assertEqual(
+                [arg.value for arg in outer.left.right.args], ["b", "c"]
+            )
+            self.assertEqual(outer.right.args[0].value, "d")
+
+    def test_redirection_lines(self):
+        from butch.tokenizer import tokenize, Lexer, Redirection
+        from butch.tokens import File
+        from butch.context import Context
+
+        for lexer in Lexer:
+            # a connector on the next line and a target on the last line
+            tokens = tokenize(
+                text="echo a > first.txt\necho b >> second.txt",
+                ctx=Context(), lexer=lexer
+            )
+            self.assertEqual(len(tokens), 2)
+            for token, target in zip(tokens, ("first.txt", "second.txt")):
+                self.assertIsInstance(token, Redirection)
+                self.assertEqual(token.right, File(value=target))
+            self.assertEqual(
+                [token.append for token in tokens], [False, True]
+            )
+            self.assertEqual(tokens[1].left.args[0].value, "b")
+
+    def test_word_before_splitter(self):
+        from butch.tokenizer import tokenize, Lexer, Redirection
+        from butch.tokens import File
+        from butch.context import Context
+
+        for lexer in Lexer:
+            tokens = tokenize(
+                text="set /p first=<huge.csv\n", ctx=Context(), lexer=lexer
+            )
+            self.assertEqual(len(tokens), 1)
+            redir = tokens[0]
+            self.assertIsInstance(redir, Redirection)
+            self.assertEqual(
+                [arg.value for arg in redir.left.args], ["/p", "first="]
+            )
+            self.assertEqual(redir.right, File(value="huge.csv"))
+
+    def test_quoted_then_words(self):
+        from butch.tokenizer import tokenize, Lexer
+        from butch.context import Context
+
+        for lexer in Lexer:
+            tokens = tokenize(
+                text='start "title" job.bat a\nx "y"z w\necho\n',
+                ctx=Context(), lexer=lexer
+            )
+            self.assertEqual(len(tokens), 3)
+            self.assertEqual(
+                [arg.value for arg in tokens[0].args],
+                ['"title"', "job.bat", "a"]
+            )
+            # a word glued to the closing quote is still one argument
+            self.assertEqual(
+                [arg.value for arg in tokens[1].args], ['"y"z', "w"]
+            )
+
     def test_unknown(self):
         from butch.tokenizer import tokenize, Command
         from butch.commandtype import CommandType
@@ -281,6 +401,272 @@ class Tokenizer(TestCase):
         self.assertIsInstance(first, Block)
         self.assertEqual(len(first), len(command.split("\n")) - 2)
 
+    def test_lexer_table_matches_film(self):
+        from butch.tokenizer import tokenize, Lexer
+        from butch.context import Context
+
+        commands = [
+            "echo  hello   world\n",
+            "echo \t\"quoted  value\"  x\n",
+            'set "name=value"ignored\n',
+            "echo a|b\n",
+            "echo a || echo b && echo c\n",
+            "echo hello >> file.txt\nset /p x=<file.txt\n",
+            "(\n    echo one\n    ver > nul\n)\necho %errorlevel%",
+            ":: comment | with & specials (\n:label\ngoto label\n",
+            "echo ^\nnext line\r\n@echo off\x1a",
+            "echo a\"b c\"d \"e\" f",
+            "   \t  ",
+        ]
+        for cmd in commands:
+            for debug in (False, True):
+                film = tokenize(
+                    text=cmd, ctx=Context(), debug=debug, lexer=Lexer.FILM
+                )
+                table = tokenize(
+                    text=cmd, ctx=Context(), debug=debug, lexer=Lexer.TABLE
+                )
+                if debug:
+                    film, table = dict(film), dict(table)
+                self.assertEqual(film, table, cmd)
+
+    def test_tokens_slots(self):
+        import pickle
+        from butch.tokenizer import Command, Concat, Redirection, RedirType
+        from butch.tokens import Argument, Block, File, Label
+        from butch.commandtype import CommandType
+
+        cmd = Command(cmd=CommandType.ECHO, args=[Argument(value="x")])
+        tokens = [
+            cmd, Argument(value="x", quoted=True), File(value="x"),
+            Label(value="x"), Block(values=[cmd]),
+            Concat(left=cmd, right=cmd),
+            Redirection(
+                redir_type=RedirType.OUTPUT, left=cmd,
+                right=File(value="x"), append=True
+            )
+        ]
+        for token in tokens:
+            self.assertFalse(hasattr(token, "__dict__"), token)
+            self.assertEqual(pickle.loads(pickle.dumps(token)), token)
+
+        # state of a token pickled before slots
+        old = Argument.__new__(Argument)
+        old.__setstate__({"_value": "x", "_quoted": True})
+        self.assertEqual(old, tokens[1])
+        self.assertTrue(old.quoted)
+
+    def test_command_args_own_list(self):
+        from butch.tokenizer import Command, tokenize
+        from butch.commandtype import CommandType
+        from butch.context import Context
+
+        self.assertIsNot(
+            Command(cmd=CommandType.ECHO).args,
+            Command(cmd=CommandType.ECHO).args
+        )
+        first, second = tokenize(text="echo a b\necho c\n", ctx=Context())
+        self.assertEqual([arg.value for arg in first.args], ["a", "b"])
+        self.assertEqual([arg.value for arg in second.args], ["c"])
+
+    def test_lexer_plain_lines(self):
+        from glob import glob
+        from os.path import join, dirname, abspath
+        from butch.tokenizer import tokenize, Lexer, TableLexer
+        from butch.context import Context
+
+        commands = [
+            "echo  hello   world\nset x=1\n@mkdir a\\b\ncls\n",
+            "echo hello \r\n\t  echo\tworld\t\r\necho x\x0b\nver\n",
+            "echo a > file.txt\ncls\necho a | more\necho b\n",
+            'echo "a"\necho b\n:label\necho c\n(\necho d\n)\necho e\n',
+            "echo ^\nnext line\necho a\n",
+        ]
+        batch = join(dirname(abspath(__file__)), "batch", "*.bat")
+        for path in sorted(glob(batch)):
+            with open(path) as fdes:
+                commands.append(fdes.read())
+
+        plain = patch.object(
+            TableLexer, "_plain_line", autospec=True,
+            side_effect=TableLexer._plain_line
+        )
+        with plain as fast:
+            for cmd in commands:
+                for debug in (False, True):
+                    film = tokenize(
+                        text=cmd, ctx=Context(), debug=debug,
+                        lexer=Lexer.FILM
+                    )
+                    table = tokenize(
+                        text=cmd, ctx=Context(), debug=debug,
+                        lexer=Lexer.TABLE
+                    )
+                    if debug:
+                        film, table = dict(film), dict(table)
+                    self.assertEqual(film, table, cmd)
+        self.assertTrue(fast.called)
+
+    def test_iter_tokenize_chunks(self):
+        from glob import glob
+        from os.path import join, dirname, abspath
+        from butch.tokenizer import tokenize, iter_tokenize, Lexer
+        from butch.context import Context
+
+        commands = [
+            "echo  hello   world\n",
+            'set "name=value"ignored\n',
+            "echo a || echo b && echo c\n",
+            "(\n    echo one\n    ver > nul\n)\necho %errorlevel%",
+            ":: comment | with & specials (\n:label\ngoto label\n",
+            "echo ^\nnext line\r\n@echo off\x1a",
+        ]
+        batch = join(dirname(abspath(__file__)), "batch", "*.bat")
+        for path in sorted(glob(batch)):
+            with open(path) as fdes:
+                commands.append(fdes.read())
+
+        for cmd in commands:
+            whole = tokenize(text=cmd, ctx=Context(), lexer=Lexer.FILM)
+            for size in (1, 2, 7):
+                chunks = [
+                    cmd[idx:idx + size] for idx in range(0, len(cmd), size)
+                ]
+                self.assertEqual(list(iter_tokenize(
+                    chunks=chunks, ctx=Context(), lexer=Lexer.TABLE
+                )), whole, (cmd, size))
+
+    def test_iter_tokenize_lazy(self):
+        from butch.tokenizer import iter_tokenize, Lexer, Command
+        from butch.commandtype import CommandType
+        from butch.context import Context
+
+        read = []
+
+        def chunks():
+            lines = ("echo one\n", "echo two\n", "echo 3\n", "echo 4\n")
+            for chunk in lines:
+                read.append(chunk)
+                yield chunk
+
+        stream = iter_tokenize(
+            chunks=chunks(), ctx=Context(), lexer=Lexer.TABLE
+        )
+        first = next(stream)
+        self.assertEqual(first.cmd, CommandType.ECHO)
+        self.assertEqual(first.args[0].value, "one")
+        # the last token can still change until the next one starts
+        self.assertEqual(len(read), 3)
+        self.assertEqual(len(list(stream)), 3)
+
+    def test_command_resolved_func(self):
+        from butch.tokenizer import tokenize, Lexer
+        from butch.commands.echo import cmd_echo
+        from butch.context import Context
+
+        for lexer in Lexer:
+            with patch("butch.commands.get_reverse_cmd_map") as rev_map:
+                output = tokenize(
+                    text="echo hello\nunknown cmd\n", ctx=Context(),
+                    lexer=lexer
+                )
+            rev_map.assert_not_called()
+            self.assertIs(output[0].func, cmd_echo)
+            self.assertIsNone(output[1].func)
+
+    def test_tracing_off(self):
+        from butch.tokenizer import tokenize, Lexer
+        from butch.context import Context
+
+        ctx = Context()
+        trace = patch(
+            "butch.context.Context.trace", new_callable=PropertyMock,
+            return_value=False
+        )
+        for lexer in Lexer:
+            with trace, patch.object(ctx.log, "debug") as debug:
+                tokenize(
+                    text="echo a|b\n(\n  echo c\n)\n", ctx=ctx,
+                    lexer=lexer
+                )
+            debug.assert_not_called()
+
+    def test_tracing_per_char(self):
+        from butch.tokenizer import tokenize
+        from butch.context import Context
+
+        ctx = Context()
+        text = "echo hello\n"
+        trace = patch(
+            "butch.context.Context.trace", new_callable=PropertyMock,
+            return_value=True
+        )
+        with trace, patch.object(ctx.log, "debug") as debug:
+            tokenize(text=text, ctx=ctx)
+        positions = [
+            item for item in debug.call_args_list
+            if item.args[0].startswith("Position:")
+        ]
+        self.assertEqual(len(positions), len(text))
+
+    def test_logger_lazy(self):
+        from butch.context import Context
+        from butch.logger import _configure, get_logger
+
+        with patch.dict("os.environ", {"DEBUG": ""}), \
+                patch("butch.context.get_logger") as lazy:
+            ctx = Context()
+            self.assertFalse(ctx.trace)
+            lazy.assert_not_called()
+
+        _configure.cache_clear()
+        with patch("logging.basicConfig") as config:
+            get_logger()
+            get_logger()
+        config.assert_called_once()
+
+    def test_main_imports_lazy(self):
+        import subprocess
+
+        # a fresh interpreter, nothing imported by a previous test
+        code = (
+            "import sys\n"
+            "import butch.__main__\n"
+            "print(sorted(name for name in ('locale', 'shutil', 'tempfile')\n"
+            "    if name in sys.modules))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], check=True,
+            stdout=subprocess.PIPE, universal_newlines=True
+        ).stdout
+        self.assertEqual(out, "[]\n")
+
+        # nor when running a command, TEMP is resolved only if used
+        code = (
+            "import sys\n"
+            "from butch.__main__ import main\n"
+            "try:\n"
+            "    main(['/C', 'echo hi'])\n"
+            "except SystemExit:\n"
+            "    print('tempfile' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], check=True,
+            stdout=subprocess.PIPE, universal_newlines=True
+        ).stdout
+        self.assertEqual(out, "hi\nFalse\n")
+
+    def test_lexer_from_environment(self):
+        from butch.tokenizer import tokenize, Lexer, LEXER_ENV
+        from butch.context import Context
+
+        for lexer in Lexer:
+            with patch.dict("os.environ", {LEXER_ENV: lexer.value}):
+                with patch.dict("butch.tokenizer.LEXERS") as lexers:
+                    lexers[lexer] = MagicMock()
+                    tokenize(text="echo", ctx=Context())
+                    lexers[lexer].assert_called_once()
+
 
 class State(TestCase):
     def test_unknown_skipped(self):
@@ -308,7 +694,7 @@ class Execution(TestCase):
         ctx = Context()
         values = ["a", "b", "c"]
 
-        with patch("butch.commands.print") as mock:
+        with patch("butch.commands.echo.print") as mock:
             call(cmd=Command(cmd=CommandType.ECHO, args=[
                 Argument(value=value)
                 for value in values
@@ -330,7 +716,7 @@ class Execution(TestCase):
         chdir_mock = patch(
             "butch.context.chdir", side_effect=FileNotFoundError()
         )
-        with chdir_mock as chdir, patch("butch.commands.print") as mock:
+        with chdir_mock as chdir, patch("butch.commands.cd.print") as mock:
             call(cmd=Command(cmd=CommandType.CD, args=[
                 Argument(value=value)
             ]), ctx=ctx)
@@ -349,7 +735,7 @@ class Execution(TestCase):
         value = "existing"
 
         chdir_mock = patch("butch.context.chdir")
-        with chdir_mock as chdir, patch("butch.commands.print") as mock:
+        with chdir_mock as chdir, patch("butch.commands.cd.print") as mock:
             call(cmd=Command(cmd=CommandType.CD, args=[
                 Argument(value=value)
             ]), ctx=ctx)
@@ -366,7 +752,7 @@ class Execution(TestCase):
 
         ctx = Context()
 
-        with patch("butch.commands._print_all_variables") as mock:
+        with patch("butch.commands.set_._print_all_variables") as mock:
             call(cmd=Command(cmd=CommandType.SET, args=[]), ctx=ctx)
             mock.assert_called_once_with(ctx=ctx, file=sys.stdout)
 
@@ -381,7 +767,7 @@ class Execution(TestCase):
         ctx = Context()
         value = "hello"
 
-        with patch("butch.commands._print_single_variable") as mock:
+        with patch("butch.commands.set_._print_single_variable") as mock:
             call(cmd=Command(cmd=CommandType.SET, args=[
                 Argument(value=value)
             ]), ctx=ctx)
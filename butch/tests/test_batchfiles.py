@@ -56,20 +56,25 @@ def assert_bat_output_match(
 
 def assert_bat_token_match(batch_path: str):
     from butch.context import Context
-    from butch.tokenizer import tokenize
-
-    ctx = Context()
-    with open(batch_path) as bat_file:
-        text = bat_file.read()
-        tokens_newline = tokenize(text=text, ctx=ctx)
-        tokens_stripped = tokenize(text=text.rstrip("\n"), ctx=ctx)
+    from butch.tokenizer import tokenize, Lexer
 
     with open(join(BATCH_FOLDER, f"{batch_path}.pickle"), "rb") as file:
         expected = pickle.load(file)
 
-    assert tokens_newline == expected, (tokens_newline, expected)
-    assert tokens_stripped == expected, (tokens_stripped, expected)
-    assert ctx.error_level == 0
+    for lexer in Lexer:
+        ctx = Context()
+        with open(batch_path) as bat_file:
+            text = bat_file.read()
+            tokens_newline = tokenize(text=text, ctx=ctx, lexer=lexer)
+            tokens_stripped = tokenize(
+                text=text.rstrip("\n"), ctx=ctx, lexer=lexer
+            )
+
+        assert tokens_newline == expected, (lexer, tokens_newline, expected)
+        assert tokens_stripped == expected, (
+            lexer, tokens_stripped, expected
+        )
+        assert ctx.error_level == 0
 
 
 class BatchFiles(TestCase):
@@ -387,7 +392,7 @@ class BatchFiles(TestCase):
         ctx = Context()
         self.assertFalse(exists("new-folder"))
 
-        with patch("butch.commands.makedirs") as mdrs:
+        with patch("butch.commands.mkdir.makedirs") as mdrs:
             handle(text=join(BATCH_FOLDER, script_name), ctx=ctx)
             mdrs.assert_called_once()
 
@@ -410,7 +415,7 @@ class BatchFiles(TestCase):
         ctx = Context()
         self.assertFalse(exists(tree))
 
-        with patch("butch.commands.makedirs") as mdrs:
+        with patch("butch.commands.mkdir.makedirs") as mdrs:
             handle(text=join(BATCH_FOLDER, script_name), ctx=ctx)
             mdrs.assert_called_once()
 
@@ -580,7 +585,7 @@ class BatchFiles(TestCase):
         self.assertFalse(exists(filename))
 
         cmd_out = CommandOutput()
-        with patch("butch.commands.CommandOutput") as out_mock:
+        with patch("butch.caller.CommandOutput") as out_mock:
             out_mock.return_value = cmd_out
 
             handle_new(text=join(BATCH_FOLDER, script_name), ctx=ctx)
@@ -613,7 +618,7 @@ class BatchFiles(TestCase):
         self.assertFalse(exists(filename))
 
         cmd_out = CommandOutput()
-        with patch("butch.commands.CommandOutput") as out_mock:
+        with patch("butch.commands.common.CommandOutput") as out_mock:
             out_mock.return_value = cmd_out
 
             with patch("sys.stdout"):
@@ -642,7 +647,7 @@ class BatchFiles(TestCase):
         self.assertFalse(exists(filename))
 
         cmd_out = CommandOutput()
-        with patch("butch.commands.CommandOutput") as out_mock:
+        with patch("butch.caller.CommandOutput") as out_mock:
             out_mock.return_value = cmd_out
 
             handle_new(text=join(BATCH_FOLDER, script_name), ctx=ctx)
@@ -671,7 +676,7 @@ class BatchFiles(TestCase):
         self.assertFalse(exists(filename))
 
         cmd_out = CommandOutput()
-        with patch("butch.commands.CommandOutput") as out_mock:
+        with patch("butch.commands.common.CommandOutput") as out_mock:
             out_mock.return_value = cmd_out
 
             with patch("sys.stdout"):
@@ -701,7 +706,7 @@ class BatchFiles(TestCase):
         self.assertFalse(exists(filename))
 
         cmd_out = CommandOutput()
-        with patch("butch.commands.CommandOutput") as out_mock:
+        with patch("butch.commands.common.CommandOutput") as out_mock:
             out_mock.return_value = cmd_out
 
             handle_new(text=join(BATCH_FOLDER, script_name), ctx=ctx)
@@ -730,7 +735,7 @@ class BatchFiles(TestCase):
         self.assertFalse(exists(filename))
 
         cmd_out = CommandOutput()
-        with patch("butch.commands.CommandOutput") as out_mock:
+        with patch("butch.commands.common.CommandOutput") as out_mock:
             out_mock.return_value = cmd_out
 
             with patch("sys.stdout"):
@@ -753,6 +758,21 @@ class BatchFiles(TestCase):
         assert_bat_output_match(script_name, stdout.mock_calls, concat=True)
         self.assertEqual(ctx.error_level, 0)
 
+    @patch("builtins.print")
+    def test_setlocal_endlocal(self, stdout):
+        script_name = "setlocal_endlocal.bat"
+
+        from butch.context import Context
+        from butch.handler import handle as handle_new
+
+        ctx = Context()
+        handle_new(text=join(BATCH_FOLDER, script_name), ctx=ctx)
+        assert_bat_output_match(script_name, stdout.mock_calls, concat=True)
+        # the last SETLOCAL is ended with the file
+        self.assertEqual(ctx.get_variable(key="outer"), "1")
+        self.assertFalse(ctx.delayed_expansion_enabled)
+        self.assertEqual(ctx.scope_depth, 0)
+
     @patch("builtins.print")
     def test_path_unset(self, stdout):
         script_name = "path_unset.bat"
@@ -1022,7 +1042,8 @@ class BatchFiles(TestCase):
         with patch("builtins.print") as stdout:
             ctx = Context()
             handle_new(text=join(folder, script_name), ctx=ctx)
-            self.assertTrue(ctx.delayed_expansion_enabled)
+            # implied ENDLOCAL at the end of the file
+            self.assertFalse(ctx.delayed_expansion_enabled)
             mcalls = stdout.mock_calls
             self.assertEqual(len(mcalls), len(output))
 
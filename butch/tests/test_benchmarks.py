@@ -0,0 +1,94 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-many-lines,too-many-locals
+
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import main, TestCase
+from unittest.mock import patch
+
+
+class Benchmarks(TestCase):
+    def test_generate_script(self):
+        from butch.benchmarks import generate_script, TEMPLATES
+
+        for lines in (1, 3, len(TEMPLATES) * 3):
+            text = generate_script(lines=lines)
+            self.assertEqual(len(text.splitlines()), lines)
+            self.assertEqual(text.count("(\n"), text.count(")\n"))
+
+    def test_memory(self):
+        from butch.benchmarks.memory import measure
+
+        result = measure(lines=100)
+        self.assertEqual(result["lines"], 100)
+        self.assertGreater(result["instructions"], 0)
+        self.assertGreater(result["per_instruction"], 0)
+
+    def test_corpora(self):
+        from butch.benchmarks import CORPORA, generate_script
+        from butch.benchmarks.tokenizer import batch_files, corpus
+
+        for name, templates in CORPORA.items():
+            text = corpus(name=name, lines=50)[0]
+            self.assertEqual(
+                text, generate_script(lines=50, templates=templates)
+            )
+            self.assertEqual(len(text.splitlines()), 50)
+        self.assertEqual(corpus(name="batch"), batch_files())
+        self.assertGreater(len(batch_files()), 0)
+
+    def test_count_tokens(self):
+        from butch.benchmarks.tokenizer import count_tokens
+        from butch.context import Context
+        from butch.tokenizer import tokenize
+
+        tokens = tokenize(text="echo a b | more\n", ctx=Context())
+        # pipe, echo, its two args, more
+        self.assertEqual(count_tokens(tokens=tokens), 5)
+
+    def test_tokenizer_json(self):
+        import json
+        from butch.benchmarks.tokenizer import main as bench
+
+        with TemporaryDirectory() as folder:
+            path = join(folder, "results.json")
+            args = ["--corpus", "echo", "--corpus", "blocks"]
+            args += ["--lines", "100", "--repeat", "1"]
+            with patch("builtins.print"):
+                bench(argv=args + ["--output", path])
+                bench(argv=args + ["--baseline", path])
+            with open(path) as fdes:
+                report = json.load(fdes)
+
+        self.assertEqual(list(report["results"]), ["echo", "blocks"])
+        for result in report["results"].values():
+            self.assertGreater(result["chars_per_sec"], 0)
+            self.assertGreater(result["tokens_per_sec"], 0)
+            self.assertGreater(result["peak"], 0)
+
+    def test_startup_json(self):
+        import json
+        from butch.benchmarks.startup import main as bench
+
+        with TemporaryDirectory() as folder:
+            path = join(folder, "results.json")
+            args = ["--repeat", "1"]
+            with patch("builtins.print"):
+                bench(argv=args + ["--output", path])
+                bench(argv=args + ["--baseline", path])
+                with self.assertRaises(SystemExit):
+                    bench(argv=args + ["--budget", "0"])
+            with open(path) as fdes:
+                report = json.load(fdes)
+
+        results = report["results"]
+        self.assertEqual(report["command"], "echo hi")
+        self.assertGreater(results["startup"], results["interpreter"])
+        self.assertGreater(results["imports"], 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-many-lines,too-many-locals
+
+import os
+from os import chmod, environ, stat, utime
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import main, TestCase, skipIf
+from unittest.mock import patch
+
+SCRIPT = "echo hello\ngoto end\necho skipped\n:end\necho world\n"
+
+
+def write_script(folder: str, text: str = SCRIPT) -> str:
+    path = join(folder, "script.bat")
+    with open(path, "w") as fdes:
+        fdes.write(text)
+    return path
+
+
+def store_script(cache, path: str):
+    from butch.cache import text_digest
+    from butch.context import Context
+    from butch.tokenizer import tokenize
+
+    with open(path) as fdes:
+        text = fdes.read()
+    file_stat = stat(path)
+    tokens = tokenize(text=text, ctx=Context())
+    cache.store(
+        path=path, size=file_stat.st_size, mtime=file_stat.st_mtime_ns,
+        digest=text_digest([text]), tokens=tokens
+    )
+    return tokens
+
+
+class Cache(TestCase):
+    def test_store_load(self):
+        from butch.cache import ScriptCache
+
+        with TemporaryDirectory() as folder:
+            path = write_script(folder=folder)
+            cache = ScriptCache(folder=join(folder, "cache"))
+            self.assertIsNone(cache.load(path=path))
+
+            tokens = store_script(cache=cache, path=path)
+            loaded = cache.load(path=path)
+            self.assertEqual(loaded, tokens)
+            # resolved again after unpickling
+            self.assertIsNotNone(loaded[0].func)
+
+    @skipIf(os.name == "nt", "POSIX permissions")
+    def test_untrusted_folder(self):
+        from butch.cache import ScriptCache
+
+        with TemporaryDirectory() as folder:
+            path = write_script(folder=folder)
+            cache = ScriptCache(folder=join(folder, "cache"))
+            tokens = store_script(cache=cache, path=path)
+            self.assertEqual(stat(cache.folder).st_mode & 0o777, 0o700)
+
+            # writable by others, anyone could plant a pickle
+            chmod(cache.folder, 0o777)
+            self.assertFalse(cache.trusted())
+            self.assertIsNone(cache.load(path=path))
+            with patch("butch.cache.pickle.dump") as dump:
+                store_script(cache=cache, path=path)
+            dump.assert_not_called()
+
+            chmod(cache.folder, 0o700)
+            self.assertEqual(cache.load(path=path), tokens)
+
+            # owned by someone else
+            with patch("butch.cache.os.getuid", return_value=-1):
+                self.assertFalse(cache.trusted())
+                self.assertIsNone(cache.load(path=path))
+
+    def test_invalidation(self):
+        from butch.cache import ScriptCache
+
+        with TemporaryDirectory() as folder:
+            path = write_script(folder=folder)
+            cache = ScriptCache(folder=folder)
+            tokens = store_script(cache=cache, path=path)
+
+            # touched, same content
+            file_stat = stat(path)
+            mtime = file_stat.st_mtime_ns + 1
+            utime(path, ns=(file_stat.st_atime_ns, mtime))
+            self.assertEqual(cache.load(path=path), tokens)
+
+            # same size, different content
+            write_script(folder=folder, text=SCRIPT.upper())
+            utime(path, ns=(file_stat.st_atime_ns, mtime + 1))
+            self.assertIsNone(cache.load(path=path))
+
+            # different size
+            store_script(cache=cache, path=path)
+            write_script(folder=folder, text=SCRIPT + "echo\n")
+            self.assertIsNone(cache.load(path=path))
+
+    def test_version(self):
+        from butch.cache import ScriptCache
+
+        with TemporaryDirectory() as folder:
+            path = write_script(folder=folder)
+            cache = ScriptCache(folder=folder)
+            store_script(cache=cache, path=path)
+            with patch("butch.cache.get_version", return_value="0.0.0"):
+                self.assertIsNone(cache.load(path=path))
+
+            with open(cache.entry_path(path=path), "wb") as fdes:
+                fdes.write(b"corrupted")
+            self.assertIsNone(cache.load(path=path))
+
+    def test_eviction(self):
+        from butch.cache import ScriptCache
+
+        with TemporaryDirectory() as folder:
+            cache = ScriptCache(folder=join(folder, "cache"))
+            paths = []
+            for idx in range(3):
+                path = join(folder, f"{idx}.bat")
+                with open(path, "w") as fdes:
+                    fdes.write(SCRIPT)
+                store_script(cache=cache, path=path)
+                entry = cache.entry_path(path=path)
+                utime(entry, ns=(idx, idx))
+                paths.append(path)
+
+            # the oldest one goes first
+            size = stat(cache.entry_path(path=paths[0])).st_size
+            cache = ScriptCache(folder=cache.folder, limit=size * 2)
+            cache.evict()
+            self.assertIsNone(cache.load(path=paths[0]))
+            self.assertIsNotNone(cache.load(path=paths[1]))
+            self.assertIsNotNone(cache.load(path=paths[2]))
+
+    def test_handle_file(self):
+        from butch.cache import CACHE_ENV
+        from butch.context import Context
+        from butch.handler import handle_file
+        from butch.tokenizer import iter_tokenize
+
+        with TemporaryDirectory() as folder:
+            path = write_script(folder=folder)
+            env = patch.dict(environ, {CACHE_ENV: join(folder, "cache")})
+
+            calls = []
+            for _ in range(2):
+                tokenize = patch(
+                    "butch.handler.iter_tokenize", wraps=iter_tokenize
+                )
+                prnt = patch("butch.commands.echo.print")
+                with env, tokenize as tok, prnt as printed:
+                    handle_file(path=path, ctx=Context())
+                calls.append(tok.call_count)
+                printed = [args for args, _ in printed.call_args_list]
+                self.assertEqual(printed, [("hello", ), ("world", )])
+
+            # tokenized only in the first run
+            self.assertEqual(calls, [1, 0])
+
+    def test_handle_file_disabled(self):
+        from butch.cache import CACHE_ENV
+        from butch.context import Context
+        from butch.handler import handle_file
+
+        with TemporaryDirectory() as folder:
+            path = write_script(folder=folder)
+            with patch.dict(environ, {CACHE_ENV: ""}):
+                with patch("butch.cache.ScriptCache.store") as store:
+                    with patch("butch.commands.echo.print"):
+                        handle_file(path=path, ctx=Context())
+            store.assert_not_called()
+
+
+if __name__ == "__main__":
+    main()
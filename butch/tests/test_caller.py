@@ -5,7 +5,7 @@
 # pylint: disable=too-many-lines,too-many-locals
 
 from unittest import main, TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock
 from os.path import exists
 
 from butch.tests.utils import FuncCalls
@@ -22,7 +22,8 @@ class Caller(TestCase):
         args = [Argument(value=value) for value in params]
 
         ctx = Context()
-        with patch("butch.commands.cmd_echo") as echo:
+        echo = MagicMock()
+        with patch.dict("butch.commands.CMD_MAP", {CommandType.ECHO: echo}):
             self.assertEqual(call(cmd=Command(
                 cmd=CommandType.ECHO,
                 args=args
@@ -41,32 +42,106 @@ class Caller(TestCase):
                 Argument(value=value) for value in params
             ]), ctx=Context())
 
+    def test_tracing_off(self):
+        from butch.caller import new_call as call
+        from butch.context import Context
+        from butch.commandtype import CommandType
+        from butch.tokenizer import Command
+
+        ctx = Context()
+        trace = patch(
+            "butch.context.Context.trace", new_callable=PropertyMock,
+            return_value=False
+        )
+        with trace, patch.object(ctx.log, "debug") as debug:
+            with patch("butch.commands.echo.print"):
+                call(cmd=Command(cmd=CommandType.ECHO), ctx=ctx)
+        debug.assert_not_called()
+
     def test_output_redirection(self):
         from os import remove
         from tempfile import NamedTemporaryFile
         from butch.caller import _handle_redirection_output as handle
         from butch.context import Context
-        from butch.outputs import CommandOutput
 
         output_content = ["hello\n", "butch\n"]
-        output = CommandOutput()
-        for line in output_content:
-            output.stdout.write(line)
-        output.stdout.seek(0)
-
         ctx = Context()
-        ctx.output = output
 
         with NamedTemporaryFile(mode="w+", delete=False) as tmpfile:
+            tmpfile.write("old\n")
+            tmpfile.flush()
             tmp_path = tmpfile.name
-            handle(redir_target=tmp_path.replace("/", "\\"), ctx=ctx)
-            self.assertTrue(exists(tmp_path))
+
+            # commands write straight into the opened file
+            for append in (False, True):
+                descr = handle(
+                    redir_target=tmp_path.replace("/", "\\"), ctx=ctx,
+                    append=append
+                )
+                self.assertIs(ctx.output.stdout, descr)
+                ctx.output.stdout.write(output_content[append])
+                descr.close()
+
             tmpfile.seek(0)
             lines = tmpfile.readlines()
             self.assertEqual(lines, output_content)
             remove(tmp_path)
             self.assertFalse(exists(tmp_path))
 
+    def test_output_redirection_append(self):
+        from os import remove
+        from tempfile import NamedTemporaryFile
+        from butch.context import Context
+        from butch.handler import handle_input
+        from butch.outputs import DevNull
+
+        with NamedTemporaryFile(mode="w", delete=False) as tmpfile:
+            tmpfile.write("old\n")
+            tmp_path = tmpfile.name
+
+        ctx = Context()
+        handle_input(inp=f"echo a >> {tmp_path}\n", ctx=ctx)
+        with open(tmp_path) as tmpfile:
+            self.assertEqual(tmpfile.read(), "old\na\n")
+        handle_input(
+            inp=f"echo b > {tmp_path}\necho c >> {tmp_path}\n", ctx=ctx
+        )
+        with open(tmp_path) as tmpfile:
+            self.assertEqual(tmpfile.read(), "b\nc\n")
+        remove(tmp_path)
+        self.assertFalse(ctx.collect_output)
+        self.assertIsNone(ctx.output)
+
+        null = DevNull()
+        self.assertEqual(null.write("dropped"), 7)
+        self.assertEqual(null.getvalue(), "")
+
+    def test_redirection_restored_on_error(self):
+        from os import remove
+        from tempfile import NamedTemporaryFile
+        from butch.caller import new_call, UnknownCommand
+        from butch.commandtype import CommandType
+        from butch.context import Context
+        from butch.tokenizer import Command, File, Redirection, RedirType
+
+        with NamedTemporaryFile(mode="w", delete=False) as tmpfile:
+            tmp_path = tmpfile.name
+
+        ctx = Context()
+        for redir_type in (RedirType.OUTPUT, RedirType.INPUT):
+            with self.assertRaises(UnknownCommand):
+                new_call(cmd=Redirection(
+                    redir_type=redir_type,
+                    left=Command(cmd=CommandType.UNKNOWN),
+                    right=File(value=tmp_path)
+                ), ctx=ctx)
+            # no closed file left in the Context
+            self.assertFalse(ctx.collect_output)
+            self.assertIsNone(ctx.output)
+            self.assertFalse(ctx.inputted)
+            self.assertIsNone(ctx.input)
+        remove(tmp_path)
+
     def test_input_redirection(self):
         from os import remove
         from tempfile import NamedTemporaryFile
@@ -89,6 +164,40 @@ class Caller(TestCase):
             self.assertEqual(lines, input_content)
             remove(tmp_path)
 
+    def test_input_redirection_lazy(self):
+        from os import remove
+        from tempfile import NamedTemporaryFile
+        from butch.context import Context
+        from butch.handler import handle_input
+
+        with NamedTemporaryFile(mode="w", delete=False) as tmpfile:
+            for idx in range(10000):
+                tmpfile.write(f"line {idx}\n")
+            tmp_path = tmpfile.name
+
+        ctx = Context()
+        opened = []
+
+        def spy(*args, **kwargs):
+            # pylint: disable=consider-using-with,unspecified-encoding
+            descr = open(*args, **kwargs)
+            opened.append(descr)
+            return descr
+
+        with patch("butch.caller.open", side_effect=spy):
+            handle_input(inp=(
+                f"set /p first=<{tmp_path}\n"
+                f"set /p again=<{tmp_path}\n"
+            ), ctx=ctx)
+        remove(tmp_path)
+
+        self.assertEqual(ctx.get_variable(key="first"), "line 0")
+        self.assertEqual(ctx.get_variable(key="again"), "line 0")
+        # read from the file itself, closed after the command
+        self.assertEqual(len(opened), 2)
+        self.assertTrue(all(descr.closed for descr in opened))
+        self.assertFalse(ctx.inputted)
+
     def test_trigger_input_redirect_ctx_check(self):
         from butch.caller import new_call, UnknownCommand
         from butch.commandtype import CommandType
@@ -146,16 +255,20 @@ class Caller(TestCase):
 
         ctx = Context()
         self.assertFalse(ctx.collect_output)
+        redir_mock = patch("butch.caller._handle_redirection_output")
         file_path = "<nonexisting>"
 
-        with self.assertRaises(UnknownCommand):
+        with redir_mock as redir, self.assertRaises(UnknownCommand):
             new_call(cmd=Redirection(
                 redir_type=RedirType.OUTPUT,
                 left=Command(cmd=CommandType.UNKNOWN),
                 right=File(value=file_path)
             ), ctx=ctx, child=False)
-        self.assertTrue(ctx.collect_output)
+        # restored even if the command fails
+        self.assertFalse(ctx.collect_output)
         self.assertFalse(ctx.piped)
+        # opened before the command, closed even if it fails
+        redir.return_value.close.assert_called_once_with()
 
     def test_trigger_output_redirect(self):
         from butch.caller import new_call, UnknownCommand
@@ -179,11 +292,100 @@ class Caller(TestCase):
                 redir_type=RedirType.OUTPUT, left=left,
                 right=File(value=file_path)
             ), ctx=ctx, child=False)
-            redir.assert_called_once_with(redir_target=file_path, ctx=ctx)
+            redir.assert_called_once_with(
+                redir_target=file_path, ctx=ctx, append=False
+            )
         second_call.assert_called_once_with(cmd=left, ctx=ctx, child=True)
         self.assertFalse(ctx.collect_output)
         self.assertFalse(ctx.piped)
 
+    def test_pipe_buffer_backpressure(self):
+        # pylint: disable=protected-access
+        from threading import Thread
+        from butch.outputs import PipeBuffer
+
+        size = 8
+        lines = [f"line {idx}\n" for idx in range(100)]
+        pipe = PipeBuffer(size=size)
+        peaks = []
+
+        def write():
+            for line in lines:
+                pipe.write(line)
+                peaks.append(pipe._buffered)
+            pipe.close()
+
+        writer = Thread(target=write)
+        writer.start()
+        self.assertEqual(pipe.read(3), "lin")
+        self.assertEqual(pipe.readline(), "e 0\n")
+        self.assertEqual(list(pipe), lines[1:])
+        self.assertEqual(pipe.read(), "")
+        writer.join()
+        self.assertLessEqual(max(peaks), size)
+
+    def test_pipe_buffer_broken(self):
+        from threading import Thread
+        from butch.outputs import PipeBuffer
+
+        pipe = PipeBuffer(size=4)
+        writer = Thread(target=lambda: pipe.write("x" * 100))
+        writer.start()
+        self.assertEqual(pipe.read(2), "xx")
+        # the writer waits for the reader, dropping the rest unblocks it
+        pipe.close_reader()
+        writer.join(timeout=5)
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(pipe.write("more"), 4)
+
+    def test_pipe_concurrent(self):
+        from io import StringIO
+        from butch.context import Context
+        from butch.handler import handle_input
+
+        ctx = Context()
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            handle_input(inp="echo a | echo b | set /p var=\n", ctx=ctx)
+        # echo b ignores its input and writes to the second pipe
+        self.assertEqual(ctx.get_variable(key="var"), "b")
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertFalse(ctx.piped)
+        self.assertFalse(ctx.collect_output)
+
+    def test_pipe_left_isolated(self):
+        # pylint: disable=protected-access
+        from io import StringIO
+        from butch.context import Context
+        from butch.handler import handle_input
+
+        ctx = Context()
+        ctx.set_variable(key="var", value_to_set="parent")
+        with patch("sys.stdout", new_callable=StringIO):
+            handle_input(inp="set var=left | set /p other=\n", ctx=ctx)
+            handle_input(inp="setlocal | set /p other=\n", ctx=ctx)
+        # the writing thread has its own variables and scopes
+        self.assertEqual(ctx.get_variable(key="var"), "parent")
+        self.assertEqual(ctx._scopes, [])
+
+    def test_pipe_left_error(self):
+        from butch.caller import new_call, UnknownCommand
+        from butch.commandtype import CommandType
+        from butch.context import Context
+        from butch.tokenizer import Command, Pipe
+
+        ctx = Context()
+        right = MagicMock()
+        echo_mock = patch.dict(
+            "butch.commands.CMD_MAP", {CommandType.ECHO: right}
+        )
+        with echo_mock, self.assertRaises(UnknownCommand):
+            new_call(cmd=Pipe(
+                left=Command(cmd=CommandType.UNKNOWN),
+                right=Command(cmd=CommandType.ECHO)
+            ), ctx=ctx)
+        right.assert_called_once_with(params=[], ctx=ctx)
+        self.assertFalse(ctx.piped)
+
     def test_raw_connector_else(self):
         from butch.caller import new_call as call, UnknownCommand
         from butch.context import Context
@@ -194,12 +396,15 @@ class Caller(TestCase):
         args = [Argument(value=value) for value in params]
 
         ctx = Context()
-        echo_mock = patch("butch.commands.cmd_echo")
+        echo = MagicMock()
+        echo_mock = patch.dict(
+            "butch.commands.CMD_MAP", {CommandType.ECHO: echo}
+        )
         dummy = MagicMock()
         unk_mock = self.assertRaises(UnknownCommand)
 
-        left = Command(cmd=CommandType.ECHO, args=args)
-        with echo_mock as echo, unk_mock as unk:
+        with echo_mock, unk_mock as unk:
+            left = Command(cmd=CommandType.ECHO, args=args)
             self.assertEqual(call(
                 cmd=Connector(name="dummy", left=left, right=dummy), ctx=ctx
             ))
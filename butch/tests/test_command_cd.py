@@ -12,37 +12,37 @@ class CdCommand(TestCase):
     def test_cd_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_cd
+        from butch.commands.cd import cmd_cd
         from butch.commandtype import CommandType
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.cd.print_help") as prnt:
             cmd_cd(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.CD, file=sys.stdout)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.cd.print_help") as prnt:
             cmd_cd(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.CD, file=ctx.output.stdout
         )
 
     def test_cd_home(self):
-        from butch.commands import cmd_cd
+        from butch.commands.cd import cmd_cd
         from butch.context import Context
 
         dummy = "dummy"
 
         ctx = Context()
-        env_mock = patch("butch.commands.environ.get", return_value=dummy)
+        env_mock = patch("butch.commands.cd.environ.get", return_value=dummy)
         with env_mock, patch("butch.context.chdir") as cdir:
             cmd_cd(params=[], ctx=ctx)
         cdir.assert_called_once_with(dummy)
 
     def test_cd_path(self):
-        from butch.commands import cmd_cd
+        from butch.commands.cd import cmd_cd
         from butch.context import Context
         from butch.tokens import Argument
 
@@ -56,7 +56,7 @@ class CdCommand(TestCase):
 
     def test_cd_nonexisting(self):
         import sys
-        from butch.commands import cmd_cd
+        from butch.commands.cd import cmd_cd
         from butch.context import Context
         from butch.tokens import Argument
         from butch.constants import PATH_NOT_FOUND
@@ -64,7 +64,7 @@ class CdCommand(TestCase):
         path = "<nonexisting>"
 
         ctx = Context()
-        print_mock = patch("butch.commands.print")
+        print_mock = patch("butch.commands.cd.print")
         chdir_mock = patch(
             "butch.context.chdir", side_effect=FileNotFoundError
         )
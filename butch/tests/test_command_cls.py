@@ -12,19 +12,19 @@ class ClsCommand(TestCase):
     def test_cls_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_cls
+        from butch.commands.cls import cmd_cls
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.cls.print_help") as prnt:
             cmd_cls(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.CLS, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.cls.print_help") as prnt:
             cmd_cls(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.CLS, file=ctx.output.stdout
@@ -33,7 +33,7 @@ class ClsCommand(TestCase):
 
     def test_cls_unix(self):
         import sys
-        from butch.commands import cmd_cls
+        from butch.commands.cls import cmd_cls
         from butch.context import Context
         from butch.constants import OCTAL_CLEAR
 
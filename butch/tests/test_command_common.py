@@ -5,12 +5,12 @@
 # pylint: disable=too-many-lines,too-many-locals
 
 from unittest import main, TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock
 
 
 class Common(TestCase):
     def test_loggging_decorator_nolog(self):
-        from butch.commands import what_func, LOG_STR
+        from butch.commands.common import what_func, LOG_STR
         from butch.context import Context
         from typing import NamedTuple
 
@@ -33,7 +33,7 @@ class Common(TestCase):
         mocked.assert_not_called()
 
     def test_loggging_decorator(self):
-        from butch.commands import what_func, LOG_STR
+        from butch.commands.common import what_func, LOG_STR
         from butch.context import Context
         from typing import NamedTuple
 
@@ -49,8 +49,24 @@ class Common(TestCase):
         self.assertIn(func_name, locals())
 
         ctx = Context()
-        mocked = MagicMock()
-        ctx.log.debug = mocked
-
-        self.assertEqual(dummy(ctx=ctx), dummy_value)
-        mocked.assert_called_once_with(LOG_STR, func_name, None, ctx)
+        trace = patch(
+            "butch.context.Context.trace", new_callable=PropertyMock
+        )
+        with patch.object(ctx.log, "debug") as mocked, trace as tracing:
+            tracing.return_value = False
+            self.assertEqual(dummy(ctx=ctx), dummy_value)
+            mocked.assert_not_called()
+
+            tracing.return_value = True
+            self.assertEqual(dummy(ctx=ctx), dummy_value)
+            mocked.assert_called_once_with(LOG_STR, func_name, None, ctx)
+
+    def test_is_switch(self):
+        from butch.commands.common import is_switch
+
+        self.assertTrue(is_switch("/s"))
+        self.assertTrue(is_switch("/s/q"))
+        self.assertTrue(is_switch("/a:-h"))
+        self.assertFalse(is_switch("file.txt"))
+        self.assertFalse(is_switch("/tmp"))
+        self.assertFalse(is_switch("/tmp/missing/*.log"))
@@ -4,27 +4,81 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=too-many-lines,too-many-locals
 
+import sys
+from os import environ, makedirs
+from os.path import dirname, join
+from tempfile import TemporaryDirectory
 from unittest import main, TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import call, patch, MagicMock
+
+
+def make_files(folder, *paths):
+    for path in paths:
+        path = join(folder, path)
+        makedirs(dirname(path), exist_ok=True)
+        with open(path, "w") as fdes:
+            fdes.write(path)
+
+
+def list_files(folder):
+    from os import walk
+
+    return sorted(
+        join(root, name)[len(folder) + 1:]
+        for root, _, names in walk(folder) for name in names
+    )
+
+
+def run_del(*params, stdin=None):
+    from io import StringIO
+    from butch.context import Context
+    from butch.commands.del_ import cmd_del
+    from butch.inputs import CommandInput
+    from butch.tokens import Argument
+
+    ctx = Context()
+    ctx.collect_output = True
+    if stdin is not None:
+        ctx.piped = True
+        ctx.input = CommandInput(stream=StringIO(stdin))
+
+    def output(*args, **kwargs):
+        if kwargs.get("file") is not sys.stderr:
+            print(*args, **kwargs)
+
+    with patch("butch.commands.del_.print", side_effect=output) as prnt:
+        cmd_del(params=[Argument(value=param) for param in params], ctx=ctx)
+    ctx.output.stdout.seek(0)
+    errors = [
+        " ".join(map(str, item.args)) for item in prnt.call_args_list
+        if item.kwargs.get("file") is sys.stderr
+    ]
+    return ctx, ctx.output.stdout.read().splitlines(), errors
 
 
 class DelCommand(TestCase):
+    def make_folder(self, *paths):
+        temp = TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        make_files(temp.name, *paths)
+        return temp.name
+
     def test_del_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_del
+        from butch.commands.del_ import cmd_del
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.del_.print_help") as prnt:
             cmd_del(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.DEL, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.del_.print_help") as prnt:
             cmd_del(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.DEL, file=ctx.output.stdout
@@ -34,7 +88,7 @@ class DelCommand(TestCase):
     def test_del_empty(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_del
+        from butch.commands.del_ import cmd_del
         from butch.constants import SYNTAX_INCORRECT
 
         ctx = Context()
@@ -49,3 +103,177 @@ class DelCommand(TestCase):
             cmd_del(params=[], ctx=ctx)
         prnt.assert_called_once_with(SYNTAX_INCORRECT, file=ctx.output.stdout)
         self.assertEqual(ctx.error_level, 1)
+
+    def test_del_file(self):
+        from butch.commands.del_ import _display
+
+        folder = self.make_folder("a.txt", "b.txt")
+        ctx, out, errors = run_del(join(folder, "a.txt"))
+        self.assertEqual((out, errors, ctx.error_level), ([], [], 0))
+        self.assertEqual(list_files(folder), ["b.txt"])
+
+        missing = join(folder, "a.txt")
+        ctx, out, errors = run_del(missing, join(folder, "b.txt"))
+        self.assertEqual(out, [])
+        self.assertEqual(errors, [f"Could Not Find {_display(missing)}"])
+        self.assertEqual(ctx.error_level, 0)
+        self.assertEqual(list_files(folder), [])
+
+    def test_del_wildcards(self):
+        folder = self.make_folder(
+            "a.tmp", "B.TMP", "c.tmp.txt", "noext", ".hidden.tmp", "s/d.tmp"
+        )
+        ctx, out, errors = run_del(join(folder, "*.tmp"))
+        self.assertEqual((out, errors, ctx.error_level), ([], [], 0))
+        self.assertEqual(list_files(folder), [
+            ".hidden.tmp", "c.tmp.txt", "noext", "s/d.tmp"
+        ])
+
+        run_del(join(folder, "*."))
+        self.assertEqual(list_files(folder), [
+            ".hidden.tmp", "c.tmp.txt", "s/d.tmp"
+        ])
+
+        # hidden files only with /A, a named one always
+        run_del("/a:h", join(folder, "*.tmp"))
+        self.assertEqual(list_files(folder), ["c.tmp.txt", "s/d.tmp"])
+
+    def test_del_recursive(self):
+        from butch.commands.del_ import _display
+
+        folder = self.make_folder(
+            "x.tmp", "keep.txt", "a/y.tmp", "a/b/z.TMP", "a/b/keep.txt"
+        )
+        ctx, out, errors = run_del("/s/q", join(folder, "*.tmp"))
+        self.assertEqual(sorted(out), sorted(
+            f"Deleted file - {_display(join(folder, path))}"
+            for path in ("x.tmp", "a/y.tmp", "a/b/z.TMP")
+        ))
+        self.assertEqual((errors, ctx.error_level), ([], 0))
+        self.assertEqual(list_files(folder), ["a/b/keep.txt", "keep.txt"])
+
+        ctx, out, errors = run_del("/S", join(folder, "a", "keep.txt"))
+        self.assertEqual(
+            out, [f"Deleted file - {_display(join(folder, 'a/b/keep.txt'))}"]
+        )
+        self.assertEqual(list_files(folder), ["keep.txt"])
+
+        ctx, out, errors = run_del("/s", join(folder, "*.none"))
+        self.assertEqual(out, [])
+        self.assertEqual(
+            errors, [f"Could Not Find {_display(join(folder, '*.none'))}"]
+        )
+
+    def test_del_folder_prompt(self):
+        from butch.commands.del_ import _display
+        from butch.constants import SURE
+
+        folder = self.make_folder("a.txt", "b.txt", "sub/c.txt")
+        text = f"{_display(join(folder, '*'))}, {SURE}"
+
+        ctx, out, _ = run_del(folder, stdin="n")
+        self.assertEqual(out, [f"{text} n"])
+        self.assertEqual(list_files(folder), ["a.txt", "b.txt", "sub/c.txt"])
+
+        ctx, out, _ = run_del(join(folder, "*.*"), stdin="Y")
+        self.assertEqual(out, [f"{text} Y"])
+        self.assertEqual(list_files(folder), ["sub/c.txt"])
+
+        make_files(folder, "a.txt")
+        ctx, out, _ = run_del("/q", folder)
+        self.assertEqual(out, [])
+        self.assertEqual(list_files(folder), ["sub/c.txt"])
+        self.assertEqual(ctx.error_level, 0)
+
+    def test_del_prompt_each(self):
+        from butch.commands.del_ import _display
+        from butch.constants import DELETE
+
+        folder = self.make_folder("a.tmp", "b.tmp")
+        ctx, out, _ = run_del("/p", join(folder, "?.tmp"), stdin="yn")
+        self.assertEqual(len(out), 2)
+        remaining = list_files(folder)
+        self.assertEqual(len(remaining), 1)
+        deleted = ({"a.tmp", "b.tmp"} - set(remaining)).pop()
+        self.assertIn(
+            f"{_display(join(folder, deleted))}, {DELETE} y", out
+        )
+
+    def test_del_invalid(self):
+        from butch.constants import INVALID_SWITCH, PARAM_FORMAT
+
+        ctx, _, errors = run_del("/x", "file")
+        self.assertEqual(errors, [INVALID_SWITCH.format("x")])
+        self.assertEqual(ctx.error_level, 1)
+
+        ctx, _, errors = run_del("/a:d", "file")
+        self.assertEqual(errors, [PARAM_FORMAT.format("d")])
+        self.assertEqual(ctx.error_level, 1)
+
+    def test_del_access_denied(self):
+        from butch.commands.del_ import _display
+        from butch.constants import ACCESS_DENIED
+
+        folder = self.make_folder("a.tmp", "b.tmp")
+        with patch(
+            "butch.commands.del_.unlink", side_effect=PermissionError
+        ) as unl:
+            ctx, _, errors = run_del(join(folder, "*.tmp"))
+        self.assertEqual(unl.call_count, 2)
+        self.assertEqual(sorted(errors), [
+            f"{_display(join(folder, name))} {ACCESS_DENIED}"
+            for name in ("a.tmp", "b.tmp")
+        ])
+        self.assertEqual(ctx.error_level, 0)
+
+        # /F makes the file writable and tries again
+        with patch("butch.commands.del_.chmod") as chm, patch(
+            "butch.commands.del_.unlink", side_effect=[PermissionError, None]
+        ) as unl:
+            ctx, _, errors = run_del("/f", join(folder, "a.tmp"))
+        self.assertEqual(errors, [])
+        chm.assert_called_once()
+        self.assertEqual(unl.call_count, 2)
+
+    def test_del_dir_fd(self):
+        from os import supports_dir_fd, unlink
+
+        if unlink not in supports_dir_fd:
+            self.skipTest("unlink() without dir_fd")
+
+        folder = self.make_folder("a.tmp", "b.tmp", "c.txt")
+        with patch("butch.commands.del_.unlink", side_effect=unlink) as unl:
+            run_del(join(folder, "*.tmp"))
+        self.assertEqual(list_files(folder), ["c.txt"])
+        self.assertEqual(
+            sorted(item.args[0] for item in unl.call_args_list),
+            ["a.tmp", "b.tmp"]
+        )
+        for item in unl.call_args_list:
+            self.assertIsInstance(item.kwargs["dir_fd"], int)
+
+    def test_del_parallel(self):
+        from threading import current_thread
+        from butch.commands.del_ import DEL_WORKERS_ENV, _unlink_names
+
+        names = [f"{idx}.tmp" for idx in range(50)]
+        folder = self.make_folder(*names, "keep.txt", "sub/x.tmp")
+        threads = set()
+
+        def unlink_names(*args, **kwargs):
+            threads.add(current_thread().name)
+            return _unlink_names(*args, **kwargs)
+
+        with patch.dict(environ, {DEL_WORKERS_ENV: "3"}), patch(
+            "butch.commands.del_.DEL_BATCH", 4
+        ), patch(
+            "butch.commands.del_._unlink_names", side_effect=unlink_names
+        ):
+            ctx, out, errors = run_del("/s", "/q", join(folder, "*.tmp"))
+        self.assertEqual(list_files(folder), ["keep.txt"])
+        self.assertEqual(len(out), 51)
+        self.assertEqual(errors, [])
+        self.assertTrue(threads)
+        self.assertTrue(all(
+            name.startswith("butch-del") for name in threads
+        ))
@@ -4,86 +4,322 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=too-many-lines,too-many-locals
 
+import sys
+from os.path import join
+from tempfile import TemporaryDirectory
 from unittest import main, TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, call, patch, MagicMock
+
+
+def make_tree(folder):
+    from os import makedirs
+
+    makedirs(join(folder, "a", "deep"))
+    makedirs(join(folder, "b"))
+    files = {
+        "top.tmp": "1", "big.bin": "x" * 100, "a/x.tmp": "22",
+        "a/deep/y.tmp": "333", "a/deep/keep.txt": "4", "b/z.txt": "5"
+    }
+    for path, content in files.items():
+        with open(join(folder, path), "w") as fdes:
+            fdes.write(content)
+
+
+def run_dir(*params):
+    from butch.context import Context
+    from butch.commands.dir_ import cmd_dir
+    from butch.tokens import Argument
+
+    ctx = Context()
+    ctx.collect_output = True
+    cmd_dir(params=[Argument(value=param) for param in params], ctx=ctx)
+    assert ctx.error_level == 0, ctx.error_level
+    ctx.output.stdout.seek(0)
+    return ctx.output.stdout.read().splitlines()
 
 
 class DirCommand(TestCase):
+    def make_tree(self):
+        temp = TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        make_tree(temp.name)
+        return temp.name
+
     def test_dir_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_dir
+        from butch.commands.dir_ import cmd_dir
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.dir_.print_help") as prnt:
             cmd_dir(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.DIR, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.dir_.print_help") as prnt:
             cmd_dir(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.DIR, file=ctx.output.stdout
         )
         self.assertEqual(ctx.error_level, 0)
 
-    def test_dir_nie(self):
+    def test_dir_unsupported(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_dir
+        from butch.commands.dir_ import cmd_dir
+        from butch.constants import NOT_SUPPORTED
         from butch.tokens import Argument
-        from butch.commandtype import CommandType
 
-        ctx = Context()
-        dummy = [Argument(value="dummy")]
-        print_mock = patch("builtins.print")
-        help_mock = patch("butch.commands.print_help")
-        nie = self.assertRaises(NotImplementedError)
-
-        with print_mock as prnt, help_mock as halp, nie:
-            cmd_dir(params=dummy, ctx=ctx)
-        prnt.assert_not_called()
-        halp.assert_not_called()
-        self.assertEqual(ctx.error_level, 0)
-
-        ctx.collect_output = True
-        with print_mock as prnt, help_mock as halp, nie:
-            cmd_dir(params=dummy, ctx=ctx)
-        prnt.assert_not_called()
-        halp.assert_not_called()
-        self.assertEqual(ctx.error_level, 0)
+        for switch in ("/w", "/P", "/q", "/4", "/s/tc"):
+            with self.subTest(switch=switch):
+                ctx = Context()
+                ctx.collect_output = True
+                help_mock = patch("butch.commands.dir_.print_help")
+                with patch("builtins.print") as prnt, help_mock as halp:
+                    cmd_dir(params=[Argument(value=switch)], ctx=ctx)
+                prnt.assert_called_once_with(
+                    NOT_SUPPORTED.format(switch.lower().split("/")[-1]),
+                    file=sys.stderr
+                )
+                halp.assert_not_called()
+                self.assertEqual(ctx.error_level, 1)
 
     def test_dir_empty(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_dir
+        from butch.commands.dir_ import cmd_dir
         from butch.commandtype import CommandType
 
         ctx = Context()
         lines = ["a", "b", "c"]
         print_mock = patch("builtins.print")
         get_lines_mock = patch(
-            "butch.commands._get_listdir_lines", return_value=lines
+            "butch.commands.dir_._get_listdir_lines", return_value=lines
         )
-        cwd_mock = patch("butch.commands.getcwd")
+        cwd_mock = patch("butch.commands.dir_.getcwd")
         with print_mock as prnt, get_lines_mock as get, cwd_mock as cwd:
             cmd_dir(params=[], ctx=ctx)
-        get.assert_called_once_with(folder=cwd.return_value, ctx=ctx)
-        prnt.assert_called_once_with("\n".join(lines), file=sys.stdout)
+        get.assert_called_once_with(
+            folder=cwd.return_value, ctx=ctx, options=ANY, pattern="*"
+        )
+        self.assertEqual(prnt.call_args_list, [
+            call(line, file=sys.stdout) for line in lines
+        ])
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
         print_mock = patch("builtins.print")
         get_lines_mock = patch(
-            "butch.commands._get_listdir_lines", return_value=lines
+            "butch.commands.dir_._get_listdir_lines", return_value=lines
         )
-        cwd_mock = patch("butch.commands.getcwd")
+        cwd_mock = patch("butch.commands.dir_.getcwd")
         with print_mock as prnt, get_lines_mock as get, cwd_mock as cwd:
             cmd_dir(params=[], ctx=ctx)
-        get.assert_called_once_with(folder=cwd.return_value, ctx=ctx)
-        prnt.assert_called_once_with("\n".join(lines), file=ctx.output.stdout)
+        get.assert_called_once_with(
+            folder=cwd.return_value, ctx=ctx, options=ANY, pattern="*"
+        )
+        self.assertEqual(prnt.call_args_list, [
+            call(line, file=ctx.output.stdout) for line in lines
+        ])
         self.assertEqual(ctx.error_level, 0)
+
+    def test_dir_lines(self):
+        from os import mkdir, symlink
+        from os.path import join
+        from tempfile import TemporaryDirectory
+        from butch.context import Context
+        from butch.commands.dir_ import (
+            _display, _format_date, _get_listdir_lines
+        )
+
+        ctx = Context()
+        with TemporaryDirectory() as folder:
+            with open(join(folder, "big.bin"), "wb") as fdes:
+                fdes.write(b"x" * 1234567)
+            with open(join(folder, "empty"), "wb"):
+                pass
+            mkdir(join(folder, "sub"))
+            symlink("missing", join(folder, "broken"))
+
+            with patch("butch.commands.dir_.setlocale", create=True) as loc:
+                lines = _get_listdir_lines(folder=folder, ctx=ctx)
+                self.assertNotIsInstance(lines, list)
+                lines = list(lines)
+            loc.assert_not_called()
+
+        self.assertEqual(lines[:5], [
+            " Volume in drive <NYI> has no label.",
+            " Volume Serial Number is <NYI>",
+            "",
+            f" Directory of {_display(folder)}",
+            ""
+        ])
+        body = lines[5:-2]
+        start = len(_format_date(0)) + 4
+        self.assertEqual(len(body), 6)
+        self.assertEqual([line[start:] for line in body[:2]], [
+            "<DIR>            .", "<DIR>            .."
+        ])
+        items = {line.rsplit(" ", 1)[1]: line[start:] for line in body[2:]}
+        self.assertEqual(items["sub"], "<DIR>            sub")
+        self.assertEqual(items["big.bin"], "       1,234,567 big.bin")
+        self.assertEqual(items["empty"], "               0 empty")
+        self.assertIn("broken", items)
+
+        self.assertEqual(
+            lines[-2], "                3 File(s)     1,234,574 bytes"
+        )
+        self.assertTrue(lines[-1].startswith("                 3 Dir(s)"))
+        self.assertTrue(lines[-1].endswith(" bytes free"))
+
+    def test_dir_missing(self):
+        from butch.context import Context
+        from butch.commands.dir_ import cmd_dir
+        from butch.constants import NO_FILE_FOUND
+        from butch.tokens import Argument
+
+        with TemporaryDirectory() as folder:
+            ctx = Context()
+            ctx.collect_output = True
+            with patch("butch.commands.dir_.print") as prnt:
+                cmd_dir(
+                    params=[Argument(value=join(folder, "nope", "x"))],
+                    ctx=ctx
+                )
+            prnt.assert_called_once_with(NO_FILE_FOUND, file=sys.stderr)
+            self.assertEqual(ctx.error_level, 1)
+
+            ctx.error_level = 0
+            with patch("butch.commands.dir_.print") as prnt:
+                cmd_dir(
+                    params=[Argument(value=join(folder, "*.none"))], ctx=ctx
+                )
+            self.assertEqual(
+                prnt.call_args_list[-1], call(NO_FILE_FOUND, file=sys.stderr)
+            )
+            self.assertEqual(ctx.error_level, 1)
+
+    def test_dir_invalid_switch(self):
+        from butch.context import Context
+        from butch.commands.dir_ import cmd_dir
+        from butch.constants import INVALID_SWITCH, PARAM_FORMAT
+        from butch.tokens import Argument
+
+        cases = [
+            ("/z", INVALID_SWITCH.format("z")),
+            ("/s/k", INVALID_SWITCH.format("k")),
+            ("/a:x", PARAM_FORMAT.format("x")),
+            ("/o-q", PARAM_FORMAT.format("q"))
+        ]
+        for param, text in cases:
+            with self.subTest(param=param):
+                ctx = Context()
+                with patch("butch.commands.dir_.print") as prnt:
+                    cmd_dir(params=[Argument(value=param)], ctx=ctx)
+                prnt.assert_called_once_with(text, file=sys.stderr)
+                self.assertEqual(ctx.error_level, 1)
+
+    def test_dir_recursive_bare(self):
+        folder = self.make_tree()
+
+        self.assertEqual(sorted(run_dir(folder, "/s", "/b")), sorted(
+            join(folder, path) for path in (
+                "a", "a/x.tmp", "a/deep", "a/deep/y.tmp", "a/deep/keep.txt",
+                "b", "b/z.txt", "top.tmp", "big.bin"
+            )
+        ))
+        self.assertEqual(
+            run_dir(join(folder, "*.TMP"), "/S/B", "/ON"), [
+                join(folder, "top.tmp"),
+                join(folder, "a", "x.tmp"),
+                join(folder, "a", "deep", "y.tmp")
+            ]
+        )
+        self.assertEqual(
+            run_dir(folder, "/s", "/b", "/ad", "/o"), [
+                join(folder, "a"), join(folder, "b"),
+                join(folder, "a", "deep")
+            ]
+        )
+
+    def test_dir_recursive(self):
+        from butch.commands.dir_ import _display
+
+        folder = self.make_tree()
+
+        lines = run_dir(join(folder, "*.tmp"), "/s", "/on")
+        headers = [line for line in lines if "Directory of" in line]
+        self.assertEqual(headers, [
+            f" Directory of {_display(path)}" for path in (
+                folder, join(folder, "a"), join(folder, "a", "deep")
+            )
+        ])
+        self.assertEqual(lines[-4:-1], [
+            "",
+            "     Total Files Listed:",
+            "                3 File(s)             6 bytes"
+        ])
+        self.assertTrue(lines[-1].startswith("                 0 Dir(s)"))
+
+    def test_dir_order(self):
+        folder = self.make_tree()
+
+        self.assertEqual(
+            run_dir(folder, "/b", "/on"), ["a", "b", "big.bin", "top.tmp"]
+        )
+        self.assertEqual(
+            run_dir(folder, "/b", "/o-n"), ["top.tmp", "big.bin", "b", "a"]
+        )
+        self.assertEqual(
+            run_dir(folder, "/b", "/o:gen"), ["a", "b", "big.bin", "top.tmp"]
+        )
+        self.assertEqual(
+            run_dir(folder, "/b", "/a-d", "/o-s"), ["big.bin", "top.tmp"]
+        )
+        self.assertEqual(
+            run_dir(folder, "/b", "/a-d", "/os"), ["top.tmp", "big.bin"]
+        )
+
+    def test_dir_attributes(self):
+        from os import chmod
+
+        folder = self.make_tree()
+        with open(join(folder, ".hidden"), "w"):
+            pass
+        chmod(join(folder, "big.bin"), 0o444)
+
+        self.assertEqual(
+            run_dir(folder, "/b", "/on"), ["a", "b", "big.bin", "top.tmp"]
+        )
+        self.assertEqual(run_dir(folder, "/b", "/a", "/on"), [
+            ".hidden", "a", "b", "big.bin", "top.tmp"
+        ])
+        self.assertEqual(run_dir(folder, "/b", "/ah"), [".hidden"])
+        self.assertEqual(run_dir(folder, "/b", "/ad", "/on"), ["a", "b"])
+        self.assertEqual(run_dir(folder, "/b", "/a-d", "/on"), [
+            ".hidden", "big.bin", "top.tmp"
+        ])
+        self.assertEqual(run_dir(folder, "/b", "/ar"), ["big.bin"])
+        # /A replaces the default filter of the hidden files
+        self.assertEqual(
+            run_dir(folder, "/b", "/a:-r-d", "/on"), [".hidden", "top.tmp"]
+        )
+
+        lines = run_dir(folder, "/a-d")
+        self.assertFalse([line for line in lines if line.endswith(" .")])
+        lines = run_dir(folder, "/ad")
+        self.assertEqual(len([
+            line for line in lines if line.endswith((" .", " .."))
+        ]), 2)
+
+    def test_dir_number_format(self):
+        from butch.commands.dir_ import _format_number
+
+        self.assertEqual(_format_number(0), "0")
+        self.assertEqual(_format_number(999), "999")
+        self.assertEqual(_format_number(1000), "1,000")
+        self.assertEqual(_format_number(1234567890), "1,234,567,890")
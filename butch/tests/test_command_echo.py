@@ -12,7 +12,7 @@ class EchoCommand(TestCase):
     def test_echo_plain_single(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_echo
+        from butch.commands.echo import cmd_echo
         from butch.tokens import Argument
 
         args = ["a"]
@@ -26,7 +26,7 @@ class EchoCommand(TestCase):
     def test_echo_plain_multi(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_echo
+        from butch.commands.echo import cmd_echo
         from butch.tokens import Argument
 
         args = ["a", "b", "c"]
@@ -40,7 +40,7 @@ class EchoCommand(TestCase):
     def test_echo_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_echo
+        from butch.commands.echo import cmd_echo
         from butch.commandtype import CommandType
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
@@ -48,7 +48,7 @@ class EchoCommand(TestCase):
         args = ["a", "b", "c"]
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.echo.print_help") as prnt:
             cmd_echo(params=[Argument(value=PARAM_HELP)], ctx=ctx)
 
         prnt.assert_called_once_with(cmd=CommandType.ECHO, file=sys.stdout)
@@ -56,7 +56,7 @@ class EchoCommand(TestCase):
     def test_echo_onoff(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_echo
+        from butch.commands.echo import cmd_echo
         from butch.commandtype import CommandType
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP, ECHO_STATE
@@ -84,7 +84,7 @@ class EchoCommand(TestCase):
     def test_echo_piped(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_echo
+        from butch.commands.echo import cmd_echo
         from butch.tokens import Argument
 
         dummy = "dummy"
@@ -12,19 +12,19 @@ class ExitCommand(TestCase):
     def test_exit_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_exit
+        from butch.commands.exit_ import cmd_exit
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.exit_.print_help") as prnt:
             cmd_exit(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.EXIT, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.exit_.print_help") as prnt:
             cmd_exit(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.EXIT, file=ctx.output.stdout
@@ -33,7 +33,7 @@ class ExitCommand(TestCase):
 
     def test_exit_all(self):
         from butch.context import Context
-        from butch.commands import cmd_exit
+        from butch.commands.exit_ import cmd_exit
 
         with patch("sys.exit") as ext:
             cmd_exit(params=[], ctx=Context())
@@ -41,7 +41,7 @@ class ExitCommand(TestCase):
 
     def test_exit_current_script(self):
         from butch.context import Context
-        from butch.commands import cmd_exit
+        from butch.commands.exit_ import cmd_exit
         from butch.tokens import Argument
 
         ctx = Context()
@@ -58,7 +58,7 @@ class ExitCommand(TestCase):
 
     def test_exit_current_script_wob(self):
         from butch.context import Context
-        from butch.commands import cmd_exit
+        from butch.commands.exit_ import cmd_exit
         from butch.tokens import Argument
 
         ctx = Context()
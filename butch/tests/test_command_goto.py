@@ -12,19 +12,19 @@ class GotoCommand(TestCase):
     def test_goto_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_goto
+        from butch.commands.goto import cmd_goto
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.goto.print_help") as prnt:
             cmd_goto(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.GOTO, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.goto.print_help") as prnt:
             cmd_goto(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.GOTO, file=ctx.output.stdout
@@ -33,7 +33,7 @@ class GotoCommand(TestCase):
 
     def test_goto_without_label(self):
         from butch.context import Context
-        from butch.commands import cmd_goto
+        from butch.commands.goto import cmd_goto
 
         ctx = Context()
         self.assertEqual(ctx.error_level, 0)
@@ -42,7 +42,7 @@ class GotoCommand(TestCase):
 
     def test_goto_colon_eof(self):
         from butch.context import Context
-        from butch.commands import cmd_goto
+        from butch.commands.goto import cmd_goto
         from butch.jumptype import JumpTypeEof
         from butch.tokens import Argument
 
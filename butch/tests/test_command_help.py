@@ -12,16 +12,16 @@ class HelpCommand(TestCase):
     def test_help_itself(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_help
+        from butch.commands.help_ import cmd_help
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.help_.print_help") as prnt:
             cmd_help(params=[], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.HELP, file=sys.stdout)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.help_.print_help") as prnt:
             cmd_help(params=[], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.HELP, file=ctx.output.stdout
@@ -30,31 +30,113 @@ class HelpCommand(TestCase):
     def test_help_from_arg(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_help
+        from butch.commands.help_ import cmd_help
         from butch.tokens import Argument
         from butch.commandtype import CommandType
 
-        prefix = "butch.commands"
-        map_str = f"{prefix}.get_reverse_cmd_map"
+        prefix = "butch.commands.help_"
+        map_str = f"{prefix}.REVERSE_CMD_MAP"
         print_str = f"{prefix}.print_help"
 
         ctx = Context()
         dummy = "DuMmY"
-        with patch(map_str) as cmd_map, patch(print_str) as prnt:
-            cmd_help(params=[Argument(value=dummy)], ctx=ctx)
-        cmd_map.return_value.get.assert_called_once_with(
+        with patch("butch.commands.get_reverse_cmd_map") as rev_map:
+            with patch(map_str) as cmd_map, patch(print_str) as prnt:
+                cmd_help(params=[Argument(value=dummy)], ctx=ctx)
+        rev_map.assert_not_called()
+        cmd_map.get.assert_called_once_with(
             dummy.lower(), CommandType.UNKNOWN
         )
         prnt.assert_called_once_with(
-            cmd=cmd_map.return_value.get.return_value, file=sys.stdout
+            cmd=cmd_map.get.return_value, file=sys.stdout
         )
 
         ctx.collect_output = True
         with patch(map_str) as cmd_map, patch(print_str) as prnt:
             cmd_help(params=[Argument(value=dummy)], ctx=ctx)
-        cmd_map.return_value.get.assert_called_once_with(
+        cmd_map.get.assert_called_once_with(
             dummy.lower(), CommandType.UNKNOWN
         )
         prnt.assert_called_once_with(
-            cmd=cmd_map.return_value.get.return_value, file=ctx.output.stdout
+            cmd=cmd_map.get.return_value, file=ctx.output.stdout
+        )
+
+    def test_help_all_and_keyword(self):
+        from butch.context import Context
+        from butch.commands.help_ import cmd_help
+        from butch.constants import HELP_NOT_FOUND
+        from butch.help import get_catalog
+        from butch.tokens import Argument
+
+        catalog = get_catalog()
+        ctx = Context()
+        ctx.collect_output = True
+        cmd_help(params=[Argument(value="/ALL")], ctx=ctx)
+        out = ctx.output.stdout.getvalue()
+        for name in catalog.names:
+            self.assertIn(f"{name.upper()}\n{catalog.text(name)}\n", out)
+        self.assertNotIn(catalog.text("<unknown>"), out)
+
+        ctx = Context()
+        ctx.collect_output = True
+        params = [Argument(value="/k"), Argument(value="LABELED")]
+        cmd_help(params=params, ctx=ctx)
+        self.assertEqual(
+            ctx.output.stdout.getvalue(), f"GOTO{' ' * 11}"
+            f"{catalog.summary('goto')}\n"
         )
+        self.assertEqual(ctx.error_level, 0)
+
+        ctx = Context()
+        with patch("sys.stderr") as err:
+            cmd_help(
+                params=[Argument(value="/k"), Argument(value="xyz")], ctx=ctx
+            )
+        err.write.assert_any_call(HELP_NOT_FOUND.format("xyz"))
+        self.assertEqual(ctx.error_level, 1)
+
+
+class HelpCatalog(TestCase):
+    def test_up_to_date(self):
+        from butch.help import _read_catalog
+        from butch.help.build import build, read_sources
+
+        # run "python -m butch.help.build" after changing a text
+        self.assertEqual(build(texts=read_sources()), _read_catalog())
+
+    def test_texts(self):
+        from butch.help import COMMANDS, get_catalog
+        from butch.help.build import read_sources
+
+        sources = read_sources()
+        catalog = get_catalog()
+        for name, text in sources.items():
+            self.assertEqual(catalog.text(name), text)
+        # aliases share the text
+        self.assertEqual(catalog.text("erase"), sources["del"])
+        self.assertEqual(catalog.summary("md"), "Creates a directory.")
+        self.assertNotIn("md", catalog.names)
+        self.assertIn("MD             Creates", catalog.text(COMMANDS))
+        self.assertIsNone(catalog.text("missing"))
+        self.assertEqual(catalog.search(keyword="REMARKS"), ["rem"])
+
+    def test_read_once(self):
+        from io import StringIO
+        from butch.commandtype import CommandType
+        from butch.help import _read_catalog, get_catalog, print_help
+
+        get_catalog.cache_clear()
+        with patch("butch.help._read_catalog", wraps=_read_catalog) as read:
+            print_help(cmd=CommandType.ECHO, file=StringIO())
+            # no files are opened after the first load
+            with patch("builtins.open", side_effect=AssertionError):
+                out = StringIO()
+                print_help(cmd=CommandType.HELP, file=out)
+                print_help(cmd=CommandType.UNKNOWN, file=StringIO())
+        read.assert_called_once_with()
+        self.assertIn("For more information", out.getvalue())
+        self.assertIn("\nVER ", out.getvalue())
+
+
+if __name__ == "__main__":
+    main()
@@ -12,19 +12,19 @@ class MkdirCommand(TestCase):
     def test_mkdir_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_mkdir
+        from butch.commands.mkdir import cmd_mkdir
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.mkdir.print_help") as prnt:
             cmd_mkdir(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.MKDIR, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.mkdir.print_help") as prnt:
             cmd_mkdir(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.MKDIR, file=ctx.output.stdout
@@ -34,7 +34,7 @@ class MkdirCommand(TestCase):
     def test_mkdir_empty(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_mkdir
+        from butch.commands.mkdir import cmd_mkdir
         from butch.constants import SYNTAX_INCORRECT
 
         ctx = Context()
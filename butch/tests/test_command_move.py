@@ -12,19 +12,19 @@ class MoveCommand(TestCase):
     def test_move_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_move
+        from butch.commands.move import cmd_move
         from butch.commandtype import CommandType
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.move.print_help") as prnt:
             cmd_move(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.MOVE, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.move.print_help") as prnt:
             cmd_move(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.MOVE, file=ctx.output.stdout
@@ -34,7 +34,7 @@ class MoveCommand(TestCase):
     def test_move_miss_to_miss(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_move
+        from butch.commands.move import cmd_move
         from butch.tokens import Argument
         from butch.constants import FILE_NOT_FOUND
         from os.path import exists
@@ -57,7 +57,7 @@ class MoveCommand(TestCase):
     def test_move_multi_to_miss(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_move
+        from butch.commands.move import cmd_move
         from butch.tokens import Argument
         from butch.constants import SYNTAX_INCORRECT
         from os.path import exists
@@ -86,7 +86,7 @@ class MoveCommand(TestCase):
     def test_move_multi_to_file(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_move
+        from butch.commands.move import cmd_move
         from butch.tokens import Argument
         from butch.constants import SYNTAX_INCORRECT
         from os.path import exists, abspath, dirname, join
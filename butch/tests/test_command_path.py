@@ -12,7 +12,7 @@ class PathCommand(TestCase):
     def test_path_stdout(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_path
+        from butch.commands.path import cmd_path
         from butch.tokens import Argument
 
         ctx = Context()
@@ -25,7 +25,7 @@ class PathCommand(TestCase):
 
     def test_path_piped(self):
         from butch.context import Context
-        from butch.commands import cmd_path
+        from butch.commands.path import cmd_path
         from butch.tokens import Argument
 
         ctx = Context()
@@ -42,19 +42,19 @@ class PathCommand(TestCase):
     def test_path_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_path
+        from butch.commands.path import cmd_path
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.path.print_help") as prnt:
             cmd_path(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.PATH, file=sys.stdout)
 
     def test_path_delete(self):
         from butch.context import Context
-        from butch.commands import cmd_path
+        from butch.commands.path import cmd_path
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
 
@@ -71,7 +71,7 @@ class PathCommand(TestCase):
 
     def test_path_set(self):
         from butch.context import Context
-        from butch.commands import cmd_path
+        from butch.commands.path import cmd_path
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
 
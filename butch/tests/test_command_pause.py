@@ -12,19 +12,19 @@ class PauseCommand(TestCase):
     def test_pause_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_pause
+        from butch.commands.pause import cmd_pause
         from butch.commandtype import CommandType
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.pause.print_help") as prnt:
             cmd_pause(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.PAUSE, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.pause.print_help") as prnt:
             cmd_pause(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.PAUSE, file=ctx.output.stdout
@@ -34,7 +34,7 @@ class PauseCommand(TestCase):
     def test_pause(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_pause
+        from butch.commands.pause import cmd_pause
         from butch.tokens import Argument
         from butch.constants import PAUSE_TEXT
 
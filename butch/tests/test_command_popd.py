@@ -12,7 +12,7 @@ class PopdCommand(TestCase):
     def test_popd_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_popd
+        from butch.commands.popd import cmd_popd
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
@@ -21,14 +21,14 @@ class PopdCommand(TestCase):
             return
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.popd.print_help") as prnt:
             cmd_popd(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.POPD, file=sys.stdout)
 
     def test_popd_help_piped(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_popd
+        from butch.commands.popd import cmd_popd
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
@@ -36,7 +36,7 @@ class PopdCommand(TestCase):
         ctx = Context()
         ctx.collect_output = True
 
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.popd.print_help") as prnt:
             cmd_popd(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         pipe = ctx.output.stdout
         prnt.assert_called_once_with(cmd=CommandType.POPD, file=pipe)
@@ -44,7 +44,7 @@ class PopdCommand(TestCase):
     def test_popd_normal(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_popd
+        from butch.commands.popd import cmd_popd
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
@@ -60,7 +60,7 @@ class PopdCommand(TestCase):
     def test_popd_nonexisting(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_popd
+        from butch.commands.popd import cmd_popd
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
@@ -79,7 +79,7 @@ class PopdCommand(TestCase):
     def test_popd_empty_stack(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_popd
+        from butch.commands.popd import cmd_popd
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
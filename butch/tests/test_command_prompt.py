@@ -12,18 +12,18 @@ class PromptCommand(TestCase):
     def test_prompt_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_prompt
+        from butch.commands.prompt import cmd_prompt
         from butch.commandtype import CommandType
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.prompt.print_help") as prnt:
             cmd_prompt(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.PROMPT, file=sys.stdout)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.prompt.print_help") as prnt:
             cmd_prompt(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.PROMPT, file=ctx.output.stdout
@@ -32,7 +32,7 @@ class PromptCommand(TestCase):
     def test_prompt_empty(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_prompt
+        from butch.commands.prompt import cmd_prompt
 
         ctx = Context()
         self.assertEqual(ctx.error_level, 0)
@@ -51,7 +51,7 @@ class PromptCommand(TestCase):
 
     def test_prompt(self):
         from butch.context import Context, PROMPT_KEY
-        from butch.commands import cmd_prompt
+        from butch.commands.prompt import cmd_prompt
         from butch.tokens import Argument
 
         ctx = Context()
@@ -12,18 +12,18 @@ class PushdCommand(TestCase):
     def test_pushd_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_pushd
+        from butch.commands.pushd import cmd_pushd
         from butch.commandtype import CommandType
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.pushd.print_help") as prnt:
             cmd_pushd(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.PUSHD, file=sys.stdout)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.pushd.print_help") as prnt:
             cmd_pushd(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.PUSHD, file=ctx.output.stdout
@@ -32,7 +32,7 @@ class PushdCommand(TestCase):
     def test_pushd_empty(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_pushd
+        from butch.commands.pushd import cmd_pushd
 
         ctx = Context()
         self.assertEqual(ctx.error_level, 0)
@@ -53,7 +53,7 @@ class PushdCommand(TestCase):
         import sys
         from os.path import abspath
         from butch.context import Context
-        from butch.commands import cmd_pushd
+        from butch.commands.pushd import cmd_pushd
         from butch.tokens import Argument
 
         ctx = Context()
@@ -76,7 +76,7 @@ class PushdCommand(TestCase):
         import sys
         from os.path import abspath
         from butch.context import Context
-        from butch.commands import cmd_pushd
+        from butch.commands.pushd import cmd_pushd
         from butch.tokens import Argument
 
         ctx = Context()
@@ -95,7 +95,7 @@ class PushdCommand(TestCase):
         import sys
         from os.path import abspath
         from butch.context import Context
-        from butch.commands import cmd_pushd
+        from butch.commands.pushd import cmd_pushd
         from butch.tokens import Argument
         from butch.constants import PATH_NOT_FOUND
 
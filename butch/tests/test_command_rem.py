@@ -12,19 +12,19 @@ class RemCommand(TestCase):
     def test_rem_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_rem
+        from butch.commands.rem import cmd_rem
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.rem.print_help") as prnt:
             cmd_rem(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.REM, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.rem.print_help") as prnt:
             cmd_rem(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.REM, file=ctx.output.stdout
@@ -33,7 +33,7 @@ class RemCommand(TestCase):
 
     def test_cmd_rem(self):
         from butch.context import Context
-        from butch.commands import cmd_rem
+        from butch.commands.rem import cmd_rem
         from butch.tokens import Argument
 
         ctx = Context()
@@ -51,7 +51,7 @@ class RemCommand(TestCase):
 
     def test_rem_empty(self):
         from butch.context import Context
-        from butch.commands import cmd_rem
+        from butch.commands.rem import cmd_rem
 
         ctx = Context()
         with patch("builtins.print") as prnt:
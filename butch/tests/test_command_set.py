@@ -5,25 +5,25 @@
 # pylint: disable=too-many-lines,too-many-locals
 
 from unittest import main, TestCase
-from unittest.mock import patch, MagicMock
+from unittest.mock import call, patch, MagicMock
 
 
 class SetCommand(TestCase):
     def test_set_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.tokens import Argument
         from butch.commandtype import CommandType
         from butch.constants import PARAM_HELP
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.set_.print_help") as prnt:
             cmd_set(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.SET, file=sys.stdout)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.set_.print_help") as prnt:
             cmd_set(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.SET, file=ctx.output.stdout
@@ -32,23 +32,23 @@ class SetCommand(TestCase):
     def test_set_print_all(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands._print_all_variables") as prnt:
+        with patch("butch.commands.set_._print_all_variables") as prnt:
             cmd_set(params=[], ctx=ctx)
         prnt.assert_called_once_with(ctx=ctx, file=sys.stdout)
 
         ctx.collect_output = True
-        with patch("butch.commands._print_all_variables") as prnt:
+        with patch("butch.commands.set_._print_all_variables") as prnt:
             cmd_set(params=[], ctx=ctx)
         prnt.assert_called_once_with(ctx=ctx, file=ctx.output.stdout)
 
     def test_set_prompt_with_text(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.tokens import Argument
         from butch.commandtype import CommandType
 
@@ -65,7 +65,7 @@ class SetCommand(TestCase):
     def test_set_prompt_quiet(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.tokens import Argument
         from butch.commandtype import CommandType
 
@@ -81,7 +81,7 @@ class SetCommand(TestCase):
     def test_set_prompt_from_stdin(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.inputs import CommandInput
         from butch.tokens import Argument
         from butch.commandtype import CommandType
@@ -109,7 +109,7 @@ class SetCommand(TestCase):
     def test_set_prompt_empty_from_stdin(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.inputs import CommandInput
         from butch.tokens import Argument
         from butch.commandtype import CommandType
@@ -133,7 +133,7 @@ class SetCommand(TestCase):
     def test_set_prompt_from_stdin_quiet(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.inputs import CommandInput
         from butch.tokens import Argument
         from butch.commandtype import CommandType
@@ -160,7 +160,7 @@ class SetCommand(TestCase):
     def test_set_prompt_empty_from_stdin_quiet(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.inputs import CommandInput
         from butch.tokens import Argument
         from butch.commandtype import CommandType
@@ -182,7 +182,7 @@ class SetCommand(TestCase):
     def test_set_delete(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.inputs import CommandInput
         from butch.tokens import Argument
         from butch.commandtype import CommandType
@@ -197,7 +197,7 @@ class SetCommand(TestCase):
     def test_set_value(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.inputs import CommandInput
         from butch.tokens import Argument
         from butch.commandtype import CommandType
@@ -213,7 +213,7 @@ class SetCommand(TestCase):
     def test_set_print_single(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.outputs import CommandOutput
         from butch.tokens import Argument
         from butch.commandtype import CommandType
@@ -222,14 +222,14 @@ class SetCommand(TestCase):
         key = "myvar"
         dummy = "dummy"
         ctx.set_variable(key=key, value_to_set=dummy)
-        with patch("butch.commands._print_single_variable") as prnt:
+        with patch("butch.commands.set_._print_single_variable") as prnt:
             cmd_set(params=[Argument(value=key)], ctx=ctx)
         prnt.assert_called_once_with(key=key, ctx=ctx, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
         ctx.output = CommandOutput()
-        with patch("butch.commands._print_single_variable") as prnt:
+        with patch("butch.commands.set_._print_single_variable") as prnt:
             cmd_set(params=[Argument(value=key)], ctx=ctx)
         prnt.assert_called_once_with(key=key, ctx=ctx, file=ctx.output.stdout)
         self.assertEqual(ctx.error_level, 0)
@@ -237,7 +237,7 @@ class SetCommand(TestCase):
     def test_set_value_quoted(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_set
+        from butch.commands.set_ import cmd_set
         from butch.inputs import CommandInput
         from butch.tokens import Argument
         from butch.commandtype import CommandType
@@ -251,3 +251,23 @@ class SetCommand(TestCase):
         ], ctx=ctx)
         self.assertEqual(ctx.error_level, 0)
         self.assertEqual(ctx.get_variable(key=key), dummy)
+
+    def test_set_prefix(self):
+        import sys
+        from butch.context import Context
+        from butch.commands.set_ import cmd_set
+        from butch.constants import ENV_VAR_UNDEFINED
+        from butch.tokens import Argument
+
+        ctx = Context()
+        ctx.set_variable(key="Prefix2", value_to_set="two")
+        ctx.set_variable(key="prefix1", value_to_set="one")
+        ctx.set_variable(key="prefix3", value_to_set="")
+        with patch("butch.commands.set_.print") as prnt:
+            cmd_set(params=[Argument(value="PREFIX")], ctx=ctx)
+            cmd_set(params=[Argument(value="prefixes")], ctx=ctx)
+        self.assertEqual(prnt.call_args_list, [
+            call("prefix1=one", file=sys.stdout),
+            call("Prefix2=two", file=sys.stdout),
+            call(ENV_VAR_UNDEFINED, file=sys.stdout)
+        ])
@@ -12,18 +12,18 @@ class SetlocalCommand(TestCase):
     def test_setlocal_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_setlocal
+        from butch.commands.setlocal import cmd_setlocal
         from butch.commandtype import CommandType
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.setlocal.print_help") as prnt:
             cmd_setlocal(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.SETLOCAL, file=sys.stdout)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.setlocal.print_help") as prnt:
             cmd_setlocal(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.SETLOCAL, file=ctx.output.stdout
@@ -31,7 +31,7 @@ class SetlocalCommand(TestCase):
 
     def test_setlocal_enable_expansion(self):
         from butch.context import Context
-        from butch.commands import cmd_setlocal
+        from butch.commands.setlocal import cmd_setlocal
         from butch.tokens import Argument
 
         ctx = Context()
@@ -44,7 +44,7 @@ class SetlocalCommand(TestCase):
 
     def test_setlocal_disable_expansion(self):
         from butch.context import Context
-        from butch.commands import cmd_setlocal
+        from butch.commands.setlocal import cmd_setlocal
         from butch.tokens import Argument
 
         ctx = Context()
@@ -57,7 +57,7 @@ class SetlocalCommand(TestCase):
 
     def test_setlocal_enable_extensions(self):
         from butch.context import Context
-        from butch.commands import cmd_setlocal
+        from butch.commands.setlocal import cmd_setlocal
         from butch.tokens import Argument
 
         ctx = Context()
@@ -68,7 +68,7 @@ class SetlocalCommand(TestCase):
 
     def test_setlocal_disable_extensions(self):
         from butch.context import Context
-        from butch.commands import cmd_setlocal
+        from butch.commands.setlocal import cmd_setlocal
         from butch.tokens import Argument
 
         ctx = Context()
@@ -79,7 +79,7 @@ class SetlocalCommand(TestCase):
 
     def test_setlocal_unknown(self):
         from butch.context import Context
-        from butch.commands import cmd_setlocal
+        from butch.commands.setlocal import cmd_setlocal
         from butch.tokens import Argument
 
         ctx = Context()
@@ -88,12 +88,77 @@ class SetlocalCommand(TestCase):
         cmd_setlocal(params=[Argument(value="unknown")], ctx=ctx)
         self.assertFalse(ctx.delayed_expansion_enabled)
         self.assertTrue(ctx.extensions_enabled)
+        self.assertEqual(ctx.error_level, 1)
+        # no scope opened
+        self.assertEqual(ctx.scope_depth, 0)
+
+        # checked before any of the options is applied
+        cmd_setlocal(params=[
+            Argument(value="enabledelayedexpansion"),
+            Argument(value="/bogus")
+        ], ctx=ctx)
+        self.assertFalse(ctx.delayed_expansion_enabled)
+        self.assertEqual(ctx.error_level, 1)
+        self.assertEqual(ctx.scope_depth, 0)
+
+    def test_setlocal_scope(self):
+        from butch.context import Context
+        from butch.commands.setlocal import cmd_setlocal
+        from butch.commands.endlocal import cmd_endlocal
+        from butch.tokens import Argument
+
+        ctx = Context()
+        ctx.set_variable(key="kept", value_to_set="old")
+        cmd_setlocal(params=[], ctx=ctx)
+        ctx.set_variable(key="KEPT", value_to_set="new")
+        ctx.set_variable(key="created", value_to_set="value")
+        cmd_setlocal(
+            params=[Argument(value="enabledelayedexpansion")], ctx=ctx
+        )
+        ctx.set_variable(key="kept", value_to_set="newer")
+        self.assertEqual(ctx.scope_depth, 2)
+
+        cmd_endlocal(params=[], ctx=ctx)
+        self.assertFalse(ctx.delayed_expansion_enabled)
+        self.assertEqual(ctx.get_variable(key="kept"), "new")
+
+        cmd_endlocal(params=[], ctx=ctx)
+        self.assertEqual(ctx.get_variable(key="kept"), "old")
+        self.assertIsNone(ctx.get_variable(key="created"))
+        self.assertNotIn("created", ctx.variables)
+
+        # nothing to end
+        cmd_endlocal(params=[], ctx=ctx)
+        self.assertEqual(ctx.scope_depth, 0)
 
-    def test_setlocal_nyi(self):
+    def test_setlocal_restore_flags(self):
         from butch.context import Context
-        from butch.commands import cmd_setlocal
+        from butch.commands.setlocal import cmd_setlocal
+        from butch.commands.endlocal import cmd_endlocal
         from butch.tokens import Argument
 
         ctx = Context()
-        with self.assertRaises(NotImplementedError):
-            cmd_setlocal(params=[], ctx=ctx)
+        cmd_setlocal(params=[
+            Argument(value="ENABLEDELAYEDEXPANSION"),
+            Argument(value="disableextensions")
+        ], ctx=ctx)
+        self.assertTrue(ctx.delayed_expansion_enabled)
+        self.assertFalse(ctx.extensions_enabled)
+        self.assertEqual(ctx.error_level, 0)
+
+        cmd_endlocal(params=[], ctx=ctx)
+        self.assertFalse(ctx.delayed_expansion_enabled)
+        self.assertTrue(ctx.extensions_enabled)
+
+    def test_endlocal_help(self):
+        import sys
+        from butch.context import Context
+        from butch.commands.endlocal import cmd_endlocal
+        from butch.commandtype import CommandType
+        from butch.tokens import Argument
+        from butch.constants import PARAM_HELP
+
+        ctx = Context()
+        with patch("butch.commands.endlocal.print_help") as prnt:
+            cmd_endlocal(params=[Argument(value=PARAM_HELP)], ctx=ctx)
+        prnt.assert_called_once_with(cmd=CommandType.ENDLOCAL, file=sys.stdout)
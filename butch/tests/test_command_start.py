@@ -0,0 +1,215 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+
+import os
+from io import StringIO
+from os.path import abspath, dirname, join
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import main, TestCase, skipIf
+from unittest.mock import patch
+
+
+@skipIf(os.name == "nt", "POSIX shell scripts")
+class StartCommand(TestCase):
+    def setUp(self):
+        self.folder = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.folder)
+
+    def _context(self):
+        from butch.context import Context
+
+        ctx = Context()
+        ctx.set_variable(key="PATH", value_to_set=self.folder)
+        # a Batch job imports Butch in a new interpreter
+        root = dirname(dirname(dirname(abspath(__file__))))
+        ctx.set_variable(key="PYTHONPATH", value_to_set=root)
+        return ctx
+
+    def _script(self, name: str, body: str):
+        path = join(self.folder, name)
+        with open(path, "w") as fdes:
+            fdes.write(body)
+        os.chmod(path, 0o755)
+        return path
+
+    def test_start_help(self):
+        import sys
+        from butch.context import Context
+        from butch.commands.start import cmd_start
+        from butch.commandtype import CommandType
+        from butch.tokens import Argument
+        from butch.constants import PARAM_HELP
+
+        ctx = Context()
+        with patch("butch.commands.start.print_help") as prnt:
+            cmd_start(params=[Argument(value=PARAM_HELP)], ctx=ctx)
+        prnt.assert_called_once_with(cmd=CommandType.START, file=sys.stdout)
+        self.assertEqual(len(ctx.jobs), 0)
+
+    def test_start_bad_param(self):
+        from butch.commands.start import cmd_start
+        from butch.constants import START_PARAM
+        from butch.tokens import Argument
+
+        ctx = self._context()
+        with patch("sys.stderr", new=StringIO()) as err:
+            cmd_start(params=[Argument(value="/X")], ctx=ctx)
+        self.assertEqual(err.getvalue(), START_PARAM.format("/X") + "\n")
+        self.assertEqual(ctx.error_level, 1)
+
+    def test_start_not_found(self):
+        from butch.commands.start import cmd_start
+        from butch.constants import FILE_NOT_FOUND
+        from butch.tokens import Argument
+
+        ctx = self._context()
+        with patch("sys.stderr", new=StringIO()) as err:
+            cmd_start(params=[Argument(value="missing")], ctx=ctx)
+        self.assertEqual(err.getvalue(), FILE_NOT_FOUND + "\n")
+        self.assertEqual(ctx.error_level, 9059)
+        self.assertEqual(len(ctx.jobs), 0)
+
+    def test_start_concurrent(self):
+        from butch.commands.start import cmd_start
+        from butch.tokens import Argument
+
+        # the job can finish only after START returned
+        fifo = join(self.folder, "fifo")
+        os.mkfifo(fifo)
+        self._script(
+            name="prog", body=f'#!/bin/sh\nread line < {fifo}\nexit "$1"\n'
+        )
+        ctx = self._context()
+        cmd_start(params=[
+            Argument(value='"title"', quoted=True), Argument(value="/B"),
+            Argument(value="prog"), Argument(value="3")
+        ], ctx=ctx)
+        self.assertEqual(ctx.error_level, 0)
+        job = ctx.jobs[1]
+        self.assertTrue(job.running)
+        self.assertEqual(job.name, "prog 3")
+
+        with open(fifo, "w") as fdes:
+            fdes.write("go\n")
+        self.assertEqual(ctx.jobs.wait(), [job])
+        self.assertEqual(job.code, 3)
+        self.assertEqual(len(ctx.jobs), 0)
+
+    def test_start_wait(self):
+        from butch.commands.start import cmd_start
+        from butch.tokens import Argument
+
+        self._script(name="prog", body='#!/bin/sh\necho "$1"\nexit 5\n')
+        ctx = self._context()
+        with patch("sys.stdout", new=StringIO()) as out:
+            cmd_start(params=[
+                Argument(value="/WAIT"), Argument(value="prog"),
+                Argument(value='"a b"', quoted=True)
+            ], ctx=ctx)
+        self.assertEqual(out.getvalue(), "a b\n")
+        self.assertEqual(ctx.error_level, 5)
+        self.assertEqual(len(ctx.jobs), 0)
+
+    def test_start_wait_all(self):
+        from butch.commands.start import cmd_start
+        from butch.tokens import Argument
+
+        self._script(name="prog", body='#!/bin/sh\nexit "$1"\n')
+        ctx = self._context()
+        for code in ("0", "2", "4"):
+            cmd_start(
+                params=[Argument(value="prog"), Argument(value=code)],
+                ctx=ctx
+            )
+        self.assertEqual(len(ctx.jobs), 3)
+
+        cmd_start(params=[Argument(value="/wait")], ctx=ctx)
+        # the first failed job in the starting order
+        self.assertEqual(ctx.error_level, 2)
+        self.assertEqual(len(ctx.jobs), 0)
+
+    def test_start_batch(self):
+        from butch.commands.start import cmd_start
+        from butch.tokens import Argument
+
+        self._script(
+            name="job.bat", body="@echo off\nset x=child\necho %x%\nexit 6\n"
+        )
+        ctx = self._context()
+        ctx.set_variable(key="x", value_to_set="parent")
+        with patch("sys.stdout", new=StringIO()) as out:
+            cmd_start(params=[Argument(value="job")], ctx=ctx)
+            job, = ctx.jobs.wait()
+        self.assertEqual(out.getvalue(), "child\n")
+        self.assertEqual(job.code, 6)
+        # the job has its own variables
+        self.assertEqual(ctx.get_variable("x"), "parent")
+        self.assertEqual(ctx.error_level, 0)
+
+    def test_start_batch_cd(self):
+        from butch.commands.start import cmd_start
+        from butch.tokens import Argument
+
+        os.mkdir(join(self.folder, "sub"))
+        self._script(
+            name="job.bat", body="@echo off\ncd sub\necho %1 %2 %cd%\n"
+        )
+        old_cwd = os.getcwd()
+        os.chdir(self.folder)
+        try:
+            ctx = self._context()
+            cwd = ctx.cwd
+            with patch("sys.stdout", new=StringIO()) as out:
+                cmd_start(params=[
+                    Argument(value="/WAIT"), Argument(value="job"),
+                    Argument(value='"a b"', quoted=True), Argument(value="c")
+                ], ctx=ctx)
+            # the job has its own folder and arguments
+            self.assertEqual(os.getcwd(), self.folder)
+            self.assertEqual(ctx.cwd, cwd)
+        finally:
+            os.chdir(old_cwd)
+        self.assertEqual(
+            out.getvalue(), f'"a b" c {join(self.folder, "sub")}\n'
+        )
+        self.assertEqual(ctx.error_level, 0)
+
+
+class Jobs(TestCase):
+    def test_job_error(self):
+        from butch.jobs import JobTable
+
+        def fail():
+            raise ValueError("failed")
+
+        table = JobTable()
+        job = table.start(name="fail", run=fail)
+        self.assertEqual(table.wait(), [job])
+        self.assertEqual(job.code, 1)
+        self.assertIsInstance(job.error, ValueError)
+        self.assertFalse(job.running)
+
+    def test_isolated_context(self):
+        from butch.context import Context
+
+        ctx = Context()
+        ctx.set_variable(key="a", value_to_set="1")
+        ctx.push_scope()
+        ctx.error_level = 3
+
+        child = ctx.isolated()
+        self.assertEqual(child.get_variable("a"), "1")
+        self.assertEqual(child.scope_depth, 0)
+        self.assertEqual(child.get_variable("errorlevel"), "0")
+        child.set_variable(key="a", value_to_set="2")
+        self.assertEqual(ctx.get_variable("a"), "1")
+        self.assertIs(child.jobs, ctx.jobs)
+
+
+if __name__ == "__main__":
+    main()
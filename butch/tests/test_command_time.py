@@ -12,19 +12,19 @@ class TimeCommand(TestCase):
     def test_time_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_time
+        from butch.commands.time import cmd_time
         from butch.commandtype import CommandType
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.time.print_help") as prnt:
             cmd_time(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.TIME, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.time.print_help") as prnt:
             cmd_time(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.TIME, file=ctx.output.stdout
@@ -34,11 +34,11 @@ class TimeCommand(TestCase):
     def test_time_print_only(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_time
+        from butch.commands.time import cmd_time
         from butch.tokens import Argument
 
         ctx = Context()
-        time_mock = patch("butch.commands.datetime")
+        time_mock = patch("butch.commands.time.datetime")
         with time_mock as dmock, patch("builtins.print") as prnt:
             cmd_time(params=[Argument(value="/t")], ctx=ctx)
         dmock.now.assert_called_once_with()
@@ -48,7 +48,7 @@ class TimeCommand(TestCase):
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        time_mock = patch("butch.commands.datetime")
+        time_mock = patch("butch.commands.time.datetime")
         with time_mock as dmock, patch("builtins.print") as prnt:
             cmd_time(params=[Argument(value="/T")], ctx=ctx)
         dmock.now.assert_called_once_with()
@@ -60,10 +60,10 @@ class TimeCommand(TestCase):
     def test_time_print_ask(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_time
+        from butch.commands.time import cmd_time
 
         ctx = Context()
-        time_mock = patch("butch.commands.datetime")
+        time_mock = patch("butch.commands.time.datetime")
         print_mock = patch("builtins.print")
         input_mock = patch("builtins.input")
         with time_mock as dmock, print_mock as prnt, input_mock as inp:
@@ -80,7 +80,7 @@ class TimeCommand(TestCase):
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        time_mock = patch("butch.commands.datetime")
+        time_mock = patch("butch.commands.time.datetime")
         print_mock = patch("builtins.print")
         input_mock = patch("builtins.input")
         with time_mock as dmock, print_mock as prnt, input_mock as inp:
@@ -99,10 +99,10 @@ class TimeCommand(TestCase):
     def test_time_print_interrupt(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_time
+        from butch.commands.time import cmd_time
 
         ctx = Context()
-        time_mock = patch("butch.commands.datetime")
+        time_mock = patch("butch.commands.time.datetime")
         print_mock = patch("builtins.print")
         input_mock = patch("builtins.input", side_effect=KeyboardInterrupt)
         with time_mock as dmock, print_mock as prnt, input_mock as inp:
@@ -119,7 +119,7 @@ class TimeCommand(TestCase):
         self.assertEqual(ctx.error_level, 1)
 
         ctx.collect_output = True
-        time_mock = patch("butch.commands.datetime")
+        time_mock = patch("butch.commands.time.datetime")
         print_mock = patch("builtins.print")
         input_mock = patch("builtins.input", side_effect=KeyboardInterrupt)
         with time_mock as dmock, print_mock as prnt, input_mock as inp:
@@ -13,7 +13,7 @@ class TypeCommand(TestCase):
         import sys
         from os.path import abspath
         from butch.context import Context
-        from butch.commands import cmd_type
+        from butch.commands.type_ import cmd_type
         from butch.tokens import Argument
 
         dummy = "dummy"
@@ -32,7 +32,7 @@ class TypeCommand(TestCase):
         import sys
         from os.path import abspath
         from butch.context import Context
-        from butch.commands import cmd_type
+        from butch.commands.type_ import cmd_type
         from butch.tokens import Argument
 
         dummy = "dummy"
@@ -56,7 +56,7 @@ class TypeCommand(TestCase):
         import sys
         from butch.context import Context
         from butch.constants import SYNTAX_INCORRECT
-        from butch.commands import cmd_type
+        from butch.commands.type_ import cmd_type
 
         ctx = Context()
         ctx.collect_output = True
@@ -73,12 +73,12 @@ class TypeCommand(TestCase):
         import sys
         from butch.context import Context
         from butch.constants import PARAM_HELP
-        from butch.commands import cmd_type
+        from butch.commands.type_ import cmd_type
         from butch.commandtype import CommandType
         from butch.tokens import Argument
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.type_.print_help") as prnt:
             cmd_type(params=[Argument(value=PARAM_HELP)], ctx=ctx)
 
         prnt.assert_called_once_with(cmd=CommandType.TYPE, file=sys.stdout)
@@ -87,7 +87,7 @@ class TypeCommand(TestCase):
         import sys
         from os.path import abspath, dirname
         from butch.context import Context
-        from butch.commands import cmd_type
+        from butch.commands.type_ import cmd_type
         from butch.constants import ACCESS_DENIED
         from butch.tokens import Argument
 
@@ -107,7 +107,7 @@ class TypeCommand(TestCase):
         import sys
         from os.path import abspath, dirname
         from butch.context import Context
-        from butch.commands import cmd_type
+        from butch.commands.type_ import cmd_type
         from butch.constants import FILE_NOT_FOUND
         from butch.tokens import Argument
 
@@ -127,7 +127,7 @@ class TypeCommand(TestCase):
         import sys
         from os.path import abspath, dirname
         from butch.context import Context
-        from butch.commands import cmd_type
+        from butch.commands.type_ import cmd_type
         from butch.constants import ACCESS_DENIED, ERROR_PROCESSING
         from butch.tokens import Argument
 
@@ -150,7 +150,7 @@ class TypeCommand(TestCase):
         import sys
         from os.path import abspath, dirname
         from butch.context import Context
-        from butch.commands import cmd_type
+        from butch.commands.type_ import cmd_type
         from butch.constants import FILE_NOT_FOUND, ERROR_PROCESSING
         from butch.tokens import Argument
 
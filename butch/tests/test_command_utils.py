@@ -12,18 +12,18 @@ class Utils(TestCase):
     def test_print_all_vars(self):
         import sys
         from butch.context import Context
-        from butch.commands import _print_all_variables
+        from butch.commands.set_ import _print_all_variables
         from unittest.mock import call
 
         ctx = Context()
-        with patch("butch.commands.print") as prnt:
+        with patch("butch.commands.set_.print") as prnt:
             _print_all_variables(ctx=ctx, file=sys.stdout)
             self.assertEqual(prnt.call_count, len(ctx.variables))
 
     def test_print_single_var_undefined(self):
         import sys
         from butch.context import Context
-        from butch.commands import _print_single_variable
+        from butch.commands.set_ import _print_single_variable
         from butch.constants import ENV_VAR_UNDEFINED
         from unittest.mock import call
 
@@ -31,7 +31,7 @@ class Utils(TestCase):
         ctx.get_variable = MagicMock(return_value=False)
 
         dummy = "dummy"
-        with patch("butch.commands.print") as prnt:
+        with patch("butch.commands.set_.print") as prnt:
             _print_single_variable(key=dummy, ctx=ctx, file=sys.stdout)
         prnt.assert_called_once_with(ENV_VAR_UNDEFINED, file=sys.stdout)
         ctx.get_variable.assert_called_once_with(key=dummy)
@@ -39,7 +39,7 @@ class Utils(TestCase):
     def test_print_single_var_defined(self):
         import sys
         from butch.context import Context
-        from butch.commands import _print_single_variable
+        from butch.commands.set_ import _print_single_variable
         from unittest.mock import call
 
         ctx = Context()
@@ -47,18 +47,18 @@ class Utils(TestCase):
         ctx.get_variable = MagicMock(return_value=found_value)
 
         dummy = "dummy"
-        with patch("butch.commands.print") as prnt:
+        with patch("butch.commands.set_.print") as prnt:
             _print_single_variable(key=dummy, ctx=ctx, file=sys.stdout)
         prnt.assert_called_once_with(f"{dummy}={found_value}", file=sys.stdout)
         ctx.get_variable.assert_called_once_with(key=dummy)
 
     def test_cmd_map(self):
-        from butch.commands import get_cmd_map
+        from butch.commands import get_cmd_map, load_command
         aliases = {"erase": "del", "md": "mkdir", "rd": "rmdir"}
 
-        for key, func in get_cmd_map().items():
+        for key, spec in get_cmd_map().items():
             key_name = aliases.get(key.value, key.value)
-            func_name = func.__name__
+            func_name = load_command(spec=spec).__name__
             self.assertEqual(func_name[:4], "cmd_")
             self.assertEqual(key_name, func_name[4:])
 
@@ -67,3 +67,69 @@ class Utils(TestCase):
 
         for func, key in get_reverse_cmd_map().items():
             self.assertEqual(key.value, func)
+
+    def test_registry_lazy(self):
+        import subprocess
+        import sys
+        from butch.commands import CommandRegistry
+        from butch.commandtype import CommandType
+
+        registry = CommandRegistry({
+            CommandType.ECHO: "butch.commands.echo:cmd_echo"
+        })
+        self.assertFalse(registry.loaded(CommandType.ECHO))
+        self.assertEqual(registry.get(CommandType.ECHO).__name__, "cmd_echo")
+        self.assertTrue(registry.loaded(CommandType.ECHO))
+        self.assertIsNone(registry.get(CommandType.DIR))
+
+        # a fresh interpreter, only the called command is imported
+        code = (
+            "import sys\n"
+            "from butch.context import Context\n"
+            "from butch.handler import handle\n"
+            "handle(text='echo hi', ctx=Context())\n"
+            "print(sorted(name for name in sys.modules\n"
+            "    if name.startswith('butch.commands.')))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], check=True,
+            stdout=subprocess.PIPE, universal_newlines=True
+        ).stdout.splitlines()
+        self.assertEqual(out, [
+            "hi", "['butch.commands.common', 'butch.commands.echo', "
+            "'butch.commands.external']"
+        ])
+
+    def test_registry_entry_points(self):
+        from butch.caller import new_call
+        from butch.commands import CommandRegistry
+        from butch.commands.echo import cmd_echo
+        from butch.commandtype import CommandType
+        from butch.context import Context
+        from butch.tokenizer import new_command
+
+        points = [
+            ("Choice", "butch.commands.echo:cmd_echo"),
+            ("dir", "missing.module:cmd_dir")
+        ]
+        registry = CommandRegistry()
+        with patch(
+            "butch.commands.iter_entry_points", return_value=points
+        ) as found:
+            self.assertIs(registry.find(name="CHOICE"), cmd_echo)
+            self.assertIsNone(registry.find(name="dir"))
+            self.assertIsNone(registry.resolve(cmd=CommandType.UNKNOWN))
+            self.assertIs(registry.resolve(
+                cmd=CommandType.UNKNOWN, name="choice"
+            ), cmd_echo)
+        # read only once
+        found.assert_called_once_with()
+        self.assertNotIn("dir", registry)
+
+        # called instead of a program
+        func = MagicMock()
+        with patch.dict("butch.commands.CMD_MAP", {"mycmd": func}):
+            cmd = new_command(word="mycmd")
+            ctx = Context()
+            new_call(cmd=cmd, ctx=ctx)
+        func.assert_called_once_with(params=[], ctx=ctx)
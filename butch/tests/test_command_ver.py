@@ -12,19 +12,19 @@ class VerCommand(TestCase):
     def test_ver_help(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_ver
+        from butch.commands.ver import cmd_ver
         from butch.tokens import Argument
         from butch.constants import PARAM_HELP
         from butch.commandtype import CommandType
 
         ctx = Context()
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.ver.print_help") as prnt:
             cmd_ver(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(cmd=CommandType.VER, file=sys.stdout)
         self.assertEqual(ctx.error_level, 0)
 
         ctx.collect_output = True
-        with patch("butch.commands.print_help") as prnt:
+        with patch("butch.commands.ver.print_help") as prnt:
             cmd_ver(params=[Argument(value=PARAM_HELP)], ctx=ctx)
         prnt.assert_called_once_with(
             cmd=CommandType.VER, file=ctx.output.stdout
@@ -34,7 +34,7 @@ class VerCommand(TestCase):
     def test_ver_platform(self):
         import sys
         from butch.context import Context
-        from butch.commands import cmd_ver
+        from butch.commands.ver import cmd_ver
         from butch.tokens import Argument
 
         ctx = Context()
@@ -42,7 +42,9 @@ class VerCommand(TestCase):
 
         ctx.error_level = 123
         self.assertEqual(ctx.error_level, 123)
-        platform_mock = patch("butch.commands.platform", return_value=dummy)
+        platform_mock = patch(
+            "butch.commands.ver.platform", return_value=dummy
+        )
         print_mock = patch("builtins.print")
         with platform_mock as plf, print_mock as prnt:
             self.assertIsNone(cmd_ver(params=[], ctx=ctx))
@@ -52,7 +54,9 @@ class VerCommand(TestCase):
 
         ctx.error_level = 123
         self.assertEqual(ctx.error_level, 123)
-        platform_mock = patch("butch.commands.platform", return_value=dummy)
+        platform_mock = patch(
+            "butch.commands.ver.platform", return_value=dummy
+        )
         print_mock = patch("builtins.print")
         with platform_mock as plf, print_mock as prnt:
             self.assertIsNone(cmd_ver(params=[Argument(value="abc")], ctx=ctx))
@@ -63,7 +67,9 @@ class VerCommand(TestCase):
         ctx.collect_output = True
         ctx.error_level = 123
         self.assertEqual(ctx.error_level, 123)
-        platform_mock = patch("butch.commands.platform", return_value=dummy)
+        platform_mock = patch(
+            "butch.commands.ver.platform", return_value=dummy
+        )
         print_mock = patch("builtins.print")
         with platform_mock as plf, print_mock as prnt:
             self.assertIsNone(cmd_ver(params=[], ctx=ctx))
@@ -74,7 +80,9 @@ class VerCommand(TestCase):
         ctx.collect_output = True
         ctx.error_level = 123
         self.assertEqual(ctx.error_level, 123)
-        platform_mock = patch("butch.commands.platform", return_value=dummy)
+        platform_mock = patch(
+            "butch.commands.ver.platform", return_value=dummy
+        )
         print_mock = patch("builtins.print")
         with platform_mock as plf, print_mock as prnt:
             self.assertIsNone(cmd_ver(params=[Argument(value="abc")], ctx=ctx))
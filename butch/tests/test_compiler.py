@@ -0,0 +1,143 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-many-lines,too-many-locals
+
+from unittest import main, TestCase
+from unittest.mock import patch
+
+
+def compile_text(text: str):
+    from butch.compiler import Program
+    from butch.context import Context
+    from butch.tokenizer import tokenize
+
+    program = Program(stream=iter(tokenize(text=text, ctx=Context())))
+    program.compile_all()
+    return program
+
+
+class Compiler(TestCase):
+    def test_flatten(self):
+        from butch.compiler import Op
+        from butch.tokenizer import Concat
+        from butch.tokens import Block
+
+        program = compile_text("\n".join([
+            "echo 1 & echo 2", "(", "echo 3", "echo 4", ")", ""
+        ]))
+        code = program.code
+        self.assertEqual(
+            [(operation, arg.args[0].value)
+             for operation, arg in code
+             if operation in (Op.CALL, Op.CHILD)],
+            [(Op.CHILD, "1"), (Op.CHILD, "2"), (Op.CALL, "3"), (Op.CALL, "4")]
+        )
+        self.assertEqual([operation for operation, _ in code], [
+            Op.CHILD, Op.RESET, Op.HISTORY, Op.CHILD,
+            Op.CALL, Op.CALL, Op.HISTORY, Op.EOF
+        ])
+        self.assertIsInstance(code[2][1], Concat)
+        self.assertIsInstance(code[6][1], Block)
+
+    def test_history(self):
+        from butch.context import Context
+        from butch.handler import _run
+        from butch.tokens import Block
+        from butch.tokenizer import Concat
+
+        program = compile_text("\n".join([
+            "echo 1 & echo 2", "(", "echo 3", ")", "goto end", "echo 4",
+            ":end", ""
+        ]))
+        ctx = Context()
+        with patch("butch.commands.echo.print"):
+            _run(program=program, ctx=ctx)
+        # the same entries as from new_call() for the tokens
+        history = ctx.history
+        self.assertEqual(len(history), 4)
+        self.assertIsInstance(history[0], Concat)
+        self.assertEqual(history[1].args[0].value, "3")
+        self.assertIsInstance(history[2], Block)
+        self.assertEqual(
+            [arg.value for arg in history[3].args], ["end"]
+        )
+
+    def test_expansion_compiled(self):
+        from butch.expansion import Segment
+
+        program = compile_text("echo %x% | more a\n")
+        pipe = program.code[0][1]
+        self.assertEqual(
+            pipe.left.args[0].template, ((Segment.VARIABLE, "x"), )
+        )
+        self.assertEqual(pipe.right.args[0].template, "a")
+
+    def test_goto(self):
+        from butch.compiler import Op
+
+        program = compile_text("\n".join([
+            "goto LOOP", ":loop", "goto :Loop", "goto :EOF", "goto %x%",
+            "goto", "goto /?", ""
+        ]))
+        code = [
+            instruction for instruction in program.code
+            if instruction[0] is not Op.HISTORY
+        ]
+        self.assertEqual(code[0], (Op.GOTO, "LOOP"))
+        self.assertEqual(code[1], (Op.GOTO, ":Loop"))
+        self.assertEqual(code[2], (Op.EOF, None))
+        self.assertEqual(
+            [operation for operation, _ in code[3:]],
+            [Op.CALL, Op.CALL, Op.CALL, Op.EOF]
+        )
+        # label is just an offset of the next instruction
+        self.assertEqual(program.resolve(inst_ptr=1, target="LOOP"), 2)
+        self.assertEqual(program.resolve(inst_ptr=3, target=":loop"), 2)
+        self.assertEqual(program.resolve(inst_ptr=1, target="missing"), -1)
+
+    def test_resolve_reads_ahead(self):
+        from butch.compiler import Program
+        from butch.context import Context
+        from butch.tokenizer import iter_tokenize
+
+        read = []
+
+        def chunks():
+            lines = (
+                "goto end\n", "echo 1\n", "echo 2\n", ":end\n",
+                "echo 3\n", "echo 4\n", "echo 5\n", "echo 6\n"
+            )
+            for line in lines:
+                read.append(line)
+                yield line
+
+        program = Program(stream=iter_tokenize(
+            chunks=chunks(), ctx=Context()
+        ))
+        program.compile_next()
+        self.assertEqual(len(read), 3)
+        self.assertEqual(program.resolve(inst_ptr=1, target="end"), 4)
+        # stops right after the label
+        self.assertEqual(len(read), 6)
+
+    def test_run_jumps(self):
+        from butch.compiler import Op
+        from butch.context import Context
+        from butch.handler import _run
+
+        program = compile_text("\n".join([
+            "(", "echo 1", "goto END", "echo skipped", ")",
+            "echo skipped", ":end", "echo 2", ""
+        ]))
+        with patch("butch.commands.echo.print") as prnt:
+            _run(program=program, ctx=Context())
+        printed = [args for args, _ in prnt.call_args_list]
+        self.assertEqual(printed, [("1", ), ("2", )])
+        # resolved on the first run
+        self.assertEqual(program.code[2], (Op.JUMP, 6))
+
+
+if __name__ == "__main__":
+    main()
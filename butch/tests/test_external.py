@@ -0,0 +1,182 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+
+import os
+from io import StringIO
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import main, TestCase, skipIf
+from unittest.mock import patch
+
+
+def _script(folder: str, name: str, body: str) -> str:
+    path = join(folder, name)
+    with open(path, "w") as fdes:
+        fdes.write(f"#!/bin/sh\n{body}\n")
+    os.chmod(path, 0o755)
+    return path
+
+
+@skipIf(os.name == "nt", "POSIX shell scripts")
+class External(TestCase):
+    def setUp(self):
+        self.folder = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.folder)
+
+    def test_find_program(self):
+        from butch.external import find_program
+
+        path = _script(folder=self.folder, name="prog", body="true")
+        found = find_program(
+            name="prog", path=f"/nonexisting;{self.folder}", pathext=".EXE"
+        )
+        self.assertEqual(found, path)
+        self.assertIsNone(find_program(
+            name="missing", path=self.folder, pathext=".EXE"
+        ))
+
+        # not executable, but runnable as a Batch file
+        batch = join(self.folder, "script.bat")
+        with open(batch, "w") as fdes:
+            fdes.write("echo")
+        self.assertEqual(find_program(
+            name="script", path=self.folder, pathext=".COM;.BAT"
+        ), batch)
+
+    def test_cache(self):
+        from butch.external import CommandCache
+
+        cache = CommandCache()
+        with patch("butch.external.find_program") as find:
+            find.return_value = None
+            self.assertIsNone(cache.resolve(name="x", path="a", pathext=""))
+            # misses are remembered too
+            self.assertIsNone(cache.resolve(name="x", path="a", pathext=""))
+            find.assert_called_once()
+            self.assertEqual(len(cache), 1)
+
+            # another PATH empties the cache
+            find.return_value = "b/x"
+            self.assertEqual(
+                cache.resolve(name="x", path="b", pathext=""), "b/x"
+            )
+            self.assertEqual(find.call_count, 2)
+            self.assertEqual(len(cache), 1)
+
+    def test_environment(self):
+        from butch.external import CommandCache
+        from butch.variables import VariableStore
+
+        cache = CommandCache()
+        store = VariableStore(values={"Foo": "1", "empty": ""})
+        with patch.dict("os.environ", {"FOO": "0", "EMPTY": "x"}):
+            env = cache.environment(variables=store)
+            self.assertEqual(env["FOO"], "1")
+            self.assertNotIn("EMPTY", env)
+            self.assertIs(cache.environment(variables=store), env)
+
+            store.set(name="foo", value="2")
+            self.assertEqual(cache.environment(variables=store)["FOO"], "2")
+
+    def test_run_program(self):
+        from butch.external import run_program
+
+        path = _script(
+            folder=self.folder, name="prog",
+            body='read line; echo "$line $1"; exit 3'
+        )
+        out = StringIO()
+        code = run_program(
+            argv=[path, "world"], env={}, stdin=StringIO("hello\n"),
+            stdout=out
+        )
+        self.assertEqual(code, 3)
+        self.assertEqual(out.getvalue(), "hello world\n")
+
+    def test_command(self):
+        from butch.caller import new_call
+        from butch.context import Context
+        from butch.tokenizer import new_command
+        from butch.tokens import Argument
+
+        _script(folder=self.folder, name="prog", body='echo "$1"')
+        ctx = Context()
+        ctx.set_variable(key="PATH", value_to_set=self.folder)
+        cmd = new_command(word="prog")
+        cmd.args = [Argument(value='"a b"')]
+
+        with patch("sys.stdout", new=StringIO()) as out:
+            new_call(cmd=cmd, ctx=ctx)
+        self.assertEqual(out.getvalue(), "a b\n")
+        self.assertEqual(ctx.error_level, 0)
+
+    def test_command_batch_args(self):
+        from butch.caller import new_call
+        from butch.context import Context
+        from butch.tokenizer import new_command
+        from butch.tokens import Argument
+
+        with open(join(self.folder, "job.bat"), "w") as fdes:
+            fdes.write("@echo off\necho %0 %1 %2\n")
+        ctx = Context(arguments=["butch"])
+        ctx.set_variable(key="PATH", value_to_set=self.folder)
+        cmd = new_command(word="job")
+        cmd.args = [Argument(value='"a b"'), Argument(value="c")]
+
+        with patch("sys.stdout", new=StringIO()) as out:
+            new_call(cmd=cmd, ctx=ctx)
+        self.assertEqual(out.getvalue(), 'job "a b" c\n')
+        # the caller's arguments are back
+        self.assertEqual(ctx.arguments, ["butch"])
+
+    def test_command_not_runnable(self):
+        from butch.caller import new_call
+        from butch.context import Context
+        from butch.tokenizer import new_command
+
+        # executable, but the system can't run it
+        path = join(self.folder, "prog")
+        with open(path, "wb") as fdes:
+            fdes.write(b"\0\0\0\0")
+        os.chmod(path, 0o755)
+        ctx = Context()
+        ctx.set_variable(key="PATH", value_to_set=self.folder)
+        with patch("sys.stderr", new=StringIO()) as err:
+            new_call(cmd=new_command(word="prog"), ctx=ctx)
+        self.assertIn("Exec format error", err.getvalue())
+        self.assertEqual(ctx.error_level, 1)
+
+    def test_command_not_found(self):
+        from butch.caller import new_call
+        from butch.constants import NOT_RECOGNIZED
+        from butch.context import Context
+        from butch.tokenizer import new_command
+
+        ctx = Context()
+        ctx.set_variable(key="PATH", value_to_set=self.folder)
+        with patch("sys.stderr", new=StringIO()) as err:
+            new_call(cmd=new_command(word="missing"), ctx=ctx)
+        self.assertEqual(
+            err.getvalue(), NOT_RECOGNIZED.format("missing") + "\n"
+        )
+        self.assertEqual(ctx.error_level, 9009)
+
+    def test_exit_status_not_found(self):
+        import sys
+        from subprocess import run, PIPE
+
+        proc = run(
+            [sys.executable, "-m", "butch", "/C", "butch-missing-command"],
+            stdout=PIPE, stderr=PIPE, env={**os.environ, "PATH": self.folder},
+            check=False
+        )
+        self.assertEqual(proc.returncode, 127)
+
+
+if __name__ == "__main__":
+    main()
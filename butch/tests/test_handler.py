@@ -0,0 +1,67 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-many-lines,too-many-locals
+
+from unittest import main, TestCase
+from unittest.mock import patch
+
+
+class Handler(TestCase):
+    def test_stream_runs_while_reading(self):
+        from butch.context import Context
+        from butch.handler import handle_stream
+
+        read = []
+
+        def chunks():
+            for chunk in ("echo 1\n", "echo 2\n", "echo 3\n", "echo 4\n"):
+                read.append(chunk)
+                yield chunk
+
+        def echo(*_, **__):
+            printed.append(len(read))
+
+        printed = []
+        with patch("butch.commands.echo.print", side_effect=echo):
+            handle_stream(chunks=chunks(), ctx=Context())
+        self.assertEqual(printed, [3, 4, 4, 4])
+
+    def test_goto_forward_reads_ahead(self):
+        from butch.context import Context
+        from butch.handler import handle_stream
+
+        lines = [
+            "echo one\n", "goto forward\n", "echo skipped\n",
+            ":forward\n", "echo two\n"
+        ]
+        with patch("butch.commands.echo.print") as prnt:
+            handle_stream(chunks=iter(lines), ctx=Context())
+        printed = [args for args, _ in prnt.call_args_list]
+        self.assertEqual(printed, [("one", ), ("two", )])
+
+    def test_goto_duplicate_label_next(self):
+        from butch.context import Context
+        from butch.handler import handle_input
+
+        labels = "\n".join([
+            ":loop", "echo first", "goto :eof",
+            ":loop", "echo second", "goto :eof",
+            ":start", "goto loop",
+        ])
+        # the first label after GOTO, then from the beginning
+        for goto, expected in (("loop", "first"), ("start", "first")):
+            with patch("butch.commands.echo.print") as prnt:
+                handle_input(inp=f"goto {goto}\n{labels}", ctx=Context())
+            printed = [args for args, _ in prnt.call_args_list]
+            self.assertEqual(printed, [(expected, )])
+
+        with patch("butch.commands.echo.print") as prnt:
+            handle_input(inp=f"echo 0\n{labels}", ctx=Context())
+        printed = [args for args, _ in prnt.call_args_list]
+        self.assertEqual(printed, [("0", ), ("first", )])
+
+
+if __name__ == "__main__":
+    main()
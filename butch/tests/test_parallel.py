@@ -0,0 +1,76 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-many-lines,too-many-locals
+
+from os import environ
+from unittest import main, TestCase
+from unittest.mock import patch
+
+
+class Parallel(TestCase):
+    def test_same_as_sequential(self):
+        from butch.benchmarks import generate_script
+        from butch.context import Context
+        from butch.parallel import tokenize_parallel
+        from butch.tokenizer import tokenize, Lexer
+
+        text = generate_script(lines=2000)
+        expected = tokenize(text=text, ctx=Context(), lexer=Lexer.TABLE)
+        for parts in (2, 5):
+            ctx = Context()
+            with patch.object(ctx.log, "debug") as debug:
+                self.assertEqual(tokenize_parallel(
+                    text=text, ctx=ctx, workers=2, parts=parts
+                ), expected)
+            # logged only with DEBUG
+            debug.assert_not_called()
+
+    def test_wrong_guess(self):
+        from butch.context import Context
+        from butch.parallel import tokenize_parallel
+        from butch.tokenizer import tokenize, Lexer
+
+        # a caret escapes the line break, unmatched paren, pipe at start
+        lines = [
+            "echo a b", "echo x^", "echo y z", ")", "echo p q",
+            "|more", "(", "echo in block", ")", "echo done"
+        ]
+        text = "\n".join(lines * 20) + "\n"
+        expected = tokenize(text=text, ctx=Context(), lexer=Lexer.TABLE)
+        for parts in range(2, 12):
+            self.assertEqual(tokenize_parallel(
+                text=text, ctx=Context(), workers=2, parts=parts
+            ), expected)
+
+    def test_split_points(self):
+        from butch.parallel import split_text
+
+        text = "echo a\n(\necho b c\necho d e\n)\necho f g\necho h\n"
+        spans = split_text(text=text, parts=2)
+        # not in the block, after a line the word flag is known for
+        self.assertEqual(spans, [
+            (0, text.index("echo h"), None),
+            (text.index("echo h"), len(text), True)
+        ])
+
+    def test_threshold(self):
+        from butch.context import Context
+        from butch.parallel import PARALLEL_ENV
+        from butch.tokenizer import tokenize, Lexer
+
+        text = "echo a b\necho c d\n" * 10
+        expected = tokenize(text=text, ctx=Context(), lexer=Lexer.TABLE)
+        for size, calls in (("", 0), (str(len(text) + 1), 0), ("10", 1)):
+            env = patch.dict(environ, {PARALLEL_ENV: size})
+            par = patch(
+                "butch.parallel.tokenize_parallel", return_value=expected
+            )
+            with env, par as tok:
+                tokenize(text=text, ctx=Context(), lexer=Lexer.TABLE)
+            self.assertEqual(tok.call_count, calls)
+
+
+if __name__ == "__main__":
+    main()
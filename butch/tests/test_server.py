@@ -0,0 +1,130 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+
+import os
+import socket
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Thread
+from unittest import main, TestCase, skipIf
+
+
+@skipIf(
+    not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"),
+    "Unix sockets and fork()"
+)
+class Server(TestCase):
+    def setUp(self):
+        from butch.server import create_server
+
+        self.folder = mkdtemp()
+        self.path = join(self.folder, "run", "butch.sock")
+        self.server = create_server(path=self.path)
+        self.thread = Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}
+        )
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+        rmtree(self.folder)
+
+    def _run(self, argv: list, stdin: bytes = b""):
+        from butch.client import connect, run
+
+        stdin_r, stdin_w = os.pipe()
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        os.write(stdin_w, stdin)
+        os.close(stdin_w)
+        try:
+            code = run(
+                sock=connect(path=self.path), argv=argv,
+                fds=(stdin_r, out_w, err_w)
+            )
+        finally:
+            for fdes in (stdin_r, out_w, err_w):
+                os.close(fdes)
+        with os.fdopen(out_r, "rb") as out, os.fdopen(err_r, "rb") as err:
+            return code, out.read().decode(), err.read().decode()
+
+    def test_private_socket(self):
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+        self.assertEqual(
+            os.stat(os.path.dirname(self.path)).st_mode & 0o777, 0o700
+        )
+
+    def test_untrusted_folder(self):
+        from butch.client import connect
+        from butch.server import create_server
+
+        folder = os.path.dirname(self.path)
+        # writable by others, anyone could listen there first
+        os.chmod(folder, 0o777)
+        try:
+            with self.assertRaises(PermissionError):
+                connect(path=self.path)
+            with self.assertRaises(PermissionError):
+                create_server(path=join(folder, "other.sock"))
+        finally:
+            os.chmod(folder, 0o700)
+
+        # a link to a private folder
+        link = join(self.folder, "link")
+        os.symlink(folder, link)
+        with self.assertRaises(PermissionError):
+            connect(path=join(link, "butch.sock"))
+        connect(path=self.path).close()
+
+    def test_already_running(self):
+        from butch.server import ServerRunning, create_server
+
+        with self.assertRaises(ServerRunning):
+            create_server(path=self.path)
+
+    def test_run(self):
+        code, out, err = self._run(argv=["/C", "echo hi & exit 3"])
+        self.assertEqual(code, 3)
+        self.assertEqual(out, "hi\n")
+        self.assertEqual(err, "")
+
+    def test_stdin(self):
+        code, out, _ = self._run(argv=[], stdin=b"echo piped\nexit 2\n")
+        self.assertEqual(code, 2)
+        self.assertEqual(out, "piped\n")
+
+    def test_isolated_runs(self):
+        cwd = os.getcwd()
+        self._run(argv=["/C", "set x=leaked & cd .."])
+        _, out, _ = self._run(argv=["/C", "set x"])
+        self.assertIn("not defined", out)
+        self.assertEqual(os.getcwd(), cwd)
+
+
+class Protocol(TestCase):
+    def test_request(self):
+        from butch.client import decode_request, encode_request
+
+        request = {
+            "argv": ["/C", "echo a=b"], "cwd": "/tmp",
+            "env": {"A": "1=2", "EMPTY": ""}
+        }
+        self.assertEqual(decode_request(encode_request(**request)), request)
+
+    def test_client_fallback(self):
+        from unittest.mock import patch
+        from butch.client import main as client_main
+
+        with patch("butch.client.connect", side_effect=OSError), \
+                patch("butch.__main__.main") as butch_main:
+            client_main(["/C", "echo"])
+        butch_main.assert_called_once_with(["/C", "echo"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-many-lines,too-many-locals
+
+from unittest import main, TestCase
+from unittest.mock import MagicMock
+
+
+class Variables(TestCase):
+    def test_case_insensitive(self):
+        from butch.variables import VariableStore
+
+        store = VariableStore(values={"Path": "a"})
+        self.assertEqual(store.get("PATH"), "a")
+        self.assertEqual(store["path"], "a")
+        self.assertIn("pAtH", store)
+        self.assertIsNone(store.get("missing"))
+
+        # the name keeps the case it was created with
+        store.set(name="PATH", value="b")
+        self.assertEqual(list(store.items()), [("Path", "b")])
+        self.assertEqual(len(store), 1)
+
+    def test_scopes(self):
+        from butch.variables import VariableStore
+
+        store = VariableStore(values={"a": "1", "c": "3"})
+        self.assertFalse(store.pop())
+        store.push()
+        store.set(name="A", value="2")
+        store.set(name="a", value="22")
+        store.set(name="b", value="x")
+        store.push()
+        store.set(name="b", value="y")
+        self.assertEqual(store.depth, 2)
+
+        version = store.version
+        self.assertTrue(store.pop())
+        self.assertGreater(store.version, version)
+        self.assertEqual(store.get("b"), "x")
+        self.assertTrue(store.pop())
+        self.assertEqual(list(store.items()), [("a", "1"), ("c", "3")])
+        self.assertEqual(store.prefixed("b"), [])
+        self.assertEqual(store.depth, 0)
+
+    def test_version(self):
+        from butch.variables import VariableStore
+
+        store = VariableStore()
+        other = VariableStore()
+        self.assertNotEqual(store.uid, other.uid)
+        version = store.version
+        store.set(name="x", value="1")
+        store.set(name="X", value="2")
+        self.assertEqual(store.version, version + 2)
+
+    def test_prefixed(self):
+        from butch.variables import VariableStore
+
+        store = VariableStore(values={
+            "prompt": "$P$G", "Path": "a", "pathext": ".BAT",
+            "temp": "/tmp", "p": "1"
+        })
+        self.assertEqual(store.prefixed(prefix="PA"), [
+            ("Path", "a"), ("pathext", ".BAT")
+        ])
+        self.assertEqual([name for name, _ in store.prefixed("p")], [
+            "p", "Path", "pathext", "prompt"
+        ])
+        self.assertEqual(store.prefixed(prefix="x"), [])
+        self.assertEqual(
+            list(store), ["p", "Path", "pathext", "prompt", "temp"]
+        )
+
+    def test_dynamic(self):
+        from butch.variables import VariableStore
+
+        getter = MagicMock(return_value="now")
+        store = VariableStore(dynamic={"Time": getter})
+        self.assertEqual(store.get_dynamic("TIME"), "now")
+        self.assertIsNone(store.get_dynamic("date"))
+        self.assertNotIn("time", store)
+
+    def test_context(self):
+        from butch.context import Context
+
+        ctx = Context()
+        ctx.set_variable(key="MyVar", value_to_set="value")
+        self.assertEqual(ctx.get_variable(key="MYVAR"), "value")
+
+        ctx.error_level = 3
+        self.assertEqual(ctx.get_variable(key="ErrorLevel"), "3")
+        ctx.extensions_enabled = False
+        self.assertIsNone(ctx.get_variable(key="errorlevel"))
+
+
+if __name__ == "__main__":
+    main()
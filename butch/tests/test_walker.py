@@ -0,0 +1,128 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-many-lines,too-many-locals
+
+from os import environ
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import main, TestCase
+from unittest.mock import patch
+
+
+def make_tree(folder):
+    from os import makedirs
+
+    for path in ("b/b2", "a/a1", "a/a2/deep", "c"):
+        makedirs(join(folder, path))
+    for path in ("top.txt", "a/x.txt", "a/a2/deep/y.txt", "c/z.txt"):
+        with open(join(folder, path), "w") as fdes:
+            fdes.write(path)
+
+
+class Walker(TestCase):
+    def test_workers(self):
+        from butch.walker import get_workers, WORKERS, WORKERS_ENV
+
+        with patch.dict(environ, {WORKERS_ENV: ""}):
+            self.assertEqual(get_workers(), WORKERS)
+        with patch.dict(environ, {WORKERS_ENV: "3"}):
+            self.assertEqual(get_workers(), 3)
+
+    def test_walk_flat(self):
+        from butch.walker import walk
+
+        with TemporaryDirectory() as folder:
+            make_tree(folder)
+            walked = list(walk(root=folder))
+            self.assertEqual(len(walked), 1)
+            root, entries = walked[0]
+            self.assertEqual(root, folder)
+            self.assertNotIsInstance(entries, list)
+            self.assertEqual(
+                sorted(entry.name for entry in entries),
+                ["a", "b", "c", "top.txt"]
+            )
+
+    def test_walk_recursive_order(self):
+        from butch.walker import walk
+
+        def sort(entries):
+            entries.sort(key=lambda entry: entry.name)
+
+        with TemporaryDirectory() as folder:
+            make_tree(folder)
+            for workers in (1, 4):
+                walked = [
+                    (path[len(folder):], [entry.name for entry in entries])
+                    for path, entries in walk(
+                        root=folder, recursive=True, sort=sort,
+                        workers=workers
+                    )
+                ]
+                self.assertEqual(walked, [
+                    ("", ["a", "b", "c", "top.txt"]),
+                    ("/a", ["a1", "a2", "x.txt"]),
+                    ("/a/a1", []),
+                    ("/a/a2", ["deep"]),
+                    ("/a/a2/deep", ["y.txt"]),
+                    ("/b", ["b2"]),
+                    ("/b/b2", []),
+                    ("/c", ["z.txt"])
+                ])
+
+    def test_walk_read_ahead(self):
+        from os import mkdir
+        from butch import walker
+
+        read = []
+        original = walker.read_folder
+
+        def read_folder(folder, *args):
+            read.append(folder)
+            return original(folder, *args)
+
+        with TemporaryDirectory() as folder:
+            for idx in range(20):
+                mkdir(join(folder, f"sub{idx}"))
+            make_tree(folder)
+            with patch("butch.walker.read_folder", side_effect=read_folder):
+                walked = walker.walk(root=folder, recursive=True, workers=1)
+                next(walked)
+                next(walked)
+                # root, the current folder and READ_AHEAD ones at most
+                self.assertLessEqual(len(read), 2 + walker.READ_AHEAD)
+                rest = list(walked)
+        self.assertEqual(len(rest) + 2, 20 + 8)
+
+    def test_walk_no_links(self):
+        from os import mkdir, symlink
+        from butch.walker import walk
+
+        with TemporaryDirectory() as folder:
+            mkdir(join(folder, "real"))
+            symlink(folder, join(folder, "real", "loop"))
+            walked = [
+                path for path, _ in walk(root=folder, recursive=True)
+            ]
+        self.assertEqual(walked, [folder, join(folder, "real")])
+
+    def test_entry_stat(self):
+        from os import scandir, symlink
+        from butch.walker import entry_stat, read_folder
+
+        with TemporaryDirectory() as folder:
+            symlink("missing", join(folder, "broken"))
+            with open(join(folder, "file"), "w") as fdes:
+                fdes.write("12345")
+            sizes = {
+                entry.name: entry_stat(entry).st_size
+                for entry in read_folder(folder=folder, with_stat=True)
+            }
+            self.assertEqual(sizes, {"broken": len("missing"), "file": 5})
+            self.assertEqual(read_folder(join(folder, "nope")), [])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# the value from locals will be removed, which is desired
+# pylint: disable=import-outside-toplevel
+# pylint: disable=missing-function-docstring,missing-class-docstring
+# pylint: disable=missing-module-docstring
+# pylint: disable=too-many-lines,too-many-locals
+
+from unittest import main, TestCase
+
+
+class Wildcard(TestCase):
+    def test_has_wildcards(self):
+        from butch.wildcard import has_wildcards
+
+        self.assertTrue(has_wildcards("*.tmp"))
+        self.assertTrue(has_wildcards("a?c"))
+        self.assertFalse(has_wildcards("folder/file.txt"))
+
+    def test_patterns(self):
+        from butch.wildcard import compile_pattern
+
+        cases = [
+            ("*", "anything", True),
+            ("*", ".", True),
+            ("*.*", "noext", True),
+            ("*.tmp", "A.TMP", True),
+            ("*.tmp", "a.tmpx", False),
+            ("*.tmp", "tmp", False),
+            ("a?c", "abc", True),
+            ("a?c", "ac", False),
+            ("name.*", "name", True),
+            ("name.*", "name.txt", True),
+            ("name.*", "names", False),
+            ("*.", "noext", True),
+            ("*.", "file.txt", False),
+            ("File.TXT", "file.txt", True),
+            ("file.txt", "file.txt.bak", False),
+            ("[a].txt", "[a].txt", True),
+            ("[a]*.txt", "a.txt", False)
+        ]
+        for pattern, name, expected in cases:
+            with self.subTest(pattern=pattern, name=name):
+                self.assertEqual(
+                    bool(compile_pattern(pattern)(name)), expected
+                )
+
+    def test_compiled_once(self):
+        from butch.wildcard import compile_pattern
+
+        self.assertIs(compile_pattern("*.log"), compile_pattern("*.log"))
+
+
+if __name__ == "__main__":
+    main()
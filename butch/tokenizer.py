@@ -3,14 +3,15 @@ Module holding all tokens and tokenizing functions for converting an inputted
 Batch code into a set of instructions for the interpreter to execute.
 """
 
+import re
 import sys
 from collections import defaultdict
 from enum import Enum, auto
 from os import environ
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Pattern
 
 from butch.context import Context
-from butch.commands import get_reverse_cmd_map
+from butch.commands import CMD_MAP, REVERSE_CMD_MAP
 from butch.commandtype import CommandType
 from butch.grammar import (
     SPECIAL_CR, SPECIAL_CARRET, SPECIAL_LPAREN, SPECIAL_RPAREN, SPECIAL_AMP,
@@ -19,13 +20,13 @@ from butch.grammar import (
 )
 from butch.counter import Count
 from butch.filmbuffer import FilmBuffer
+from butch.logger import emptyf
 from butch.charlist import CharList
 from butch.shared import Shared
 from butch.tokens import Argument, Block, File, Label, Token
 
-
-def emptyf(*_, **__):
-    "Empty function that does nothing."
+# Command's function which wasn't looked up yet, None is an unknown one
+UNRESOLVED = object()
 
 
 def clear_input(value: str) -> str:
@@ -49,28 +50,42 @@ class Flag(Enum):
 class Command(Token):
     "Token holding the raw value of a command and its properties."
 
-    _cmd: CommandType = None
-    _name: str = ""
-    _value: str = ""
-    _echo: bool = True
-    _args: list = None
+    __slots__ = ("_cmd", "_name", "_value", "_echo", "_args", "_func")
+
+    _cmd: CommandType
+    _name: str
+    _value: str
+    _echo: bool
+    _args: list
+    _func: Callable
 
     def __init__(
-            # pylint: disable=dangerous-default-value
-            self, cmd: CommandType, args: list = [],
+            self, cmd: CommandType, args: list = None,
             value: str = "", echo: bool = True
     ):
         self._cmd = cmd
         self._name = cmd.value
         self._value = value
-        self._args = args
+        # own list, the tokenizer appends to it
+        self._args = [] if args is None else args
         self._echo = echo
+        # resolved once on the first call, that imports the command
+        self._func = UNRESOLVED
 
     @property
     def cmd(self):
         "Property: CommandType value of the Command token."
         return self._cmd
 
+    @property
+    def func(self):
+        "Property: cmd_* function to call, None for unknown command."
+        func = self._func
+        if func is UNRESOLVED:
+            func = CMD_MAP.resolve(cmd=self._cmd, name=self._value)
+            self._func = func
+        return func
+
     @property
     def name(self):
         "Property: raw command name."
@@ -78,7 +93,7 @@ class Command(Token):
 
     @property
     def value(self):
-        "TODO: seems to be unused, perhaps just cmd.value -> name replacement."
+        "Property: raw name of an unknown (external) command."
         return self._value
 
     @property
@@ -95,6 +110,16 @@ class Command(Token):
         "Property: whether the command should be printed out."
         return self._echo
 
+    def __getstate__(self):
+        "Pickle without the function, it's resolved again when loading."
+        state = super().__getstate__()
+        state.pop("_func", None)
+        return state
+
+    def __setstate__(self, state: dict):
+        super().__setstate__(state)
+        self._func = UNRESOLVED
+
     def __repr__(self):
         prefix = "@" if not self.echo else ""
         return f'<{prefix}Command: "{self.name}" {self.args}>'
@@ -115,12 +140,39 @@ class Command(Token):
         return True
 
 
+def new_command(word: str, log=emptyf) -> Command:
+    """
+    Create a Command from the first word of a command line.
+
+    Args:
+        word (str): command name, "@" prefix turns off its echo
+        log (Callable): logging function
+
+    Returns:
+        Command, an unknown one keeps the name as its value
+    """
+    name = word.strip()
+    echo = True
+    if name.startswith("@"):
+        log("\t\t- echo off")
+        echo = False
+        name = name[1:]
+    log("\t- cmd string: %r", name)
+    cmd_type = REVERSE_CMD_MAP.get(name.lower(), CommandType.UNKNOWN)
+    return Command(
+        cmd=cmd_type, echo=echo,
+        value=name if cmd_type == CommandType.UNKNOWN else ""
+    )
+
+
 class Connector(Token):
     """Shouldn't be used directly, but ABC might be overkill."""
 
-    _name: str = ""
-    _left: Command = None
-    _right: Command = None
+    __slots__ = ("_name", "_left", "_right")
+
+    _name: str
+    _left: Command
+    _right: Command
 
     def __init__(self, name: str, left: Command, right: Command):
         self._name = name
@@ -164,6 +216,8 @@ class Connector(Token):
 class Concat(Connector):
     "Token holding the raw value of a concatenation and its properties."
 
+    __slots__ = ()
+
     def __init__(self, left: Command, right: Command = None):
         super().__init__("Concat", left=left, right=right)
 
@@ -171,6 +225,8 @@ class Concat(Connector):
 class Pipe(Connector):
     "Token holding the raw value of a pipe and its properties."
 
+    __slots__ = ()
+
     def __init__(self, left: Command, right: Command = None):
         super().__init__("Pipe", left=left, right=right)
 
@@ -184,8 +240,10 @@ class RedirType(Enum):
 class Redirection(Connector):
     "Token holding the raw value of a redirection and its properties."
 
+    __slots__ = ("_type", "_append")
+
     _type: RedirType
-    _append: bool = False
+    _append: bool
 
     def __init__(
             self, redir_type: RedirType,
@@ -275,12 +333,12 @@ def handle_char_quote(
 
         if found:
             log("\t\t- found command")
-            found.data.args = found.data.args + [
+            found.data.args.append(
                 Argument(
                     value=buff.data,
                     quoted=True and not flags[Flag.QUOTE_IN_WORD]
                 )
-            ]
+            )
             if text.nchar == SPECIAL_LF:
                 # keep to collect quoted but mangled
                 # "name="ignored -> 1 arg later unquoted in cmd func
@@ -288,7 +346,8 @@ def handle_char_quote(
                 log("\t\t- appending to output: %r", found.data)
                 output.append(found.data)
                 found.clear()
-            else:
+            elif text.nchar not in DELIM_WHITE:
+                # the rest of the word belongs to the quoted argument
                 flags[Flag.UNFINISHED_LINE] = True
         if text.nchar in DELIM_WHITE:
             log("\t- unwording, next char is white")
@@ -322,8 +381,9 @@ def handle_char_ordinary(
         flags[Flag.WORD] = True
 
     if splitnext:
-        log("\t- appending to output before splitting")
         flags[Flag.WORD] = False
+    if splitnext and flags.get(Flag.COLON_COMMENT):
+        log("\t- appending to output before splitting")
         output.append(found.data)
         found.clear()
     buff += text.char
@@ -343,7 +403,6 @@ def handle_char_newline(
     # if not flags[Flag.ESCAPE]:
     flags[Flag.QUOTE] = False
     flags[Flag.COLON_COMMENT] = False
-    cmd_map = get_reverse_cmd_map()
 
     if flags[Flag.ESCAPE]:
         log("\t- is in escape mode")
@@ -356,27 +415,18 @@ def handle_char_newline(
     if pos.value == text.last_pos and buff:  # buff check for whitespace
         log("\t\t- last char")
         if not found:
-            if flags[Flag.COLON_LABEL]:
+            if _redirected(output=output, block=block):
+                log("\t\t- target of redirection %r", buff)
+                found.set(File(value=buff.data))
+            elif flags[Flag.COLON_LABEL]:
                 flags[Flag.COLON_LABEL] = False
                 log("\t\t- label for goto %r", buff)
                 found.set(Label(value=buff.data))
             else:
-                cmd_clear = buff.data.strip().lower()
-                echo = True
-                if cmd_clear.startswith("@"):
-                    log("\t\t- echo off")
-                    echo = False
-                    cmd_clear = cmd_clear[1:]
-                log("\t- cmd string: %r", cmd_clear)
-                cmd_to_set = Command(
-                    cmd=cmd_map.get(cmd_clear, CommandType.UNKNOWN), echo=echo
-                )
-                found.set(cmd_to_set)
+                found.set(new_command(word=buff.data, log=log))
             buff.clear()
-        if buff:
-            found.data.args = found.data.args + [
-                Argument(value=buff.data)
-            ]
+        if buff and not isinstance(found.data, File):
+            found.data.args.append(Argument(value=buff.data))
         buff.clear()
         if not output:
             log("\t\t- appending to output: %r", found.data)
@@ -409,9 +459,7 @@ def handle_char_newline(
                     found.set(File())
                 else:
                     if buff.data:
-                        block[-1].args = block[-1].args + [
-                            Argument(value=buff.data)
-                        ]
+                        block[-1].args.append(Argument(value=buff.data))
             else:
                 # naive
                 if flags[Flag.COLON_LABEL]:
@@ -419,15 +467,7 @@ def handle_char_newline(
                     log("\t\t- label for goto %r", buff)
                     found.set(Label(value=buff.data))
                 else:
-                    cmd_clear = buff.data.strip().lower()
-                    echo = True
-                    if cmd_clear.startswith("@"):
-                        log("\t\t- echo off")
-                        echo = False
-                        cmd_clear = cmd_clear[1:]
-                    log("\t- cmd string: %r", cmd_clear)
-                    cmd_type = cmd_map.get(cmd_clear, CommandType.UNKNOWN)
-                    found.set(Command(cmd=cmd_type, echo=echo))
+                    found.set(new_command(word=buff.data, log=log))
                 buff.clear()
 
         if flags[Flag.UNFINISHED_LINE]:
@@ -443,9 +483,7 @@ def handle_char_newline(
             if not isinstance(found.data, File):
                 log("\t\t\t\t- setting args %r", buff.data)
                 if buff.data and found:
-                    found.data.args = found.data.args + [
-                        Argument(value=buff.data)
-                    ]
+                    found.data.args.append(Argument(value=buff.data))
             else:
                 found.data.value = buff.data
 
@@ -510,21 +548,11 @@ def handle_char_whitespace(
         next(pos)
         return
 
-    cmd_map = get_reverse_cmd_map()
     if not found and buff:
         log("\t- not found command")
 
         # naive
-        cmd_clear = buff.data.strip().lower()
-        echo = True
-        if cmd_clear.startswith("@"):
-            log("\t\t- echo off")
-            echo = False
-            cmd_clear = cmd_clear[1:]
-        log("\t- cmd string: %r", cmd_clear)
-        cmd_to_set = Command(
-            cmd=cmd_map.get(cmd_clear, CommandType.UNKNOWN), echo=echo
-        )
+        cmd_to_set = new_command(word=buff.data, log=log)
         if compound > 0:
             block.append(cmd_to_set)
         else:
@@ -534,16 +562,37 @@ def handle_char_whitespace(
         log("\t- found command")
         if not flags[Flag.QUOTE]:
             log("\t\t- not in quote mode")
-            if buff:
+            if buff and flags.get(Flag.UNFINISHED_LINE):
+                log("\t\t\t- finishing quoted arg %r", buff.data)
+                last = found.data.args[-1]
+                last.value = last.value + buff.data
+                buff.clear()
+                flags[Flag.UNFINISHED_LINE] = False
+            elif buff:
                 log("\t\t\t- appending buff to args %r", buff.data)
-                found.data.args = found.data.args + [
-                    Argument(value=buff.data)
-                ]
+                found.data.args.append(Argument(value=buff.data))
                 buff.clear()
     flags[Flag.WORD] = False
     next(pos)
 
 
+def _flush_word(buff: CharList, found: Shared, log=emptyf) -> None:
+    """
+    Store the buffered word as an argument or a new command.
+
+    Args:
+        buff (CharList): buffered word
+        found (Shared): the command being assembled
+        log (Callable): logging function
+    """
+    if found:
+        log("\t- appending buff to args %r", buff.data)
+        found.data.args.append(Argument(value=buff.data))
+    else:
+        found.set(new_command(word=buff.data, log=log))
+    buff.clear()
+
+
 def handle_char_splitter(
         pos: Count, text: FilmBuffer, buff: CharList,
         output: list, found: Shared, block: list, log=emptyf
@@ -551,12 +600,22 @@ def handle_char_splitter(
     "Handle a command splitting character while parsing an input line."
     # pylint: disable=too-many-arguments
     log("- is splitter")
+    if buff:
+        # a word right before the splitter, e.g. "set /p var=<file"
+        _flush_word(buff=buff, found=found, log=log)
     last = None
     if block:
         last = block[-1]
     elif output:
         last = output[-1]
-    if last and not isinstance(last, Command):
+    # a finished connector followed by a command is from a previous line
+    fresh = bool(
+        found and isinstance(last, Connector) and last.right is not None
+    )
+    if fresh:
+        log("\t- new command after a connector: %r", found)
+        last = found.data
+    elif last and not isinstance(last, Command):
         log("\t- left isn't command, assuming splitter")
         log("\t- assuming argument leftovers in buffer")
 
@@ -568,10 +627,11 @@ def handle_char_splitter(
         #   \          \(R)---2
         #    \
         #     \(R)------------3
+        if found and isinstance(last, Connector) and not last.right:
+            log("\t- attaching found command as right: %r", found)
+            last.right = found.data
         if buff:
-            last.right.args = last.right.args + [
-                Argument(value=buff.data)
-            ]
+            last.right.args.append(Argument(value=buff.data))
     elif found:
         # command not yet added, assembling now
         log("\t- found_command: %r", found)
@@ -612,7 +672,10 @@ def handle_char_splitter(
     # the last command is now encapsulated in a connector
     # the newest command is stored in the "right" branch
     log("\t- check output: %r", output)
-    if block and isinstance(block[-1], Command):
+    if fresh:
+        log("\t- creating new item after connector: %r", join)
+        (block or output).append(join)
+    elif block and isinstance(block[-1], Command):
         log("\t- attaching command to connector in block")
         block[-1] = join
     elif output and isinstance(output[-1], Connector):
@@ -625,6 +688,24 @@ def handle_char_splitter(
     next(pos)
 
 
+def _redirected(output: list, block: list) -> bool:
+    """
+    Check the last token waits for the target of a redirection.
+
+    Args:
+        output (list): tokens of the input
+        block (list): tokens of the unfinished block
+
+    Returns:
+        True if the last token is a Redirection without a target
+    """
+    tokens = block or output
+    if not tokens:
+        return False
+    last = tokens[-1]
+    return isinstance(last, Redirection) and not last.right
+
+
 def handle_char_last(
         pos: Count, flags: dict, text: FilmBuffer,
         buff: CharList, output: list, found: Shared, block: list,
@@ -659,25 +740,16 @@ def handle_char_last(
         log("\t- not found command, zero idx")
         found.set(Command(cmd=CommandType.UNKNOWN))
 
-    cmd_map = get_reverse_cmd_map()
     if pos.value == text.last_pos and buff:  # buff check for whitespace
+        if _redirected(output=output, block=block):
+            log("\t- target of redirection %r", buff)
+            found.set(File(value=buff.data))
+            buff.clear()
         if not found:
-            cmd_clear = buff.data.strip().lower()
-            echo = True
-            if cmd_clear.startswith("@"):
-                log("\t- echo off")
-                echo = False
-                cmd_clear = cmd_clear[1:]
-            log("\t- cmd string: %r", cmd_clear)
-            found.set(Command(
-                cmd=cmd_map.get(cmd_clear, CommandType.UNKNOWN),
-                echo=echo
-            ))
+            found.set(new_command(word=buff.data, log=log))
             buff.clear()
         if buff:
-            found.data.args = found.data.args + [
-                Argument(value=buff.data)
-            ]
+            found.data.args.append(Argument(value=buff.data))
         buff.clear()
         if not output:
             log("\t- appending to output: %r", found.data)
@@ -707,9 +779,7 @@ def handle_char_last(
             )
             flags[Flag.UNFINISHED_LINE] = False
         else:
-            found.data.args = found.data.args + [
-                Argument(value=buff.data)
-            ]
+            found.data.args.append(Argument(value=buff.data))
 
             if not output:
                 log("\t\t- appending to output: %r", found.data)
@@ -753,9 +823,11 @@ def handle_char_colon(
     next(pos)
 
 
-def tokenize(text: str, ctx: Context, debug: bool = False) -> list:
-    "Convert Batch as text input into tokens."
-    log = ctx.log.debug
+def _tokenize_film(text: str, ctx: Context, debug: bool = False) -> list:
+    "Convert Batch as text input into tokens char by char."
+    # checked once, handlers get a no-op instead of a logger call
+    trace = ctx.trace
+    log = ctx.log.debug if trace else emptyf
     log("Starting tokenization")
     output = []
 
@@ -774,15 +846,16 @@ def tokenize(text: str, ctx: Context, debug: bool = False) -> list:
     while idx.value < len(text):
         text.move(idx.value)
         char = text.char
-        log(
-            "Position: (end=%04d, idx=%04d, char=%r)",
-            last_pos, idx.value, char
-        )
-        log("- flags: %r", flags)
-        log("- buff: %r", buff)
-        log("- block: %r", block)
-        log("- found: %r", found_command)
-        log("- out: %r", output)
+        if trace:
+            log(
+                "Position: (end=%04d, idx=%04d, char=%r)",
+                last_pos, idx.value, char
+            )
+            log("- flags: %r", flags)
+            log("- buff: %r", buff)
+            log("- block: %r", block)
+            log("- found: %r", found_command)
+            log("- out: %r", output)
 
         # last char isn't <LF>
         if char != SPECIAL_LF and idx == last_pos:
@@ -844,6 +917,11 @@ def tokenize(text: str, ctx: Context, debug: bool = False) -> list:
 
     if debug:
         return list(flags.items())
+    return _finish(output=output, log=log)
+
+
+def _finish(output: list, log=emptyf) -> list:
+    "Run the debugging hooks on the tokenized output and return it."
     log("- tokenized output: %r", output)
     if "DEBUG_TOKENIZE" in environ:
         from pprint import pprint
@@ -858,3 +936,521 @@ def tokenize(text: str, ctx: Context, debug: bool = False) -> list:
         with open(environ["DEBUG_TOKENIZE_PICKLE"], "wb") as pickled:
             pickle.dump(output, pickled)
     return output
+
+
+class TableLexer:  # noqa: WPS214
+    """
+    Tokenizer jumping from one special character to another.
+
+    Shares the state machine (``handle_char_*``) with the char-by-char
+    tokenizer, but a run of ordinary characters or whitespace is consumed
+    at once instead of calling a handler for every single character.
+
+    The code can be fed in chunks, finished top-level tokens are returned
+    as soon as the next one starts, so a script can run while being read.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    _text: str
+    _film: FilmBuffer
+    _last_pos: int
+    _pos: Count
+    _flags: dict
+    _compound: Count
+    _buff: CharList
+    _found: Shared
+    _block: list
+    _output: list
+    _trace: bool
+    _log: Any
+
+    def __init__(self, ctx: Context):
+        """
+        Initialize TableLexer instance.
+
+        Args:
+            ctx (Context): Context instance
+        """
+        self._text = ""
+        self._pos = Count(writable=True)
+        self._flags = defaultdict(bool)
+        self._compound = Count()
+        self._buff = CharList()
+        self._found = Shared()
+        self._block = []
+        self._output = []
+        self._trace = ctx.trace
+        self._log = ctx.log.debug if self._trace else emptyf
+
+    @property
+    def flags(self):
+        """
+        Get the tokenizer flags.
+
+        Returns:
+            dict of Flag and boolean pairs
+        """
+        return self._flags
+
+    def feed(self, chunk: str) -> list:
+        """
+        Tokenize the next chunk of code as far as it's possible.
+
+        The last char waits for the next chunk or close() because
+        the handlers look at the following char.
+
+        Args:
+            chunk (str): Batch code continuing the previous chunk
+
+        Returns:
+            list of finished top-level tokens
+        """
+        # drop the consumed text, but keep the previous char for the handlers
+        pos = self._pos
+        keep = max(pos.value - 1, 0)
+        # replace 0x1A with LF
+        self._text = self._text[keep:] + chunk.replace("\x1a", "\n")
+        pos.value -= keep
+        return self._consume(eof=False)
+
+    def close(self) -> list:
+        """
+        Tokenize the rest of the code at the end of input.
+
+        Returns:
+            list of the remaining tokens
+        """
+        return self._consume(eof=True)
+
+    def save(self) -> dict:
+        """
+        Get the state carried over to the code after the fed one.
+
+        Returns:
+            dict with the flags, the unfinished parts, the last (unfinished)
+            token in a list if any and the text fed, but not tokenized yet
+        """
+        output = self._output
+        return {
+            "flags": dict(self._flags),
+            "compound": self._compound.value,
+            "buff": self._buff.data,
+            "found": self._found.data,
+            # the same list, the tokens can refer to it
+            "block": self._block,
+            "tail": output[-1:],
+            "rest": self._text[self._pos.value:]
+        }
+
+    def restore(self, state: dict, prefix: str) -> None:
+        """
+        Continue tokenizing from a state saved by another lexer.
+
+        Args:
+            state (dict): state from save(), its rest is ignored
+            prefix (str): the char preceding the code to be fed
+        """
+        self._text = prefix
+        self._pos.value = len(prefix)
+        self._flags = defaultdict(bool, state["flags"])
+        self._compound = Count(start=state["compound"])
+        self._buff = CharList(data=state["buff"])
+        self._found = Shared(data=state["found"])
+        self._block = state["block"]
+        self._output = list(state["tail"])
+
+    def _consume(self, eof: bool) -> list:
+        """
+        Tokenize the buffered text up to the last char or to its end.
+
+        Args:
+            eof (bool): no more text will come
+
+        Returns:
+            list of finished top-level tokens
+        """
+        text = self._text
+        text_len = len(text)
+        last_pos = text_len - 1
+        stop = text_len if eof else last_pos
+        self._film = FilmBuffer(data=text)
+        self._last_pos = last_pos
+        pos = self._pos
+        flags = self._flags
+        trace = self._trace
+        log = self._log
+        log("Starting table tokenization")
+        if pos.value == 0:
+            self._plain_lines()
+
+        while pos.value < stop:
+            idx = pos.value
+            char = text[idx]
+
+            # last char isn't <LF>
+            if char != SPECIAL_LF and idx == last_pos:
+                self._film.move(idx)
+                handle_char_last(
+                    pos=pos, flags=flags, text=self._film, buff=self._buff,
+                    output=self._output, found=self._found, log=log,
+                    block=self._block, compound=self._compound
+                )
+                break
+
+            # read the flag only where the char by char tokenizer does,
+            # so that the flags (with debug=True) stay the same
+            if char in _COMMENT_AWARE:
+                comment = flags[Flag.COLON_COMMENT]
+            else:
+                comment = flags.get(Flag.COLON_COMMENT)
+            if comment:
+                handler = self._comment_table.get(char)
+            else:
+                handler = self._code_table.get(char)
+
+            if handler is None:
+                self._handle_run(start=idx, comment=comment)
+                continue
+
+            if trace:
+                log(
+                    "Position: (end=%04d, idx=%04d, char=%r)",
+                    last_pos, idx, char
+                )
+            self._film.move(idx)
+            handler(self)
+
+        # handlers modify only the last token, the others are finished
+        output = self._output
+        if eof:
+            self._output = []
+            return output
+        finished = output[:-1]
+        del output[:-1]
+        return finished
+
+    def _handle_run(self, start: int, comment: bool) -> None:
+        "Consume ordinary characters up to the next special one."
+        text = self._text
+        flags = self._flags
+        breaks = _BREAKS_COMMENT if comment else _BREAKS_CODE
+        found = breaks.search(text, start + 1, self._last_pos)
+        end = found.start() if found else self._last_pos
+
+        # the word flag depends only on the first char of the run
+        # because the previous char of the others is never a whitespace
+        if start == 0:
+            flags[Flag.WORD] = True
+        elif text[start - 1] in DELIM_WHITE:
+            splitnext = text[start + 1] in SPECIAL_SPLITTERS
+            if not splitnext and not flags[Flag.QUOTE]:
+                flags[Flag.WORD] = True
+
+        # a char followed by a splitter flushes the found command,
+        # only the last char of a run can be followed by it in code
+        # in comment splitters are ordinary chars, so look inside the run
+        splits = 0
+        if comment:
+            splits = len(_SPLITTERS.findall(text, start + 1, end + 1))
+        elif text[end] in SPECIAL_SPLITTERS:
+            # the splitter takes the word from the buffer
+            flags[Flag.WORD] = False
+        output = self._output
+        for _ in range(splits):
+            flags[Flag.WORD] = False
+            output.append(self._found.data)
+            self._found.clear()
+
+        if self._trace:
+            self._log("- plain run: %r", text[start:end])
+        self._buff += text[start:end]
+        self._pos.value = end
+
+    def _on_cr(self):
+        handle_char_cr(pos=self._pos, log=self._log)
+
+    def _on_carret(self):
+        handle_char_carret(pos=self._pos, flags=self._flags, log=self._log)
+
+    def _on_quote(self):
+        handle_char_quote(
+            pos=self._pos, flags=self._flags,
+            text=self._film, buff=self._buff, output=self._output,
+            found=self._found, log=self._log
+        )
+
+    def _on_newline(self):
+        handle_char_newline(
+            pos=self._pos, flags=self._flags,
+            text=self._film, buff=self._buff, output=self._output,
+            block=self._block, found=self._found, compound=self._compound,
+            log=self._log
+        )
+        self._plain_lines()
+
+    def _plain_lines(self) -> None:
+        """
+        Tokenize plain lines directly, without the state machine.
+
+        A plain line has no quotes, carets, connectors, parentheses
+        or colons and it's split just by whitespace to the Command and its
+        Arguments, the same as the char handlers would do it.
+        """
+        flags = self._flags
+        pos = self._pos
+        text = self._text
+        output = self._output
+        plain = _PLAIN_LINE.match
+        while True:
+            # state after LF with nothing carried to the next line
+            if self._found or self._buff or self._block:
+                return
+            if self._compound.value > 0 or flags.get(Flag.ESCAPE):
+                return
+            if flags.get(Flag.UNFINISHED_LINE):
+                return
+            if flags.get(Flag.COLON_LABEL):
+                return
+
+            # the LF can't be the last char, that one is handled differently
+            start = pos.value
+            found = plain(text, start, self._last_pos)
+            if not found:
+                return
+            line = found.group().rstrip("\r\n")
+            words = _WORDS.findall(line)
+            if not words:
+                return
+            trailing = line[-1] in DELIM_WHITE
+            if len(words) == 1 and not trailing and output:
+                # a single word after redirection is its target file
+                if isinstance(output[-1], Redirection):
+                    return
+
+            if self._trace:
+                self._log("- plain line: %r", line)
+            self._plain_line(
+                words=words, trailing=trailing,
+                white=len(line) != len(words[0]), first=start == 0
+            )
+            pos.value = found.end()
+
+    def _plain_line(
+            self, words: list, trailing: bool, white: bool, first: bool
+    ) -> None:
+        """
+        Append a Command for a plain line and set the flags like handlers.
+
+        Args:
+            words (list): whitespace separated words of the line
+            trailing (bool): the line ends with a whitespace
+            white (bool): the line has any whitespace
+            first (bool): the line starts at the beginning of the input
+        """
+        flags = self._flags
+        output = self._output
+
+        # the last whitespace or the first char after it wins
+        if trailing:
+            flags[Flag.WORD] = False
+        elif white or first:
+            flags[Flag.WORD] = True
+
+        command = new_command(word=words[0])
+        command.args = [Argument(value=word) for word in words[1:]]
+
+        # flags touched by <LF> handler, read ones only keep their keys
+        flags[Flag.QUOTE] = False
+        flags[Flag.COLON_COMMENT] = False
+        flags.setdefault(Flag.ESCAPE, False)
+        if trailing:
+            # <LF> with empty buffer appends as is
+            output.append(command)
+            return
+
+        if len(words) == 1:
+            flags.setdefault(Flag.COLON_LABEL, False)
+        flags[Flag.UNFINISHED_LINE] = False
+        if output:
+            last = output[-1]
+            if isinstance(last, Connector) and not last.right:
+                last.right = command
+                return
+        output.append(command)
+
+    def _on_splitter(self):
+        handle_char_splitter(
+            pos=self._pos, text=self._film, buff=self._buff,
+            output=self._output, found=self._found, block=self._block,
+            log=self._log
+        )
+
+    def _on_lparen(self):
+        self._log("- is left-paren")
+        next(self._compound)
+        next(self._pos)
+
+    def _on_rparen(self):
+        self._log("- is right-paren")
+        self._output.append(Block(values=self._block))
+        self._block = []
+        self._flags[Flag.WORD] = False
+        reversed(self._compound)
+        next(self._pos)
+
+    def _on_whitespace(self):
+        start = self._pos.value
+        handle_char_whitespace(
+            pos=self._pos, flags=self._flags, text=self._film,
+            buff=self._buff, found=self._found, log=self._log,
+            block=self._block, compound=self._compound
+        )
+
+        # the rest of whitespace run is either quoted or a no-op
+        text = self._text
+        found = _WHITESPACE.match(text, start, self._last_pos)
+        end = found.end()
+        if end - start > 1:
+            if self._flags[Flag.QUOTE]:
+                self._buff += text[start + 1:end]
+            self._pos.value = end
+
+    def _on_colon(self):
+        handle_char_colon(
+            pos=self._pos, flags=self._flags, text=self._film,
+            buff=self._buff, found=self._found, log=self._log
+        )
+
+    _comment_table = {
+        SPECIAL_CR: _on_cr,
+        SPECIAL_CARRET: _on_carret,
+        QUOTE_DOUBLE: _on_quote,
+        SPECIAL_LF: _on_newline,
+        **dict.fromkeys(DELIM_WHITE, _on_whitespace)
+    }
+    _code_table = {
+        **_comment_table,
+        **dict.fromkeys(SPECIAL_SPLITTERS, _on_splitter),
+        SPECIAL_LPAREN: _on_lparen,
+        SPECIAL_RPAREN: _on_rparen,
+        SPECIAL_COLON: _on_colon
+    }
+
+
+def _char_class(chars) -> Pattern:
+    "Compile a regex matching any of the chars."
+    return re.compile("[{0}]".format(re.escape("".join(sorted(chars)))))
+
+
+_BREAKS_COMMENT = _char_class(TableLexer._comment_table)
+_BREAKS_CODE = _char_class(TableLexer._code_table)
+_SPLITTERS = _char_class(SPECIAL_SPLITTERS)
+_COMMENT_AWARE = frozenset(TableLexer._code_table).difference(
+    TableLexer._comment_table
+)
+_WHITESPACE = re.compile("{0}+".format(_char_class(DELIM_WHITE).pattern))
+_WORDS = re.compile("[^{0}]+".format(
+    re.escape("".join(sorted(DELIM_WHITE)))
+))
+_PLAIN_LINE = re.compile(r"[^{0}]*\r?\n".format(re.escape("".join(sorted(
+    frozenset(TableLexer._code_table).difference(DELIM_WHITE)
+)))))
+
+
+def _tokenize_table(text: str, ctx: Context, debug: bool = False) -> list:
+    "Convert Batch as text input into tokens special char by special char."
+    log = ctx.log.debug if ctx.trace else emptyf
+    if not debug and _parallel(size=len(text), ctx=ctx):
+        from butch.parallel import tokenize_parallel
+        return _finish(output=tokenize_parallel(text=text, ctx=ctx), log=log)
+
+    lexer = TableLexer(ctx=ctx)
+    output = lexer.feed(text)
+    output.extend(lexer.close())
+    if debug:
+        return list(lexer.flags.items())
+    return _finish(output=output, log=log)
+
+
+def _parallel(size: int, ctx: Context) -> bool:
+    "Check the code is big enough to be tokenized in multiple processes."
+    if ctx.trace or not size:
+        return False
+    # imported here, the module depends on this one
+    from butch.parallel import get_parallel_size
+    limit = get_parallel_size()
+    return bool(limit) and size >= limit
+
+
+class Lexer(Enum):
+    "Enum of tokenizer engines selectable via BUTCH_LEXER variable."
+    TABLE = "table"
+    FILM = "film"
+
+
+LEXER_ENV = "BUTCH_LEXER"
+LEXERS = {
+    Lexer.TABLE: _tokenize_table,
+    Lexer.FILM: _tokenize_film
+}
+
+
+def tokenize(
+        text: str, ctx: Context, debug: bool = False, lexer: Lexer = None
+) -> list:
+    """
+    Convert Batch as text input into tokens.
+
+    Args:
+        text (str): Batch code
+        ctx (Context): Context instance
+        debug (bool): return tokenizer flags instead of tokens
+        lexer (Lexer): engine to use, defaults to BUTCH_LEXER or table
+            (film when tracing for the per-char trace)
+
+    Returns:
+        list of tokens
+    """
+    if lexer is None:
+        lexer = _default_lexer(ctx=ctx)
+    return LEXERS[lexer](text=text, ctx=ctx, debug=debug)
+
+
+def iter_tokenize(
+        chunks: Iterable[str], ctx: Context, lexer: Lexer = None,
+        size: int = 0
+) -> Iterator[Token]:
+    """
+    Convert Batch code coming in chunks into tokens while reading it.
+
+    Code of at least BUTCH_PARALLEL_SIZE is read whole and tokenized
+    in multiple processes instead.
+
+    Args:
+        chunks (Iterable[str]): consecutive parts of Batch code
+        ctx (Context): Context instance
+        lexer (Lexer): engine to use, same as for tokenize()
+        size (int): expected size of the whole code if known
+
+    Yields:
+        top-level tokens as soon as they are finished
+    """
+    if lexer is None:
+        lexer = _default_lexer(ctx=ctx)
+    if lexer != Lexer.TABLE or _parallel(size=size, ctx=ctx):
+        # the film tokenizer can't continue and the parallel one splits
+        # the whole text, both need all of it
+        yield from tokenize(text="".join(chunks), ctx=ctx, lexer=lexer)
+        return
+
+    table = TableLexer(ctx=ctx)
+    for chunk in chunks:
+        yield from table.feed(chunk)
+    yield from table.close()
+
+
+def _default_lexer(ctx: Context) -> Lexer:
+    "Get the lexer from BUTCH_LEXER or table (film when tracing)."
+    default = Lexer.FILM if ctx.trace else Lexer.TABLE
+    return Lexer(environ.get(LEXER_ENV, default.value))
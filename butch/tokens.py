@@ -4,12 +4,42 @@ from typing import Any
 
 
 class Token:
-    pass
+    """Base for all tokens, slotted to keep the instructions compact."""
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        """
+        Get the slot values for pickling.
+
+        Returns:
+            dict of slot names and values
+        """
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict):
+        """
+        Set the slot values after unpickling.
+
+        Accepts a dict from a token pickled with __dict__ too.
+
+        Args:
+            state (dict): slot names and values
+        """
+        for name, value in state.items():  # noqa: WPS110
+            setattr(self, name, value)
 
 
 class BaseValue(Token):
     """Base for a token holding the raw value with repr() and == operator."""
 
+    __slots__ = ("_value", )
+
     _value: str  # noqa: WPS110
 
     def __init__(self, value: str):  # noqa: WPS110
@@ -62,7 +92,11 @@ class BaseValue(Token):
 class Argument(BaseValue):
     """Token holding the raw value of an argument and its properties."""
 
+    __slots__ = ("_quoted", "_template", "_expanded")
+
     _quoted: bool
+    _template: Any
+    _expanded: Any
 
     def __init__(self, value: str, quoted: bool = False):  # noqa: WPS110
         """
@@ -74,6 +108,24 @@ class Argument(BaseValue):
         """
         super().__init__(value=value)
         self._quoted = quoted
+        self._template = None
+        self._expanded = None
+
+    @property
+    def value(self):  # noqa: WPS110
+        """
+        Raw value.
+
+        Returns:
+            whatever was stored
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value):  # noqa: WPS110
+        self._value = value  # noqa: WPS110
+        self._template = None
+        self._expanded = None
 
     @property
     def quoted(self):
@@ -85,6 +137,47 @@ class Argument(BaseValue):
         """
         return self._quoted
 
+    @property
+    def template(self):
+        """
+        Get the value compiled for the expansion, None until compiled.
+
+        Returns:
+            tuple of segments from expansion.compile_percent()
+            or the string if there's nothing to expand
+        """
+        # missing in an Argument pickled before the slot existed
+        return getattr(self, "_template", None)
+
+    @template.setter
+    def template(self, template):
+        self._template = template
+
+    @property
+    def expanded(self):
+        """
+        Get the last expansion with the variables it was computed from.
+
+        Returns:
+            tuple of the store id, its version and the value or None
+        """
+        return getattr(self, "_expanded", None)
+
+    @expanded.setter
+    def expanded(self, expanded):
+        self._expanded = expanded
+
+    def __getstate__(self):
+        """
+        Get the slot values for pickling without the last expansion.
+
+        Returns:
+            dict of slot names and values
+        """
+        state = super().__getstate__()
+        state.pop("_expanded", None)
+        return state
+
     def __repr__(self):
         """
         Get a string representation of Argument instance.
@@ -102,6 +195,8 @@ class Argument(BaseValue):
 class File(BaseValue):
     "Token holding the raw value of filename for redirection."
 
+    __slots__ = ()
+
     def __init__(self, value: str = ""):  # noqa: WPS110
         """
         Initialize File instance.
@@ -115,10 +210,14 @@ class File(BaseValue):
 class Label(BaseValue):
     "Token holding the raw value of label for a GOTO command."
 
+    __slots__ = ()
+
 
 class Block(Token):
     """Block of commands to execute in specific order."""
 
+    __slots__ = ("_values", )
+
     _values: list  # noqa: WPS110
 
     def __init__(self, values: list):  # noqa: WPS110
@@ -0,0 +1,270 @@
+"""Module for storing the environment variables of a Context."""
+
+from bisect import bisect_left, insort
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+_STORE_IDS = count()
+
+
+def fold(name: str) -> str:
+    """
+    Normalize a variable name, the names ignore the case.
+
+    Args:
+        name (str): variable name
+
+    Returns:
+        normalized name
+    """
+    return name.casefold()
+
+
+class VariableStore:
+    """
+    Variables with case-insensitive names.
+
+    The names keep the case they were created with. The normalized names
+    are kept sorted as well for listing the variables with a prefix.
+    Every change increments the version, so that a value computed from
+    the variables can be reused while the version and the store id stay
+    the same. Dynamic variables are computed by their getters on access.
+
+    A scope records only the first change of each variable made while it's
+    the innermost one, so that both opening and closing it costs as much as
+    the number of changed variables, not the number of all variables.
+    """
+
+    _values: Dict[str, Tuple[str, Any]]
+    _scopes: List[Dict[str, Optional[Tuple[str, Any]]]]
+    _sorted: List[str]
+    _dynamic: Dict[str, Callable[[], str]]
+    _version: int
+    _uid: int
+
+    def __init__(
+            self, values: dict = None,
+            dynamic: Dict[str, Callable[[], str]] = None
+    ):
+        """
+        Initialize VariableStore instance.
+
+        Args:
+            values (dict): initial variables
+            dynamic (dict): names of dynamic variables and their getters
+        """
+        self._values = {}
+        self._sorted = []
+        self._scopes = []
+        self._dynamic = {
+            fold(name): getter for name, getter in (dynamic or {}).items()
+        }
+        self._version = 0
+        self._uid = next(_STORE_IDS)
+        for name, value in (values or {}).items():  # noqa: WPS110
+            self.set(name=name, value=value)
+
+    def __repr__(self):
+        """
+        Get a string representation of the variables.
+
+        Returns:
+            dict-like string
+        """
+        return repr(dict(self.items()))
+
+    def __len__(self):
+        """
+        Get the number of stored variables.
+
+        Returns:
+            int
+        """
+        return len(self._values)
+
+    def __contains__(self, name: str):
+        """
+        Check a variable is stored.
+
+        Args:
+            name (str): variable name in any case
+
+        Returns:
+            bool
+        """
+        return fold(name) in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the names sorted without the case.
+
+        Yields:
+            variable names as created
+        """
+        for key in self._sorted:
+            yield self._values[key][0]
+
+    def __getitem__(self, name: str):
+        """
+        Get a value of a variable.
+
+        Args:
+            name (str): variable name in any case
+
+        Returns:
+            stored value
+
+        Raises:
+            KeyError: when the variable isn't stored
+        """
+        return self._values[fold(name)][1]
+
+    @property
+    def version(self):
+        """
+        Get the number of changes made to the variables.
+
+        Returns:
+            int
+        """
+        return self._version
+
+    @property
+    def uid(self):
+        """
+        Get a number unique for this store in the process.
+
+        Returns:
+            int
+        """
+        return self._uid
+
+    @property
+    def dynamic(self):
+        """
+        Get the dynamic variables.
+
+        Returns:
+            dict of normalized names and getters
+        """
+        return self._dynamic
+
+    @property
+    def depth(self):
+        """
+        Get the number of open scopes.
+
+        Returns:
+            int
+        """
+        return len(self._scopes)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Get a value of a variable.
+
+        Args:
+            name (str): variable name in any case
+            default (Any): returned for a missing variable
+
+        Returns:
+            stored value or default
+        """
+        found = self._values.get(fold(name))
+        if found is None:
+            return default
+        return found[1]
+
+    def get_dynamic(self, name: str) -> Any:
+        """
+        Compute a value of a dynamic variable.
+
+        Args:
+            name (str): variable name in any case
+
+        Returns:
+            the value or None if it's not a dynamic variable
+        """
+        getter = self._dynamic.get(fold(name))
+        if getter is None:
+            return None
+        return getter()
+
+    def set(self, name: str, value: Any) -> None:  # noqa: WPS110
+        """
+        Create or change a variable, an existing name keeps its case.
+
+        Args:
+            name (str): variable name in any case
+            value (Any): value to store
+        """
+        key = fold(name)
+        found = self._values.get(key)
+        if self._scopes:
+            # only the value from before the scope is restored
+            self._scopes[-1].setdefault(key, found)
+        if found is None:
+            insort(self._sorted, key)
+        else:
+            name = found[0]
+        self._values[key] = (name, value)
+        self._version += 1
+
+    def push(self) -> None:
+        """Open a scope, the changes from now on can be reverted."""
+        self._scopes.append({})
+
+    def pop(self) -> bool:
+        """
+        Close the innermost scope and revert the changes made in it.
+
+        Returns:
+            False if there was no scope open
+        """
+        if not self._scopes:
+            return False
+        changes = self._scopes.pop()
+        values = self._values  # noqa: WPS110
+        sorted_keys = self._sorted
+        for key, old in changes.items():
+            if old is None:
+                # created in the scope
+                del values[key]  # noqa: WPS420
+                del sorted_keys[bisect_left(sorted_keys, key)]  # noqa: WPS420
+            else:
+                values[key] = old
+        if changes:
+            self._version += 1
+        return True
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the variables sorted by the names without the case.
+
+        Yields:
+            (name, value) pairs
+        """
+        values = self._values  # noqa: WPS110
+        for key in self._sorted:
+            yield values[key]
+
+    def prefixed(self, prefix: str) -> List[Tuple[str, Any]]:
+        """
+        Find the variables starting with a prefix.
+
+        Args:
+            prefix (str): start of the names in any case
+
+        Returns:
+            list of (name, value) pairs sorted by the names
+        """
+        key = fold(prefix)
+        sorted_keys = self._sorted
+        values = self._values  # noqa: WPS110
+        found = []
+        for idx in range(bisect_left(sorted_keys, key), len(sorted_keys)):
+            name = sorted_keys[idx]
+            if not name.startswith(key):
+                break
+            found.append(values[name])
+        return found
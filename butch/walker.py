@@ -0,0 +1,143 @@
+"""
+Module for reading folder trees with a pool of threads.
+
+Reading a folder is mostly waiting for the file system, especially on
+a network drive, so the folders listed next are read by the threads
+while the current one is being processed. Only a few folders are read
+ahead in the depth-first order, the tree is never held in memory.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import DirEntry, environ, scandir, stat_result
+from typing import (
+    Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+)
+
+WORKERS_ENV = "BUTCH_WALK_WORKERS"
+WORKERS = 8
+# folders read ahead per thread
+READ_AHEAD = 2
+
+Sorter = Callable[[List[DirEntry]], None]
+
+
+def get_workers() -> int:
+    """
+    Get the number of the threads reading the folders.
+
+    Returns:
+        BUTCH_WALK_WORKERS or the default
+    """
+    return int(environ.get(WORKERS_ENV, 0) or WORKERS)
+
+
+def entry_stat(entry: DirEntry) -> Optional[stat_result]:
+    """
+    Get the stat of a folder item, cached by the DirEntry.
+
+    Args:
+        entry (DirEntry): item from scandir()
+
+    Returns:
+        stat_result of the target or of the link itself if it's broken,
+        None if the item is gone
+    """
+    try:
+        return entry.stat()
+    except OSError:
+        pass  # noqa: WPS420
+    try:
+        return entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+
+
+def iter_folder(folder: str) -> Iterator[DirEntry]:
+    """
+    Iterate over the items of a folder while reading it.
+
+    Args:
+        folder (str): path to the folder
+
+    Yields:
+        DirEntry instances, nothing for a folder which can't be read
+    """
+    try:
+        found = scandir(folder)
+    except OSError:
+        return
+    with found:
+        yield from found
+
+
+def read_folder(
+        folder: str, with_stat: bool = False, sort: Sorter = None
+) -> List[DirEntry]:
+    """
+    Read all the items of a folder.
+
+    Args:
+        folder (str): path to the folder
+        with_stat (bool): stat the items too, e.g. in a thread
+        sort (Sorter): function sorting the list in place
+
+    Returns:
+        list of DirEntry instances
+    """
+    found = list(iter_folder(folder))
+    if with_stat:
+        for entry in found:
+            entry_stat(entry)
+    if sort:
+        sort(found)
+    return found
+
+
+def walk(
+        root: str, recursive: bool = False, with_stat: bool = False,
+        sort: Sorter = None, workers: int = 0
+) -> Iterator[Tuple[str, Iterable[DirEntry]]]:
+    """
+    Walk a folder tree from the top, subfolders after their folder.
+
+    Without recursion and sorting, the items are streamed right from
+    scandir(). The links to folders aren't followed.
+
+    Args:
+        root (str): path to the top folder
+        recursive (bool): walk the subfolders too
+        with_stat (bool): stat the items while reading ahead
+        sort (Sorter): function sorting the items of a folder in place,
+            the subfolders are walked in the same order
+        workers (int): number of threads, get_workers() if 0
+
+    Yields:
+        (path, items) pairs per folder
+    """
+    if not recursive:
+        if sort is None:
+            yield root, iter_folder(root)
+        else:
+            yield root, read_folder(folder=root, sort=sort)
+        return
+
+    workers = workers or get_workers()
+    ahead = workers * READ_AHEAD
+    stack = [root]
+    pending: Dict[str, Future] = {}
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="butch-walk"
+    ) as pool:
+        while stack:
+            for folder in stack[-ahead:]:
+                if folder not in pending:
+                    pending[folder] = pool.submit(
+                        read_folder, folder, with_stat, sort
+                    )
+            folder = stack.pop()
+            entries = pending.pop(folder).result()
+            yield folder, entries
+            stack.extend(
+                entry.path for entry in reversed(entries)
+                if entry.is_dir(follow_symlinks=False)
+            )
@@ -0,0 +1,93 @@
+"""
+Module for matching file names with the wildcards of cmd.
+
+"*" matches any chars and "?" a single char, both case-insensitively.
+As in cmd, "*.*" matches the names without an extension too, "name.*"
+matches "name" and "*." only the names without an extension.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable
+
+WILDCARDS = frozenset("*?")
+MATCH_ALL = frozenset(("*", "*.*"))
+
+Matcher = Callable[[str], Any]
+
+
+def has_wildcards(pattern: str) -> bool:
+    """
+    Check a path or a name contains a wildcard.
+
+    Args:
+        pattern (str): path or name
+
+    Returns:
+        bool
+    """
+    return not WILDCARDS.isdisjoint(pattern)
+
+
+def _match_any(name: str) -> bool:
+    """
+    Match any name.
+
+    Args:
+        name (str): file name
+
+    Returns:
+        True
+    """
+    return True
+
+
+def _translate(pattern: str, char_regex: str = ".") -> str:
+    """
+    Translate wildcards into a regular expression.
+
+    Args:
+        pattern (str): name with wildcards
+        char_regex (str): regular expression for a char of a wildcard
+
+    Returns:
+        str with the regular expression
+    """
+    parts = []
+    for char in pattern:
+        if char == "*":
+            parts.append(f"{char_regex}*")
+        elif char == "?":
+            parts.append(char_regex)
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def compile_pattern(pattern: str) -> Matcher:
+    """
+    Compile a name with wildcards into a matching function.
+
+    The function is compiled once per pattern and the common patterns
+    don't use a regular expression at all.
+
+    Args:
+        pattern (str): name with or without wildcards, e.g. "*.tmp"
+
+    Returns:
+        function returning a truthy value for a matching name
+    """
+    if pattern in MATCH_ALL:
+        return _match_any
+    if not has_wildcards(pattern):
+        expected = pattern.lower()
+        return lambda name: name.lower() == expected  # noqa: E731
+
+    if pattern.endswith(".*"):
+        regex = _translate(pattern[:-2]) + r"(?:\..*)?"
+    elif pattern.endswith("."):
+        regex = _translate(pattern[:-1], char_regex="[^.]")
+    else:
+        regex = _translate(pattern)
+    return re.compile(regex, re.IGNORECASE | re.DOTALL).fullmatch
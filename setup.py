@@ -73,7 +73,7 @@ KWARGS = dict(  # noqa: C408
     python_requires=">=3.6",
     packages=find_packages(),
     package_data={
-        "": ["*.txt", "*.bat", "*.out"]
+        "": ["*.txt", "*.bat", "*.out", "*.dat"]
     },
     include_package_data=True,
     exclude_package_data={